@@ -1,23 +1,63 @@
 from __future__ import annotations
 
+import asyncio
+import bz2
+import contextlib
 import csv
+import gzip
 import hashlib
 import io
 import json
+import mmap
+import os
+import queue
 import re
+import threading
 import time
 import unicodedata
-from collections.abc import Iterable
-from datetime import UTC, datetime
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from functools import partial
+from itertools import pairwise
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
 import httpx
-from sqlalchemy import create_engine, text
+from sqlalchemy import (
+    Engine,
+    and_,
+    bindparam,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    true,
+)
+from sqlalchemy.sql import ColumnElement, Select
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from ingest_relay.schemas import SourceConfig
-from ingest_relay.utils.http_clients import create_httpx_client
+from ingest_relay.adapters.json_items import JsonItemsParser
+from ingest_relay.adapters.lazy_text import LazyText
+from ingest_relay.adapters.oauth_tokens import (
+    CachedToken,
+    OAuthTokenCache,
+    get_oauth_token_cache,
+    oauth_token_cache_key,
+)
+from ingest_relay.adapters.rate_limits import HostRateLimiter, host_rate_limiter, wait_retry_after
+from ingest_relay.adapters.remote_files import RemoteObject, is_remote_path, open_remote_store
+from ingest_relay.adapters.row_batches import ColumnBatch
+from ingest_relay.adapters.sql_engines import get_sql_engine
+from ingest_relay.schemas import CsvConfig, ObjectStoreConfig, SourceConfig
+from ingest_relay.utils.http_clients import create_httpx_client, get_async_client_pool
+from ingest_relay.utils.process_pools import discard_process_pool, get_process_pool
 from ingest_relay.utils.secrets import resolve_secret
 
 
@@ -25,10 +65,116 @@ class ExtractionError(RuntimeError):
     pass
 
 
+RowChunk = list[dict[str, Any]] | ColumnBatch
+# A matched file_pull input: a local file, or an object in a gs:// or s3:// bucket.
+SourceFile = Path | RemoteObject
+
+
+class RowStream:
+    """Single-pass lazy row source fed by fixed-size chunks.
+
+    Chunks are either lists of row dicts or column batches. The watermark is
+    folded in chunk by chunk while the stream is consumed, so it is only
+    available once every chunk has been read.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[RowChunk],
+        watermark_field: str | None,
+        fallback_watermark: str | None,
+        finalize: Callable[[str | None], str | None] | None = None,
+    ) -> None:
+        self._chunks = chunks
+        self._watermark_field = watermark_field
+        self._fallback_watermark = fallback_watermark
+        self._finalize = finalize
+        self._max_watermark: str | None = None
+        self._projection: frozenset[str] | None = None
+        self._started = False
+        self.exhausted = False
+        self.row_count = 0
+
+    def project(self, fields: Iterable[str]) -> RowStream:
+        """Restrict records built from column batches to ``fields``."""
+        self._projection = frozenset(fields)
+        return self
+
+    @property
+    def projection(self) -> frozenset[str] | None:
+        return self._projection
+
+    def iter_chunks(self) -> Iterator[RowChunk]:
+        if self._started:
+            raise ExtractionError("Row stream can only be consumed once.")
+        self._started = True
+        for chunk in self._chunks:
+            chunk_max = _chunk_max_watermark(chunk, self._watermark_field)
+            if chunk_max is not None and (
+                self._max_watermark is None or chunk_max > self._max_watermark
+            ):
+                self._max_watermark = chunk_max
+            self.row_count += len(chunk)
+            yield chunk
+        self.exhausted = True
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for chunk in self.iter_chunks():
+            if isinstance(chunk, ColumnBatch):
+                if self._projection is not None:
+                    chunk = chunk.select(self._projection)
+                yield from chunk.iter_records()
+            else:
+                yield from chunk
+
+    @property
+    def watermark(self) -> str | None:
+        if not self.exhausted:
+            raise ExtractionError("Row stream watermark is not final until all rows are consumed.")
+        if not self._watermark_field or self._max_watermark is None:
+            row_watermark = self._fallback_watermark
+        else:
+            row_watermark = self._max_watermark
+        return self._finalize(row_watermark) if self._finalize else row_watermark
+
+
+class KeysetResumeStore(Protocol):
+    def load(self) -> Any: ...
+
+    def commit_page(self, page_index: int, last_key: Any) -> None: ...
+
+
+@dataclass
+class FileManifestEntry:
+    """One matched file of a ``file_pull`` run and the documents it produced."""
+
+    path: str
+    mtime: str
+    size_bytes: int
+    content_hash: str
+    row_count: int = 0
+    row_watermark: str | None = None
+    doc_ids: list[str] = field(default_factory=list)
+    carried_forward: bool = False
+
+
 class PullResult:
-    def __init__(self, rows: list[dict[str, Any]], watermark: str | None):
+    def __init__(
+        self,
+        rows: list[dict[str, Any]] | RowStream,
+        watermark: str | None = None,
+        file_entries: list[FileManifestEntry] | None = None,
+    ):
         self.rows = rows
-        self.watermark = watermark
+        self._watermark = watermark
+        # Per-file manifest in extraction order; only set for skipUnchangedFiles.
+        self.file_entries = file_entries
+
+    @property
+    def watermark(self) -> str | None:
+        if isinstance(self.rows, RowStream):
+            return self.rows.watermark
+        return self._watermark
 
 
 def _as_iso(value: Any) -> str:
@@ -57,7 +203,41 @@ def _max_watermark(
     return max(values)
 
 
-def extract_sql_rows(source: SourceConfig, current_watermark: str | None) -> PullResult:
+def _latest_watermark(*values: str | None) -> str | None:
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def _chunk_max_watermark(chunk: RowChunk, watermark_field: str | None) -> str | None:
+    if not isinstance(chunk, ColumnBatch):
+        return _max_watermark(chunk, watermark_field, None)
+    if not watermark_field or not chunk.has_column(watermark_field):
+        return None
+    values = [_as_iso(value) for value in chunk.column(watermark_field) if value is not None]
+    return max(values) if values else None
+
+
+def _is_columnar(source: SourceConfig) -> bool:
+    return bool(source.sql and source.sql.columnar)
+
+
+def _chunk_last_value(chunk: RowChunk, column_name: str) -> Any:
+    if isinstance(chunk, ColumnBatch):
+        return chunk.column(column_name)[-1] if chunk.has_column(column_name) else None
+    return chunk[-1].get(column_name)
+
+
+def _sql_chunk(keys: Iterable[str], rows: Iterable[Any], columnar: bool) -> RowChunk:
+    if columnar:
+        return ColumnBatch.from_rows(list(keys), list(rows))
+    return [dict(row._mapping) for row in rows]
+
+
+def extract_sql_rows(
+    source: SourceConfig,
+    current_watermark: str | None,
+    resume_store: KeysetResumeStore | None = None,
+) -> PullResult:
     if not source.query:
         raise ExtractionError("source.query is required for sql_pull mode")
     if not source.secret_ref:
@@ -65,22 +245,279 @@ def extract_sql_rows(source: SourceConfig, current_watermark: str | None) -> Pul
 
     dsn = resolve_secret(source.secret_ref)
     try:
-        engine = create_engine(dsn, future=True)
+        engine = get_sql_engine(dsn)
     except Exception as exc:  # noqa: BLE001
         raise ExtractionError(f"Invalid DSN for SQL source type '{source.type}': {exc}") from exc
     params = {"watermark": current_watermark}
 
+    if source.sql and source.sql.keyset_column:
+        chunks = _keyset_sql_chunks(
+            engine,
+            source,
+            params,
+            keyset_column=source.sql.keyset_column,
+            page_size=source.sql.page_size,
+            resume_store=resume_store,
+        )
+        return PullResult(rows=RowStream(chunks, source.watermark_field, current_watermark))
+
+    if source.sql and source.sql.partition_column:
+        chunks = _partitioned_sql_chunks(
+            engine,
+            source,
+            params,
+            partition_column=source.sql.partition_column,
+            partition_count=source.sql.partition_count,
+        )
+        return PullResult(rows=RowStream(chunks, source.watermark_field, current_watermark))
+
+    if source.sql and source.sql.stream_results:
+        chunks = _stream_sql_chunks(engine, source, params, source.sql.fetch_size)
+        return PullResult(rows=RowStream(chunks, source.watermark_field, current_watermark))
+
     try:
         with engine.connect() as conn:
             result = conn.execute(text(source.query), params)
-            rows = [dict(row._mapping) for row in result]
+            chunk = _sql_chunk(result.keys(), result, _is_columnar(source))
     except Exception as exc:  # noqa: BLE001
         raise ExtractionError(
             f"SQL extraction failed for source type '{source.type}': {exc}"
         ) from exc
 
-    watermark = _max_watermark(rows, source.watermark_field, current_watermark)
-    return PullResult(rows=rows, watermark=watermark)
+    if isinstance(chunk, ColumnBatch):
+        return PullResult(rows=RowStream(iter([chunk]), source.watermark_field, current_watermark))
+
+    watermark = _max_watermark(chunk, source.watermark_field, current_watermark)
+    return PullResult(rows=chunk, watermark=watermark)
+
+
+def _stream_sql_chunks(
+    engine: Engine,
+    source: SourceConfig,
+    params: dict[str, Any],
+    fetch_size: int,
+) -> Iterator[RowChunk]:
+    columnar = _is_columnar(source)
+    try:
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=fetch_size).execute(
+                text(source.query), params
+            )
+            keys = list(result.keys())
+            for partition in result.partitions(fetch_size):
+                yield _sql_chunk(keys, partition, columnar)
+    except Exception as exc:  # noqa: BLE001
+        raise ExtractionError(
+            f"SQL extraction failed for source type '{source.type}': {exc}"
+        ) from exc
+
+
+def _keyset_page_statement(
+    query: str,
+    keyset_column: str,
+    page_size: int,
+    *,
+    after: bool,
+) -> Select:
+    keyset_source = text(query).columns(column(keyset_column)).subquery("keyset_source")
+    keyset = keyset_source.c[keyset_column]
+    statement = select(literal_column("*")).select_from(keyset_source)
+    if after:
+        # Starts at the previous page's last row, so a key tied across pages is seen.
+        statement = statement.where(keyset >= bindparam("keyset_after"))
+        page_size += 1
+    return statement.order_by(keyset).limit(page_size)
+
+
+def _keyset_page_rows(
+    rows: list[Any], keyset_column: str, last_key: Any, page_size: int, *, after: bool
+) -> list[Any]:
+    """Drop the re-read boundary row of a page and reject repeated keyset values."""
+    keys = [row._mapping.get(keyset_column) for row in rows]
+    start = 0
+    if after:
+        while start < len(keys) and keys[start] == last_key:
+            start += 1
+    page_keys = keys[start : start + page_size]
+    tied = [last_key] if start > 1 else [key for key, nxt in pairwise(page_keys) if key == nxt]
+    if tied:
+        raise ExtractionError(
+            f"source.sql.keysetColumn '{keyset_column}' must be unique, but {tied[0]!r} "
+            "appears in more than one row"
+        )
+    return rows[start : start + page_size]
+
+
+def _keyset_sql_chunks(
+    engine: Engine,
+    source: SourceConfig,
+    params: dict[str, Any],
+    *,
+    keyset_column: str,
+    page_size: int,
+    resume_store: KeysetResumeStore | None,
+) -> Iterator[RowChunk]:
+    columnar = _is_columnar(source)
+    page_index = 0
+    last_key: Any = None
+
+    resume_state = resume_store.load() if resume_store else None
+    if resume_state:
+        # Rows up to the resume point are not read again; the pipeline accounts for them.
+        page_index = resume_state.pages_committed
+        last_key = resume_state.last_key
+
+    first_page = _keyset_page_statement(source.query, keyset_column, page_size, after=False)
+    next_page = _keyset_page_statement(source.query, keyset_column, page_size, after=True)
+
+    while True:
+        try:
+            with engine.connect() as conn:
+                if page_index == 0:
+                    result = conn.execute(first_page, params)
+                else:
+                    result = conn.execute(next_page, {**params, "keyset_after": last_key})
+                keys = list(result.keys())
+                rows = result.fetchall()
+        except Exception as exc:  # noqa: BLE001
+            raise ExtractionError(
+                f"SQL extraction failed for source type '{source.type}': {exc}"
+            ) from exc
+
+        rows = _keyset_page_rows(rows, keyset_column, last_key, page_size, after=page_index > 0)
+        page = _sql_chunk(keys, rows, columnar)
+        if not page:
+            return
+        last_key = _chunk_last_value(page, keyset_column)
+        if last_key is None:
+            raise ExtractionError(
+                f"source.sql.keysetColumn '{keyset_column}' must be a non-null column "
+                "returned by source.query"
+            )
+
+        if resume_store:
+            try:
+                resume_store.commit_page(page_index, last_key)
+            except TypeError as exc:
+                raise ExtractionError(
+                    f"source.sql.keysetColumn '{keyset_column}' cannot be resumed: {exc}"
+                ) from exc
+        page_index += 1
+        yield page
+
+        if len(page) < page_size:
+            return
+
+
+def _partition_boundaries(lower: Any, upper: Any, partition_count: int) -> list[Any]:
+    """Split ``[lower, upper]`` into ascending inner boundaries for range partitions."""
+    if isinstance(lower, bool) or isinstance(upper, bool):
+        raise ExtractionError("source.sql.partitionColumn must be a numeric or date/time column")
+    if isinstance(lower, int) and isinstance(upper, int):
+        span = upper - lower
+        raw = [lower + (span * idx) // partition_count for idx in range(1, partition_count)]
+    elif isinstance(lower, (int, float, Decimal)) and isinstance(upper, (int, float, Decimal)):
+        if isinstance(lower, Decimal) or isinstance(upper, Decimal):
+            lower, upper = Decimal(lower), Decimal(upper)
+        span = upper - lower
+        raw = [lower + span * idx / partition_count for idx in range(1, partition_count)]
+    elif isinstance(lower, datetime) and isinstance(upper, datetime):
+        span = upper - lower
+        raw = [lower + span * idx / partition_count for idx in range(1, partition_count)]
+    elif isinstance(lower, date) and isinstance(upper, date):
+        span = upper - lower
+        raw = [lower + (span * idx) // partition_count for idx in range(1, partition_count)]
+    else:
+        raise ExtractionError("source.sql.partitionColumn must be a numeric or date/time column")
+
+    boundaries: list[Any] = []
+    for boundary in raw:
+        if lower < boundary <= upper and (not boundaries or boundary > boundaries[-1]):
+            boundaries.append(boundary)
+    return boundaries
+
+
+def _partition_predicates(
+    partition_key: ColumnElement[Any],
+    boundaries: list[Any],
+) -> list[ColumnElement[bool]]:
+    if not boundaries:
+        return [true()]
+
+    predicates: list[ColumnElement[bool]] = [
+        or_(partition_key.is_(None), partition_key < bindparam("partition_upper_0", boundaries[0]))
+    ]
+    for idx in range(1, len(boundaries)):
+        predicates.append(
+            and_(
+                partition_key >= bindparam(f"partition_lower_{idx}", boundaries[idx - 1]),
+                partition_key < bindparam(f"partition_upper_{idx}", boundaries[idx]),
+            )
+        )
+    predicates.append(
+        partition_key >= bindparam(f"partition_lower_{len(boundaries)}", boundaries[-1])
+    )
+    return predicates
+
+
+def _partitioned_sql_chunks(
+    engine: Engine,
+    source: SourceConfig,
+    params: dict[str, Any],
+    *,
+    partition_column: str,
+    partition_count: int,
+) -> Iterator[RowChunk]:
+    partition_source = (
+        text(source.query).columns(column(partition_column)).subquery("partition_source")
+    )
+    partition_key = partition_source.c[partition_column]
+
+    columnar = _is_columnar(source)
+
+    def _fetch(statement: Select) -> RowChunk:
+        try:
+            with engine.connect() as conn:
+                result = conn.execute(statement, params)
+                return _sql_chunk(result.keys(), result, columnar)
+        except Exception as exc:  # noqa: BLE001
+            raise ExtractionError(
+                f"SQL extraction failed for source type '{source.type}': {exc}"
+            ) from exc
+
+    try:
+        with engine.connect() as conn:
+            lower, upper = conn.execute(
+                select(func.min(partition_key), func.max(partition_key)).select_from(
+                    partition_source
+                ),
+                params,
+            ).one()
+    except Exception as exc:  # noqa: BLE001
+        raise ExtractionError(
+            f"SQL extraction failed for source type '{source.type}': {exc}"
+        ) from exc
+
+    boundaries = (
+        _partition_boundaries(lower, upper, partition_count)
+        if lower is not None and upper is not None
+        else []
+    )
+    statements = [
+        select(literal_column("*")).select_from(partition_source).where(predicate)
+        for predicate in _partition_predicates(partition_key, boundaries)
+    ]
+
+    with ThreadPoolExecutor(
+        max_workers=len(statements), thread_name_prefix="sql-partition"
+    ) as executor:
+        futures = [executor.submit(_fetch, statement) for statement in statements]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
 
 
 def _extract_row_watermark_from_checkpoint(current_watermark: str | None) -> str | None:
@@ -104,6 +541,10 @@ def _file_manifest_hash(entries: list[dict[str, Any]]) -> str:
     return f"sha256:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()}"
 
 
+def _file_content_hash(content: str) -> str:
+    return f"sha256:{hashlib.sha256(content.encode('utf-8')).hexdigest()}"
+
+
 def _build_file_checkpoint(
     row_watermark: str | None,
     file_count: int,
@@ -117,13 +558,9 @@ def _build_file_checkpoint(
         "lm": latest_file_mtime,
         "fh": file_manifest_hash,
     }
-    encoded = json.dumps(payload, separators=(",", ":"), ensure_ascii=True)
-    if len(encoded) > 255:
-        raise ExtractionError(
-            "file_pull checkpoint exceeded 255 characters. "
-            "Use shorter file path roots or fewer nested segments."
-        )
-    return encoded
+    # Checkpoints longer than the checkpoint column are stored by reference,
+    # see services.checkpoint_store.
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=True)
 
 
 def _resolve_source_path(path_value: str) -> Path:
@@ -133,6 +570,146 @@ def _resolve_source_path(path_value: str) -> Path:
     return source_path
 
 
+def _glob_segment_regex(segment: str) -> str:
+    parts: list[str] = []
+    index = 0
+    while index < len(segment):
+        char = segment[index]
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and (end := segment.find("]", index + 2)) != -1:
+            body = segment[index + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append("[" + body.replace("\\", "\\\\") + "]")
+            index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+def _compile_path_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a glob over ``/``-separated paths relative to ``source.path``.
+
+    ``*``, ``?`` and ``[...]`` stay within one path segment; a ``**`` segment
+    matches any number of directories, including none.
+    """
+    segments = pattern.strip("/").split("/")
+    parts: list[str] = []
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:[^/]+/)*")
+        else:
+            parts.append(_glob_segment_regex(segment) + ("" if last else "/"))
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile("".join(parts), flags)
+
+
+def _file_shard(relative_path: str, shard_count: int) -> int:
+    # Stable across processes and platforms, unlike hash().
+    digest = hashlib.blake2b(relative_path.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+def _file_matcher(source: SourceConfig) -> Callable[[str], bool]:
+    """Match a relative file path against ``glob``, include/exclude patterns and the shard."""
+    pattern = _compile_path_pattern(source.glob or "")
+    includes = [_compile_path_pattern(item) for item in source.include_patterns]
+    excludes = [_compile_path_pattern(item) for item in source.exclude_patterns]
+
+    def matches(relative_path: str) -> bool:
+        if not pattern.fullmatch(relative_path):
+            return False
+        if includes and not any(item.fullmatch(relative_path) for item in includes):
+            return False
+        if any(exclude.fullmatch(relative_path) for exclude in excludes):
+            return False
+        return (
+            source.shard_count <= 1
+            or _file_shard(relative_path, source.shard_count) == source.shard_index
+        )
+
+    return matches
+
+
+def _discover_files(root: Path, source: SourceConfig) -> list[tuple[Path, os.stat_result]]:
+    """List matched files under ``root`` in one ``os.scandir`` pass, sorted by path.
+
+    Directories are only entered as deep as ``glob`` can match (unbounded
+    with a ``**`` segment) and not at all when they match an exclude
+    pattern. File type checks use the cached directory entry, so each
+    matched file costs one ``stat`` call and others none. Symlinked
+    directories are followed like ``Path.glob`` does; under a ``**``
+    segment each directory is walked once, so symlink cycles terminate.
+    """
+    glob_pattern = source.glob or ""
+    matches = _file_matcher(source)
+    excludes = [_compile_path_pattern(item) for item in source.exclude_patterns]
+    segments = glob_pattern.strip("/").split("/")
+    max_depth = None if "**" in segments else len(segments) - 1
+    # Bounded walks cannot loop; unbounded ones track (st_dev, st_ino) per directory.
+    visited: set[tuple[int, int]] | None = None
+    if max_depth is None:
+        try:
+            root_stat = root.stat()
+        except OSError as exc:
+            raise ExtractionError(f"Unable to list directory '{root}': {exc}") from exc
+        visited = {(root_stat.st_dev, root_stat.st_ino)}
+
+    found: list[tuple[Path, os.stat_result]] = []
+    pending: list[tuple[str, str, int]] = [(str(root), "", 0)]
+    while pending:
+        directory, prefix, depth = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative_path = prefix + entry.name
+                    if entry.is_dir():
+                        if (max_depth is None or depth < max_depth) and not any(
+                            exclude.fullmatch(relative_path) for exclude in excludes
+                        ):
+                            if visited is not None:
+                                entry_stat = entry.stat()
+                                key = (entry_stat.st_dev, entry_stat.st_ino)
+                                if key in visited:
+                                    continue
+                                visited.add(key)
+                            pending.append((entry.path, relative_path + "/", depth + 1))
+                        continue
+                    if entry.is_file() and matches(relative_path):
+                        found.append((Path(entry.path), entry.stat()))
+        except OSError as exc:
+            raise ExtractionError(f"Unable to list directory '{directory}': {exc}") from exc
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def _discover_remote_files(source: SourceConfig) -> list[RemoteObject]:
+    """List matched objects under a ``gs://`` or ``s3://`` ``source.path``, sorted by key.
+
+    Keys are matched relative to the path prefix, with the same patterns
+    and shards as local files.
+    """
+    secret = resolve_secret(source.secret_ref) if source.secret_ref else None
+    try:
+        store, prefix = open_remote_store(
+            source.path, source.object_store or ObjectStoreConfig(), secret
+        )
+    except ValueError as exc:
+        raise ExtractionError(str(exc)) from exc
+    matches = _file_matcher(source)
+    try:
+        found = [obj for obj in store.list_objects(prefix) if matches(obj.key[len(prefix) :])]
+    except OSError as exc:
+        raise ExtractionError(f"Unable to list objects under '{source.path}': {exc}") from exc
+    found.sort(key=lambda obj: obj.key)
+    return found
+
+
 def _normalize_header(name: str) -> str:
     """Normalize a CSV header to a safe snake_case identifier.
 
@@ -148,11 +725,89 @@ def _normalize_header(name: str) -> str:
 _ERROR_PATTERN = re.compile(r"^#ERROR\b")
 
 
-def _clean_cell_value(value: str) -> str:
-    """Replace ``#ERROR …`` export artifacts with an empty string."""
-    if _ERROR_PATTERN.match(value):
-        return ""
-    return value
+def _clean_cell_values(values: list[Any]) -> list[Any]:
+    """Replace ``#ERROR …`` export artifacts in a row or column with empty strings.
+
+    ``None`` padding passes through. The ``startswith`` pre-check keeps the
+    regex off the vast majority of cells, which cannot be artifacts.
+    """
+    return [
+        "" if value and value.startswith("#ERROR") and _ERROR_PATTERN.match(value) else value
+        for value in values
+    ]
+
+
+def _has_error_artifact(values: list[str]) -> bool:
+    # One substring scan per row; almost every row is then passed through as-is.
+    return "#ERROR" in "\x1f".join(values)
+
+
+@dataclass(frozen=True, slots=True)
+class _CsvRowPlan:
+    """Header resolved once per file, so each row is a single ``zip`` into a dict.
+
+    Rows match ``csv.DictReader``: blank lines are skipped, short rows are
+    padded with ``None`` and extra values are collected under the ``None`` key.
+    Extra values are never cleaned.
+    """
+
+    columns: tuple[str, ...]
+    clean_errors: bool
+
+    @classmethod
+    def for_header(
+        cls, header: list[str], *, normalize_headers: bool, clean_errors: bool
+    ) -> _CsvRowPlan:
+        if normalize_headers:
+            header = [_normalize_header(name) for name in header]
+        return cls(tuple(header), clean_errors)
+
+    def rows(self, records: Iterable[list[str]]) -> Iterator[dict[str, Any]]:
+        columns = self.columns
+        width = len(columns)
+        clean_errors = self.clean_errors
+        for values in records:
+            if not values:
+                continue
+            extra = None
+            if len(values) > width:
+                values, extra = values[:width], values[width:]
+            if clean_errors and _has_error_artifact(values):
+                values = _clean_cell_values(values)
+            row = dict(zip(columns, values, strict=False))
+            if len(values) < width:
+                row.update(dict.fromkeys(columns[len(values) :]))
+            elif extra is not None:
+                row[None] = extra
+            yield row
+
+
+def _iter_csv_rows(
+    handle: Iterable[str],
+    *,
+    has_header: bool,
+    delimiter: str,
+    normalize_headers: bool = False,
+    clean_errors: bool = False,
+) -> Iterator[dict[str, Any]]:
+    reader = csv.reader(handle, delimiter=delimiter)
+    if has_header:
+        header = next(reader, None)
+        if header is None:
+            return
+        plan = _CsvRowPlan.for_header(
+            header, normalize_headers=normalize_headers, clean_errors=clean_errors
+        )
+        yield from plan.rows(reader)
+        return
+
+    names: list[str] = []
+    for values in reader:
+        if len(values) > len(names):
+            names.extend(f"column_{idx + 1}" for idx in range(len(names), len(values)))
+        if clean_errors and _has_error_artifact(values):
+            values = _clean_cell_values(values)
+        yield dict(zip(names, values, strict=False))
 
 
 def _csv_rows_from_content(
@@ -163,41 +818,42 @@ def _csv_rows_from_content(
     normalize_headers: bool = False,
     clean_errors: bool = False,
 ) -> list[dict[str, Any]]:
-    if has_header:
-        reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
-        if normalize_headers:
-            header_map: dict[str, str] | None = None
-            rows: list[dict[str, Any]] = []
-            for raw_row in reader:
-                if header_map is None:
-                    header_map = {k: _normalize_header(k) for k in raw_row}
-                row = {header_map[k]: v for k, v in raw_row.items()}
-                if clean_errors:
-                    row = {
-                        k: _clean_cell_value(v) if isinstance(v, str) else v for k, v in row.items()
-                    }
-                rows.append(row)
-            return rows
-        if clean_errors:
-            return [
-                {k: _clean_cell_value(v) if isinstance(v, str) else v for k, v in dict(row).items()}
-                for row in reader
-            ]
-        return [dict(row) for row in reader]
+    return list(
+        _iter_csv_rows(
+            io.StringIO(content),
+            has_header=has_header,
+            delimiter=delimiter,
+            normalize_headers=normalize_headers,
+            clean_errors=clean_errors,
+        )
+    )
+
+
+def _csv_batch_from_content(
+    *,
+    content: str,
+    has_header: bool,
+    delimiter: str,
+    normalize_headers: bool = False,
+    clean_errors: bool = False,
+) -> ColumnBatch:
+    """Columnar counterpart of ``_csv_rows_from_content`` for ``csv.columnar``.
 
-    reader_raw = csv.reader(io.StringIO(content), delimiter=delimiter)
-    rows_out: list[dict[str, Any]] = []
-    for row in reader_raw:
-        mapped = {f"column_{idx + 1}": value for idx, value in enumerate(row)}
-        if clean_errors:
-            mapped = {
-                k: _clean_cell_value(v) if isinstance(v, str) else v for k, v in mapped.items()
-            }
-        rows_out.append(mapped)
-    return rows_out
+    Built from the same per-row plan, so ragged rows keep exactly the keys
+    the row parser gives them.
+    """
+    return ColumnBatch.from_records(
+        _iter_csv_rows(
+            io.StringIO(content),
+            has_header=has_header,
+            delimiter=delimiter,
+            normalize_headers=normalize_headers,
+            clean_errors=clean_errors,
+        )
+    )
 
 
-def _base_file_fields(path: Path, mtime: str, size_bytes: int) -> dict[str, Any]:
+def _base_file_fields(path: SourceFile, mtime: str, size_bytes: int) -> dict[str, Any]:
     return {
         "file_path": str(path),
         "file_name": path.name,
@@ -206,82 +862,648 @@ def _base_file_fields(path: Path, mtime: str, size_bytes: int) -> dict[str, Any]
     }
 
 
-def extract_file_rows(source: SourceConfig, current_watermark: str | None) -> PullResult:
-    if source.format != "csv":
-        raise ExtractionError("source.format must be csv for file_pull mode")
+class MappedFileText(LazyText):
+    """``file_content_raw`` of ``csv.lazyContent``: the file is memory-mapped on read.
+
+    Decoding straight from the mapping skips the intermediate bytes copy,
+    and newlines are translated like ``Path.read_text`` so templates see
+    the same text as in the eager mode. Compressed files and bucket objects
+    are streamed instead.
+    """
+
+    __slots__ = ("path", "encoding")
+
+    def __init__(self, path: SourceFile, encoding: str) -> None:
+        self.path = path
+        self.encoding = encoding
+
+    def materialize(self) -> str:
+        try:
+            if isinstance(self.path, RemoteObject) or _file_compression(self.path) is not None:
+                # Compressed files and objects cannot be mapped; stream them instead.
+                return _read_csv_text(self.path, self.encoding)
+            with self.path.open("rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    return ""
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    text = str(mapped, self.encoding)
+        except _FILE_READ_ERRORS as exc:
+            raise ExtractionError(f"Unable to read CSV file '{self.path}': {exc}") from exc
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def digest(self) -> str:
+        # The raw bytes and the encoding determine the text.
+        return f"{self.encoding}:{_file_bytes_hash(self.path)}"
+
+
+class CsvRowsJson(LazyText):
+    """``file_rows_json`` of ``csv.lazyContent``, parsed from the file when read."""
+
+    __slots__ = ("content", "csv_config")
+
+    def __init__(self, content: MappedFileText, csv_config: CsvConfig) -> None:
+        self.content = content
+        self.csv_config = csv_config
+
+    def materialize(self) -> str:
+        parsed_rows = _csv_rows_from_content(
+            content=self.content.materialize(),
+            has_header=self.csv_config.has_header,
+            delimiter=self.csv_config.delimiter,
+            normalize_headers=self.csv_config.normalize_headers,
+            clean_errors=self.csv_config.clean_errors,
+        )
+        return json.dumps(parsed_rows, ensure_ascii=True, separators=(",", ":"))
+
+    def digest(self) -> str:
+        options = self.csv_config.model_dump_json()
+        return hashlib.sha256(f"{options}:{self.content.digest()}".encode()).hexdigest()
+
+
+def _parse_csv_file(
+    file_path: SourceFile,
+    file_fields: dict[str, Any],
+    known: FileManifestEntry | None,
+    *,
+    csv_config: CsvConfig,
+    columnar: bool,
+    hash_content: bool,
+) -> tuple[str, RowChunk | None]:
+    """Read and parse one CSV file; the unit of work for ``parseWorkers``.
+
+    Returns the content hash and the file's rows, or ``None`` rows when the
+    content still matches ``known``. Module-level so process pool workers
+    can unpickle it.
+    """
+    if csv_config.document_mode == "file" and csv_config.lazy_content:
+        content_hash = _file_content_hash_from_path(file_path, csv_config) if hash_content else ""
+        if known and known.content_hash == content_hash:
+            return content_hash, None
+        content_raw = MappedFileText(file_path, csv_config.encoding)
+        file_record = dict(file_fields)
+        file_record["file_content_raw"] = content_raw
+        file_record["file_rows_json"] = CsvRowsJson(content_raw, csv_config)
+        return content_hash, [file_record]
+
+    try:
+        content = _read_csv_text(file_path, csv_config.encoding)
+    except Exception as exc:  # noqa: BLE001
+        raise ExtractionError(f"Unable to read CSV file '{file_path}': {exc}") from exc
+
+    if not hash_content:
+        content_hash = ""
+    elif isinstance(file_path, RemoteObject):
+        content_hash = file_path.content_hash
+    else:
+        content_hash = _file_content_hash(content)
+    if known and known.content_hash == content_hash:
+        return content_hash, None
+
+    if columnar:
+        batch = _csv_batch_from_content(
+            content=content,
+            has_header=csv_config.has_header,
+            delimiter=csv_config.delimiter,
+            normalize_headers=csv_config.normalize_headers,
+            clean_errors=csv_config.clean_errors,
+        )
+        return content_hash, batch.with_constants(file_fields)
+
+    parsed_rows = _csv_rows_from_content(
+        content=content,
+        has_header=csv_config.has_header,
+        delimiter=csv_config.delimiter,
+        normalize_headers=csv_config.normalize_headers,
+        clean_errors=csv_config.clean_errors,
+    )
+    if csv_config.document_mode == "row":
+        file_rows: list[dict[str, Any]] = []
+        for parsed_row in parsed_rows:
+            row = dict(parsed_row)
+            row.update(file_fields)
+            file_rows.append(row)
+        return content_hash, file_rows
+
+    file_record = dict(file_fields)
+    file_record["file_content_raw"] = content
+    file_record["file_rows_json"] = json.dumps(
+        parsed_rows,
+        ensure_ascii=True,
+        separators=(",", ":"),
+    )
+    return content_hash, [file_record]
+
+
+def _parse_csv_files(
+    source: SourceConfig,
+    jobs: list[tuple[SourceFile, dict[str, Any], FileManifestEntry | None]],
+    *,
+    columnar: bool,
+    hash_content: bool,
+) -> list[tuple[str, RowChunk | None]]:
+    """Parse files serially, or on the shared process pool when ``parseWorkers > 1``.
+
+    Results come back in ``jobs`` order either way, so rows, manifest entries
+    and checkpoints do not depend on which worker finished first.
+    """
+    if not jobs:
+        return []
+    parse = partial(
+        _parse_csv_file, csv_config=source.csv, columnar=columnar, hash_content=hash_content
+    )
+    workers = source.csv.parse_workers
+    # Objects share this process's store clients and are read with parallel
+    # ranged GETs already, so they are parsed in-process.
+    if workers <= 1 or len(jobs) <= 1 or isinstance(jobs[0][0], RemoteObject):
+        return [parse(*job) for job in jobs]
+
+    pool = get_process_pool(workers)
+    try:
+        return list(pool.map(parse, *zip(*jobs, strict=True)))
+    except BrokenProcessPool as exc:
+        discard_process_pool(pool)
+        raise ExtractionError(f"CSV parse worker pool failed: {exc}") from exc
+
+
+_CSV_STREAM_CHUNK_ROWS = 1000
+_NDJSON_CHUNK_ROWS = 1000
+_PARQUET_BATCH_ROWS = 8192
+_FILE_FORMAT_LABELS = {"csv": "CSV", "parquet": "Parquet", "ndjson": "NDJSON"}
+
+
+_COMPRESSION_BY_SUFFIX = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+# Errors raised while reading a possibly compressed file; truncated gzip and
+# bz2 streams raise EOFError.
+_FILE_READ_ERRORS = (OSError, EOFError, UnicodeError, LookupError)
+
+
+def _file_compression(path: Path) -> str | None:
+    """Compression of a local file from its suffix, or failing that its magic bytes."""
+    compression = _COMPRESSION_BY_SUFFIX.get(path.suffix.lower())
+    if compression is not None:
+        return compression
+    with path.open("rb") as handle:
+        return _magic_compression(handle.read(10))
+
+
+def _magic_compression(head: bytes) -> str | None:
+    if head.startswith(b"\x1f\x8b"):
+        return "gzip"
+    if head.startswith(b"\x28\xb5\x2f\xfd"):
+        return "zstd"
+    # "BZh", block size digit, then the block or end-of-stream magic.
+    if head[:3] == b"BZh" and head[3:4].isdigit() and head[4:] in (b"1AY&SY", b"\x17rE8P\x90"):
+        return "bz2"
+    return None
+
+
+class _ZstdRawReader(io.RawIOBase):
+    """Raw stream over ``zstandard``'s reader that reports errors as ``OSError``."""
+
+    def __init__(self, reader: Any, error_type: type[Exception]) -> None:
+        self._reader = reader
+        self._error_type = error_type
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        try:
+            return self._reader.readinto(buffer)
+        except self._error_type as exc:
+            raise OSError(f"zstd: {exc}") from exc
+
+    def close(self) -> None:
+        if not self.closed:
+            self._reader.close()
+        super().close()
+
+
+def _open_decompressed(
+    path: SourceFile, compression: str, binary: io.BufferedIOBase | None = None
+) -> io.RawIOBase | io.BufferedIOBase:
+    """Decompress ``path``, or ``binary`` when the caller already opened it."""
+    if compression in {"gzip", "bz2"}:
+        # The decompressors leave a passed-in stream open; the object reader holds
+        # no connection of its own and shuts its prefetch threads down when collected.
+        source = binary if binary is not None else path
+        return gzip.open(source, "rb") if compression == "gzip" else bz2.open(source, "rb")
+    try:
+        import zstandard
+    except ImportError as exc:
+        if binary is not None:
+            binary.close()
+        raise ExtractionError(
+            f"Reading zstd-compressed file '{path}' requires the optional zstandard "
+            "package (pip install 'ingest-relay[zstd]')"
+        ) from exc
+    reader = zstandard.ZstdDecompressor().stream_reader(
+        binary if binary is not None else path.open("rb"), read_across_frames=True, closefd=True
+    )
+    return _ZstdRawReader(reader, zstandard.ZstdError)
+
+
+def _open_text_file(
+    path: SourceFile, encoding: str, buffer_size: int = io.DEFAULT_BUFFER_SIZE
+) -> io.TextIOWrapper:
+    """Open ``path`` as text, decompressing gzip, bz2 and zstd files on the fly.
+
+    Universal newlines, like ``read_text()``, so streamed rows match buffered ones.
+    """
+    if isinstance(path, RemoteObject):
+        return _open_remote_text(path, encoding, buffer_size)
+    compression = _file_compression(path)
+    if compression is None:
+        return path.open(encoding=encoding, buffering=buffer_size)
+    binary = _open_decompressed(path, compression)
+    return io.TextIOWrapper(io.BufferedReader(binary, buffer_size), encoding=encoding)
+
+
+def _open_remote_text(obj: RemoteObject, encoding: str, buffer_size: int) -> io.TextIOWrapper:
+    """Open a bucket object as text, sniffing compression from the first block read.
+
+    The magic bytes are peeked from the reader's buffer, so detecting compression
+    costs no request of its own.
+    """
+    binary = obj.open("rb", buffering=buffer_size)
+    compression = _COMPRESSION_BY_SUFFIX.get(obj.suffix.lower()) or _magic_compression(
+        binary.peek(10)[:10]
+    )
+    if compression is None:
+        return io.TextIOWrapper(binary, encoding=encoding)
+    decompressed = _open_decompressed(obj, compression, binary)
+    return io.TextIOWrapper(io.BufferedReader(decompressed, buffer_size), encoding=encoding)
+
+
+def _open_csv_file(path: SourceFile, csv_config: CsvConfig) -> io.TextIOWrapper:
+    return _open_text_file(path, csv_config.encoding, csv_config.buffer_size)
+
+
+def _read_csv_text(path: SourceFile, encoding: str) -> str:
+    if not isinstance(path, RemoteObject) and _file_compression(path) is None:
+        return path.read_text(encoding=encoding)
+    with _open_text_file(path, encoding) as handle:
+        return handle.read()
+
+
+def _file_content_hash_from_path(path: SourceFile, csv_config: CsvConfig) -> str:
+    """``_file_content_hash`` of a file's text, read in ``bufferSize`` pieces.
+
+    Bucket objects use the checksum their store reported instead.
+    """
+    if isinstance(path, RemoteObject):
+        return path.content_hash
+    digest = hashlib.sha256()
+    try:
+        with _open_csv_file(path, csv_config) as handle:
+            while piece := handle.read(csv_config.buffer_size):
+                digest.update(piece.encode("utf-8"))
+    except _FILE_READ_ERRORS as exc:
+        raise ExtractionError(f"Unable to read CSV file '{path}': {exc}") from exc
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _file_bytes_hash(path: SourceFile) -> str:
+    """Content hash of a binary or JSON-lines source file: sha256 of its raw bytes."""
+    if isinstance(path, RemoteObject):
+        return path.content_hash
+    try:
+        with path.open("rb") as handle:
+            digest = hashlib.file_digest(handle, "sha256")
+    except OSError as exc:
+        raise ExtractionError(f"Unable to read file '{path}': {exc}") from exc
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _streamed_file_hash(source: SourceConfig, path: SourceFile) -> str:
+    if source.format == "csv":
+        return _file_content_hash_from_path(path, source.csv)
+    return _file_bytes_hash(path)
+
+
+def _stream_csv_chunks(
+    source: SourceConfig,
+    files: list[tuple[SourceFile, dict[str, Any], FileManifestEntry]],
+    columnar: bool,
+) -> Iterator[RowChunk]:
+    """Parse files straight from disk, yielding bounded chunks of rows.
+
+    Only one chunk of rows and the file buffer are held in memory at a time.
+    Each file's manifest entry gets its row count and watermark once the
+    file has been read.
+    """
+    csv_config = source.csv
+    for file_path, file_fields, entry in files:
+        try:
+            with _open_csv_file(file_path, csv_config) as handle:
+                chunk: list[dict[str, Any]] = []
+                for row in _iter_csv_rows(
+                    handle,
+                    has_header=csv_config.has_header,
+                    delimiter=csv_config.delimiter,
+                    normalize_headers=csv_config.normalize_headers,
+                    clean_errors=csv_config.clean_errors,
+                ):
+                    row.update(file_fields)
+                    chunk.append(row)
+                    if len(chunk) >= _CSV_STREAM_CHUNK_ROWS:
+                        yield _streamed_chunk(
+                            ColumnBatch.from_records(chunk) if columnar else chunk, entry, source
+                        )
+                        chunk = []
+                if chunk:
+                    yield _streamed_chunk(
+                        ColumnBatch.from_records(chunk) if columnar else chunk, entry, source
+                    )
+        except _FILE_READ_ERRORS as exc:
+            raise ExtractionError(f"Unable to read CSV file '{file_path}': {exc}") from exc
+
+
+def _stream_ndjson_chunks(
+    source: SourceConfig,
+    files: list[tuple[SourceFile, dict[str, Any], FileManifestEntry]],
+) -> Iterator[RowChunk]:
+    """Read JSON-lines files, one object per non-blank line, in bounded chunks."""
+    for file_path, file_fields, entry in files:
+        try:
+            with _open_text_file(file_path, "utf-8") as handle:
+                chunk: list[dict[str, Any]] = []
+                for line_number, line in enumerate(handle, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except ValueError as exc:
+                        raise ExtractionError(
+                            f"Invalid JSON on line {line_number} of '{file_path}': {exc}"
+                        ) from exc
+                    if not isinstance(row, dict):
+                        raise ExtractionError(
+                            f"Line {line_number} of '{file_path}' is not a JSON object"
+                        )
+                    row.update(file_fields)
+                    chunk.append(row)
+                    if len(chunk) >= _NDJSON_CHUNK_ROWS:
+                        yield _streamed_chunk(chunk, entry, source)
+                        chunk = []
+                if chunk:
+                    yield _streamed_chunk(chunk, entry, source)
+        except _FILE_READ_ERRORS as exc:
+            raise ExtractionError(f"Unable to read NDJSON file '{file_path}': {exc}") from exc
+
+
+def _import_parquet() -> tuple[Any, Any]:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ExtractionError(
+            "Reading Parquet files requires the optional pyarrow package "
+            "(pip install 'ingest-relay[parquet]')"
+        ) from exc
+    return pyarrow, pyarrow.parquet
+
+
+def _stream_parquet_chunks(
+    source: SourceConfig,
+    files: list[tuple[SourceFile, dict[str, Any], FileManifestEntry]],
+    projection: Callable[[], frozenset[str] | None],
+) -> Iterator[RowChunk]:
+    """Read Parquet files row group by row group as column batches.
+
+    ``projection`` is called once per file, when reading starts, so the
+    columns the pipeline projected the stream to are the only ones decoded;
+    the other column chunks are never read from disk.
+    """
+    pyarrow, parquet = _import_parquet()
+    for file_path, file_fields, entry in files:
+        # Objects are read through the raw ranged reader, so only the footer
+        # and the projected column chunks are fetched.
+        opened = (
+            file_path.open("rb", buffering=0)
+            if isinstance(file_path, RemoteObject)
+            else contextlib.nullcontext(file_path)
+        )
+        try:
+            with opened as parquet_source, parquet.ParquetFile(parquet_source) as parquet_file:
+                wanted = projection()
+                names = parquet_file.schema_arrow.names
+                columns = names if wanted is None else [name for name in names if name in wanted]
+                for batch in parquet_file.iter_batches(
+                    batch_size=_PARQUET_BATCH_ROWS, columns=columns, use_threads=False
+                ):
+                    chunk = ColumnBatch(
+                        batch.schema.names, [column.to_pylist() for column in batch.columns]
+                    ).with_constants(file_fields)
+                    yield _streamed_chunk(chunk, entry, source)
+        except (*_FILE_READ_ERRORS, pyarrow.ArrowException) as exc:
+            raise ExtractionError(f"Unable to read Parquet file '{file_path}': {exc}") from exc
+
+
+def _streamed_chunk(chunk: RowChunk, entry: FileManifestEntry, source: SourceConfig) -> RowChunk:
+    entry.row_count += len(chunk)
+    entry.row_watermark = _latest_watermark(
+        entry.row_watermark, _chunk_max_watermark(chunk, source.watermark_field)
+    )
+    return chunk
+
+
+def extract_file_rows(
+    source: SourceConfig,
+    current_watermark: str | None,
+    known_files: Mapping[str, FileManifestEntry] | None = None,
+) -> PullResult:
+    """Read matched CSV, Parquet or NDJSON files into rows.
+
+    With ``csv.streamRows``, and always for Parquet and NDJSON, the rows are
+    returned as a ``RowStream`` that reads each file lazily from disk.
+    With ``known_files`` (the manifest of the previous run), files whose
+    mtime and size, or failing that content hash, are unchanged are not
+    parsed; they are returned as ``carried_forward`` entries in
+    ``PullResult.file_entries`` instead. A ``gs://`` or ``s3://``
+    ``source.path`` is listed and read in place; for its objects the
+    store's checksum serves as the content hash.
+    """
+    if source.format not in _FILE_FORMAT_LABELS:
+        raise ExtractionError("source.format must be csv, parquet or ndjson for file_pull mode")
     if not source.path:
         raise ExtractionError("source.path is required for file_pull mode")
     if not source.glob:
         raise ExtractionError("source.glob is required for file_pull mode")
-    if source.csv is None:
+    if source.format == "csv" and source.csv is None:
         raise ExtractionError("source.csv is required for file_pull mode")
-    if "**" in source.glob:
-        raise ExtractionError("source.glob must be non-recursive for file_pull mode")
-
-    source_path = _resolve_source_path(source.path)
-    if not source_path.exists():
-        raise ExtractionError(f"source.path does not exist: {source_path}")
-    if not source_path.is_dir():
-        raise ExtractionError(f"source.path must be a directory: {source_path}")
 
-    matched_files = sorted(path for path in source_path.glob(source.glob) if path.is_file())
+    matched_files: list[tuple[SourceFile, str, int]]
+    if is_remote_path(source.path):
+        matched_files = [(obj, obj.mtime, obj.size) for obj in _discover_remote_files(source)]
+    else:
+        source_path = _resolve_source_path(source.path)
+        if not source_path.exists():
+            raise ExtractionError(f"source.path does not exist: {source_path}")
+        if not source_path.is_dir():
+            raise ExtractionError(f"source.path must be a directory: {source_path}")
+        matched_files = [
+            (file_path, datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat(), stat.st_size)
+            for file_path, stat in _discover_files(source_path, source)
+        ]
     rows: list[dict[str, Any]] = []
+    if source.format == "csv":
+        columnar = source.csv.columnar and source.csv.document_mode == "row"
+        stream_rows = source.csv.stream_rows and source.csv.document_mode == "row"
+    else:
+        columnar = source.format == "parquet"
+        stream_rows = True
+    batches: list[ColumnBatch] = []
+    streamed_files: list[tuple[SourceFile, dict[str, Any], FileManifestEntry]] = []
+    pending: list[tuple[int, SourceFile, dict[str, Any], FileManifestEntry | None]] = []
     manifest_entries: list[dict[str, Any]] = []
+    file_entries: list[FileManifestEntry] | None = None if known_files is None else []
     latest_mtime_iso: str | None = None
 
-    for file_path in matched_files:
-        stat = file_path.stat()
-        mtime_iso = datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat()
-        size_bytes = stat.st_size
-        manifest_entries.append(
-            {
-                "path": str(file_path),
-                "mtime": mtime_iso,
-                "size": size_bytes,
-            }
-        )
+    for file_path, mtime_iso, size_bytes in matched_files:
+        manifest_entry: dict[str, Any] = {
+            "path": str(file_path),
+            "mtime": mtime_iso,
+            "size": size_bytes,
+        }
+        if isinstance(file_path, RemoteObject):
+            # ETag or generation: a rewritten object changes the checkpoint even
+            # when its size and timestamp do not.
+            manifest_entry["version"] = file_path.version
+        manifest_entries.append(manifest_entry)
         if latest_mtime_iso is None or mtime_iso > latest_mtime_iso:
             latest_mtime_iso = mtime_iso
 
-        try:
-            content = file_path.read_text(encoding=source.csv.encoding)
-        except Exception as exc:  # noqa: BLE001
-            raise ExtractionError(f"Unable to read CSV file '{file_path}': {exc}") from exc
+        known = known_files.get(str(file_path)) if known_files else None
+        if known and known.mtime == mtime_iso and known.size_bytes == size_bytes:
+            file_entries.append(replace(known, carried_forward=True))
+            continue
+        if (
+            known
+            and isinstance(file_path, RemoteObject)
+            and known.content_hash == file_path.content_hash
+        ):
+            # The store's checksum says the object is unchanged: skip the download.
+            file_entries.append(
+                replace(known, mtime=mtime_iso, size_bytes=size_bytes, carried_forward=True)
+            )
+            continue
 
-        parsed_rows = _csv_rows_from_content(
-            content=content,
-            has_header=source.csv.has_header,
-            delimiter=source.csv.delimiter,
-            normalize_headers=source.csv.normalize_headers,
-            clean_errors=source.csv.clean_errors,
+        if stream_rows:
+            content_hash = (
+                _streamed_file_hash(source, file_path) if file_entries is not None else ""
+            )
+            if known and known.content_hash == content_hash:
+                file_entries.append(
+                    replace(known, mtime=mtime_iso, size_bytes=size_bytes, carried_forward=True)
+                )
+                continue
+            entry = FileManifestEntry(
+                path=str(file_path),
+                mtime=mtime_iso,
+                size_bytes=size_bytes,
+                content_hash=content_hash,
+            )
+            if file_entries is not None:
+                file_entries.append(entry)
+            streamed_files.append(
+                (file_path, _base_file_fields(file_path, mtime_iso, size_bytes), entry)
+            )
+            continue
+
+        if file_entries is not None:
+            # Placeholder, replaced once the file is parsed below.
+            file_entries.append(
+                FileManifestEntry(
+                    path=str(file_path), mtime=mtime_iso, size_bytes=size_bytes, content_hash=""
+                )
+            )
+        pending.append(
+            (
+                len(file_entries) - 1 if file_entries is not None else -1,
+                file_path,
+                _base_file_fields(file_path, mtime_iso, size_bytes),
+                known,
+            )
         )
-        file_fields = _base_file_fields(file_path, mtime_iso, size_bytes)
 
-        if source.csv.document_mode == "row":
-            for parsed_row in parsed_rows:
-                row = dict(parsed_row)
-                row.update(file_fields)
-                rows.append(row)
+    parsed_files = _parse_csv_files(
+        source,
+        [(file_path, file_fields, known) for _, file_path, file_fields, known in pending],
+        columnar=columnar,
+        hash_content=file_entries is not None,
+    )
+    for (slot, _, file_fields, known), (content_hash, file_rows) in zip(
+        pending, parsed_files, strict=True
+    ):
+        if file_rows is None:
+            # Touched but not modified: keep the documents, remember the new stat.
+            file_entries[slot] = replace(
+                known,
+                mtime=file_fields["file_mtime"],
+                size_bytes=file_fields["file_size_bytes"],
+                carried_forward=True,
+            )
+            continue
+        if isinstance(file_rows, ColumnBatch):
+            batches.append(file_rows)
         else:
-            file_record = dict(file_fields)
-            file_record["file_content_raw"] = content
-            file_record["file_rows_json"] = json.dumps(
-                parsed_rows,
-                ensure_ascii=True,
-                separators=(",", ":"),
+            rows.extend(file_rows)
+        if file_entries is not None:
+            file_entries[slot] = replace(
+                file_entries[slot],
+                content_hash=content_hash,
+                row_count=len(file_rows),
+                row_watermark=_chunk_max_watermark(file_rows, source.watermark_field),
             )
-            rows.append(file_record)
 
     legacy_row_watermark = _extract_row_watermark_from_checkpoint(current_watermark)
-    row_watermark = _max_watermark(rows, source.watermark_field, legacy_row_watermark)
+    carried_watermark = _latest_watermark(
+        *(entry.row_watermark for entry in file_entries or () if entry.carried_forward)
+    )
     file_hash = _file_manifest_hash(manifest_entries)
+    if columnar or stream_rows:
+        if source.format == "parquet":
+            chunks = _stream_parquet_chunks(source, streamed_files, lambda: stream.projection)
+        elif source.format == "ndjson":
+            chunks = _stream_ndjson_chunks(source, streamed_files)
+        elif stream_rows:
+            chunks = _stream_csv_chunks(source, streamed_files, columnar)
+        else:
+            chunks = iter(batches)
+        stream = RowStream(
+            chunks,
+            source.watermark_field,
+            None,
+            finalize=lambda row_watermark: _build_file_checkpoint(
+                row_watermark=_latest_watermark(row_watermark, carried_watermark)
+                or legacy_row_watermark,
+                file_count=len(matched_files),
+                latest_file_mtime=latest_mtime_iso,
+                file_manifest_hash=file_hash,
+            ),
+        )
+        return PullResult(rows=stream, file_entries=file_entries)
+
+    row_watermark = (
+        _latest_watermark(_max_watermark(rows, source.watermark_field, None), carried_watermark)
+        or legacy_row_watermark
+    )
     checkpoint = _build_file_checkpoint(
         row_watermark=row_watermark,
         file_count=len(matched_files),
         latest_file_mtime=latest_mtime_iso,
         file_manifest_hash=file_hash,
     )
-    return PullResult(rows=rows, watermark=checkpoint)
+    return PullResult(rows=rows, watermark=checkpoint, file_entries=file_entries)
 
 
 def _extract_json_path(data: dict[str, Any], dotted_path: str) -> Any:
@@ -293,10 +1515,84 @@ def _extract_json_path(data: dict[str, Any], dotted_path: str) -> Any:
     return cursor
 
 
-@retry(wait=wait_exponential(multiplier=1, min=1, max=10), stop=stop_after_attempt(3), reraise=True)
-def _request_with_retry(client: httpx.Client, method: str, url: str, **kwargs) -> httpx.Response:
+# Honour the server's Retry-After on 429/503 and fall back to exponential backoff.
+_RETRY_WAIT = wait_retry_after(wait_exponential(multiplier=1, min=1, max=10))
+
+
+@retry(wait=_RETRY_WAIT, stop=stop_after_attempt(3), reraise=True)
+def _request_with_retry(
+    client: httpx.Client,
+    method: str,
+    url: str,
+    *,
+    rate_limiter: HostRateLimiter | None = None,
+    **kwargs,
+) -> httpx.Response:
+    if rate_limiter:
+        rate_limiter.acquire()
     response = client.request(method, url, **kwargs)
+    if rate_limiter:
+        rate_limiter.observe(response)
+    if response.status_code >= 500 or response.status_code == 429:
+        response.raise_for_status()
+    return response
+
+
+@retry(wait=_RETRY_WAIT, stop=stop_after_attempt(3), reraise=True)
+async def _request_with_retry_async(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    rate_limiter: HostRateLimiter | None = None,
+    **kwargs,
+) -> httpx.Response:
+    if rate_limiter:
+        await rate_limiter.acquire_async()
+    response = await client.request(method, url, **kwargs)
+    if rate_limiter:
+        rate_limiter.observe(response)
+    if response.status_code >= 500 or response.status_code == 429:
+        response.raise_for_status()
+    return response
+
+
+@retry(wait=_RETRY_WAIT, stop=stop_after_attempt(3), reraise=True)
+def _stream_request_with_retry(
+    client: httpx.Client,
+    method: str,
+    url: str,
+    *,
+    rate_limiter: HostRateLimiter | None = None,
+    **kwargs,
+) -> httpx.Response:
+    if rate_limiter:
+        rate_limiter.acquire()
+    response = client.send(client.build_request(method, url, **kwargs), stream=True)
+    if rate_limiter:
+        rate_limiter.observe(response)
+    if response.status_code >= 500 or response.status_code == 429:
+        response.close()
+        response.raise_for_status()
+    return response
+
+
+@retry(wait=_RETRY_WAIT, stop=stop_after_attempt(3), reraise=True)
+async def _stream_request_with_retry_async(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    rate_limiter: HostRateLimiter | None = None,
+    **kwargs,
+) -> httpx.Response:
+    if rate_limiter:
+        await rate_limiter.acquire_async()
+    response = await client.send(client.build_request(method, url, **kwargs), stream=True)
+    if rate_limiter:
+        rate_limiter.observe(response)
     if response.status_code >= 500 or response.status_code == 429:
+        await response.aclose()
         response.raise_for_status()
     return response
 
@@ -310,27 +1606,49 @@ def _coerce_expires_in(raw: Any, default: int = 300) -> int:
 
 
 class OAuthClientCredentialsTokenProvider:
-    def __init__(self, source: SourceConfig, client: httpx.Client) -> None:
+    def __init__(
+        self,
+        source: SourceConfig,
+        client: httpx.Client | httpx.AsyncClient,
+        token_cache: OAuthTokenCache | None = None,
+    ) -> None:
         self.source = source
         self.client = client
-        self._access_token: str | None = None
-        self._token_type: str = "Bearer"
-        self._expires_at: float = 0.0
-        self._refresh_window_seconds = 30
+        self.token_cache = token_cache or get_oauth_token_cache()
+        # Last token handed out; a 401 only refreshes it if no one else has yet.
+        self._token: CachedToken | None = None
 
     def authorization_header(self, *, force_refresh: bool = False) -> str:
-        if force_refresh or self._needs_refresh():
-            self._refresh_token()
-        if not self._access_token:
-            raise ExtractionError("OAuth token provider failed to acquire an access token.")
-        return f"{self._token_type} {self._access_token}"
-
-    def _needs_refresh(self) -> bool:
-        if not self._access_token:
-            return True
-        return (self._expires_at - time.time()) <= self._refresh_window_seconds
+        self._token = self.token_cache.get(
+            self._cache_key(),
+            self._fetch_token,
+            stale=self._token if force_refresh else None,
+        )
+        return self._token.header_value
+
+    async def authorization_header_async(self, *, force_refresh: bool = False) -> str:
+        self._token = await self.token_cache.get_async(
+            self._cache_key(),
+            self._fetch_token_async,
+            stale=self._token if force_refresh else None,
+        )
+        return self._token.header_value
+
+    def _cache_key(self) -> str:
+        if self.source.oauth is None:
+            raise ExtractionError("OAuth configuration is required for token refresh.")
+        return oauth_token_cache_key(self.source.oauth)
 
-    def _refresh_token(self) -> None:
+    def _fetch_token(self) -> CachedToken:
+        url, kwargs = self._token_request()
+        return self._parse_token(_request_with_retry(self.client, "POST", url, **kwargs))
+
+    async def _fetch_token_async(self) -> CachedToken:
+        url, kwargs = self._token_request()
+        response = await _request_with_retry_async(self.client, "POST", url, **kwargs)
+        return self._parse_token(response)
+
+    def _token_request(self) -> tuple[str, dict[str, Any]]:
         oauth = self.source.oauth
         if oauth is None:
             raise ExtractionError("OAuth configuration is required for token refresh.")
@@ -356,17 +1674,16 @@ class OAuthClientCredentialsTokenProvider:
         else:
             auth = (oauth.client_id, client_secret)
 
-        response = _request_with_retry(
-            self.client,
-            "POST",
-            oauth.token_url,
-            data=form_data,
-            auth=auth,
-            headers={
+        return oauth.token_url, {
+            "data": form_data,
+            "auth": auth,
+            "headers": {
                 "Accept": "application/json",
                 "Content-Type": "application/x-www-form-urlencoded",
             },
-        )
+        }
+
+    def _parse_token(self, response: httpx.Response) -> CachedToken:
         if response.status_code >= 400:
             raise ExtractionError(f"OAuth token request failed with status {response.status_code}.")
 
@@ -384,90 +1701,523 @@ class OAuthClientCredentialsTokenProvider:
 
         token_type = payload.get("token_type")
         if isinstance(token_type, str) and token_type.strip():
-            self._token_type = token_type.strip()
+            token_type = token_type.strip()
         else:
-            self._token_type = "Bearer"
+            token_type = "Bearer"
 
         expires_in = _coerce_expires_in(payload.get("expires_in"), default=300)
-        self._access_token = access_token
-        self._expires_at = time.time() + expires_in
+        return CachedToken(
+            access_token=access_token,
+            token_type=token_type,
+            expires_at=time.time() + expires_in,
+        )
+
+
+class _RestPageFetcher:
+    """Issues one REST page request with the connector's auth headers."""
+
+    def __init__(
+        self,
+        source: SourceConfig,
+        client: httpx.Client | httpx.AsyncClient,
+        oauth_provider: OAuthClientCredentialsTokenProvider | None,
+        headers: dict[str, str],
+        current_watermark: str | None,
+    ) -> None:
+        self.source = source
+        self.client = client
+        self.oauth_provider = oauth_provider
+        self.headers = headers
+        self.current_watermark = current_watermark
+        self.rate_limiter = host_rate_limiter(source.url, source.max_requests_per_second)
+
+    def _request_headers(self, *, force_oauth_refresh: bool = False) -> dict[str, str]:
+        request_headers = dict(self.headers)
+        if self.oauth_provider:
+            request_headers["Authorization"] = self.oauth_provider.authorization_header(
+                force_refresh=force_oauth_refresh
+            )
+        return request_headers
+
+    def _params(self, page_params: dict[str, Any]) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if self.current_watermark:
+            params["watermark"] = self.current_watermark
+        params.update(page_params)
+        return params
+
+    def fetch(self, page_params: dict[str, Any]) -> Any:
+        params = self._params(page_params)
+        response = _request_with_retry(
+            self.client,
+            self.source.method,
+            self.source.url,
+            headers=self._request_headers(),
+            params=params,
+            json=self.source.payload,
+            rate_limiter=self.rate_limiter,
+        )
+        if self.oauth_provider and response.status_code == 401:
+            response = _request_with_retry(
+                self.client,
+                self.source.method,
+                self.source.url,
+                headers=self._request_headers(force_oauth_refresh=True),
+                params=params,
+                json=self.source.payload,
+                rate_limiter=self.rate_limiter,
+            )
+        response.raise_for_status()
+        return response.json()
+
+    async def fetch_async(self, page_params: dict[str, Any]) -> Any:
+        params = self._params(page_params)
+        headers = dict(self.headers)
+        if self.oauth_provider:
+            headers["Authorization"] = await self.oauth_provider.authorization_header_async()
+        response = await _request_with_retry_async(
+            self.client,
+            self.source.method,
+            self.source.url,
+            headers=headers,
+            params=params,
+            json=self.source.payload,
+            rate_limiter=self.rate_limiter,
+        )
+        if self.oauth_provider and response.status_code == 401:
+            headers["Authorization"] = await self.oauth_provider.authorization_header_async(
+                force_refresh=True
+            )
+            response = await _request_with_retry_async(
+                self.client,
+                self.source.method,
+                self.source.url,
+                headers=headers,
+                params=params,
+                json=self.source.payload,
+                rate_limiter=self.rate_limiter,
+            )
+        response.raise_for_status()
+        return response.json()
+
+    def _open_stream(self, page_params: dict[str, Any]) -> httpx.Response:
+        params = self._params(page_params)
+        response = _stream_request_with_retry(
+            self.client,
+            self.source.method,
+            self.source.url,
+            headers=self._request_headers(),
+            params=params,
+            json=self.source.payload,
+            rate_limiter=self.rate_limiter,
+        )
+        if self.oauth_provider and response.status_code == 401:
+            response.close()
+            response = _stream_request_with_retry(
+                self.client,
+                self.source.method,
+                self.source.url,
+                headers=self._request_headers(force_oauth_refresh=True),
+                params=params,
+                json=self.source.payload,
+                rate_limiter=self.rate_limiter,
+            )
+        return response
+
+    async def _open_stream_async(self, page_params: dict[str, Any]) -> httpx.Response:
+        params = self._params(page_params)
+        headers = dict(self.headers)
+        if self.oauth_provider:
+            headers["Authorization"] = await self.oauth_provider.authorization_header_async()
+        response = await _stream_request_with_retry_async(
+            self.client,
+            self.source.method,
+            self.source.url,
+            headers=headers,
+            params=params,
+            json=self.source.payload,
+            rate_limiter=self.rate_limiter,
+        )
+        if self.oauth_provider and response.status_code == 401:
+            await response.aclose()
+            headers["Authorization"] = await self.oauth_provider.authorization_header_async(
+                force_refresh=True
+            )
+            response = await _stream_request_with_retry_async(
+                self.client,
+                self.source.method,
+                self.source.url,
+                headers=headers,
+                params=params,
+                json=self.source.payload,
+                rate_limiter=self.rate_limiter,
+            )
+        return response
+
+    def fetch_streamed(
+        self, page_params: dict[str, Any], parser: JsonItemsParser
+    ) -> Iterator[list[Any]]:
+        """Yield the page's ``items`` in small batches while the body is downloaded."""
+        response = self._open_stream(page_params)
+        batch: list[Any] = []
+        try:
+            response.raise_for_status()
+            for data in response.iter_bytes():
+                batch.extend(parser.feed(data))
+                if len(batch) >= _STREAMED_ITEMS_PER_BATCH:
+                    yield batch
+                    batch = []
+            batch.extend(parser.close())
+        except ValueError as exc:
+            raise ExtractionError(str(exc)) from exc
+        finally:
+            response.close()
+        if batch:
+            yield batch
+
+    async def fetch_streamed_async(
+        self, page_params: dict[str, Any], parser: JsonItemsParser
+    ) -> AsyncIterator[list[Any]]:
+        response = await self._open_stream_async(page_params)
+        batch: list[Any] = []
+        try:
+            response.raise_for_status()
+            async for data in response.aiter_bytes():
+                batch.extend(parser.feed(data))
+                if len(batch) >= _STREAMED_ITEMS_PER_BATCH:
+                    yield batch
+                    batch = []
+            batch.extend(parser.close())
+        except ValueError as exc:
+            raise ExtractionError(str(exc)) from exc
+        finally:
+            await response.aclose()
+        if batch:
+            yield batch
+
+
+_STREAMED_ITEMS_PER_BATCH = 500
+
+
+def _dict_items(items: list[Any]) -> list[dict[str, Any]]:
+    return [item for item in items if isinstance(item, dict)]
+
+
+def _rest_page_items(payload: Any) -> list[Any]:
+    if isinstance(payload, list):
+        page_rows = payload
+    elif isinstance(payload, dict):
+        page_rows = payload.get("items", [])
+    else:
+        raise ExtractionError("Unsupported REST payload. Expected list or object with 'items'.")
+
+    if not isinstance(page_rows, list):
+        raise ExtractionError("REST 'items' must be a list")
+    return page_rows
+
+
+def _cursor_rest_pages(
+    fetcher: _RestPageFetcher, source: SourceConfig
+) -> Iterator[list[dict[str, Any]]]:
+    cursor: str | None = None
+    while True:
+        page_params = _cursor_page_params(source, cursor)
+        if source.stream_items:
+            parser = JsonItemsParser()
+            for items in fetcher.fetch_streamed(page_params, parser):
+                yield _dict_items(items)
+            payload: Any = parser.envelope
+        else:
+            payload = fetcher.fetch(page_params)
+            yield _dict_items(_rest_page_items(payload))
+
+        cursor = _next_cursor(payload, source)
+        if cursor is None:
+            return
+
+
+def _next_cursor(payload: Any, source: SourceConfig) -> str | None:
+    next_cursor = None
+    if source.pagination_next_cursor_json_path and isinstance(payload, dict):
+        next_cursor = _extract_json_path(payload, source.pagination_next_cursor_json_path)
+    return str(next_cursor) if next_cursor else None
+
+
+def _cursor_page_params(source: SourceConfig, cursor: str | None) -> dict[str, Any]:
+    if cursor and source.pagination_cursor_field:
+        return {source.pagination_cursor_field: cursor}
+    return {}
+
+
+def _indexed_pagination_plan(source: SourceConfig) -> tuple[int, int, int]:
+    """Return ``(page_size, first_position, step)`` for offset/page pagination."""
+    page_size = source.pagination_page_size
+    if page_size is None:
+        raise ExtractionError("source.paginationPageSize is required for offset/page pagination")
+    if source.pagination_mode == "offset":
+        return page_size, 0, page_size
+    return page_size, 1, 1
+
+
+def _indexed_page_params(source: SourceConfig, position: int) -> dict[str, Any]:
+    default_param = "offset" if source.pagination_mode == "offset" else "page"
+    page_params: dict[str, Any] = {source.pagination_cursor_field or default_param: position}
+    if source.pagination_limit_param:
+        page_params[source.pagination_limit_param] = source.pagination_page_size
+    return page_params
+
+
+@dataclass(slots=True)
+class _IndexedPageWalk:
+    """Decides where offset/page pagination ends.
+
+    Servers may cap pages below ``paginationPageSize``, so a short page alone
+    does not end the walk: an empty page does, or a page shorter than an
+    earlier one. Offsets step by ``paginationPageSize``, so under a cap they
+    would skip items; a short page followed by more items fails the run.
+    """
+
+    source: SourceConfig
+    largest: int = 0
+    short_page: tuple[int, int] | None = None
+
+    def is_last(self, position: int, item_count: int) -> bool:
+        if item_count == 0:
+            return True
+        if self.short_page is not None and self.source.pagination_mode == "offset":
+            short_position, short_count = self.short_page
+            raise ExtractionError(
+                f"REST offset {short_position} returned {short_count} items, fewer than "
+                f"paginationPageSize {self.source.pagination_page_size}, but offset {position} "
+                "returned more; the server caps its page size, so set paginationPageSize "
+                f"to {short_count} or lower"
+            )
+        if item_count < self.largest:
+            return True
+        self.largest = item_count
+        if item_count < (self.source.pagination_page_size or 0):
+            self.short_page = (position, item_count)
+        return False
+
+
+def _indexed_rest_pages(
+    fetcher: _RestPageFetcher, source: SourceConfig
+) -> Iterator[list[dict[str, Any]]]:
+    _, position, step = _indexed_pagination_plan(source)
+
+    def _fetch_page(page_position: int) -> tuple[int, list[dict[str, Any]]]:
+        page_params = _indexed_page_params(source, page_position)
+        if source.stream_items:
+            parser = JsonItemsParser()
+            rows = [
+                row
+                for items in fetcher.fetch_streamed(page_params, parser)
+                for row in _dict_items(items)
+            ]
+            return parser.item_count, rows
+        items = _rest_page_items(fetcher.fetch(page_params))
+        return len(items), _dict_items(items)
+
+    # Keep up to paginationConcurrency requests in flight and emit pages in order;
+    # the last page ends the walk and discards any speculative requests.
+    walk = _IndexedPageWalk(source)
+    with ThreadPoolExecutor(
+        max_workers=source.pagination_concurrency, thread_name_prefix="rest-page"
+    ) as pool:
+        in_flight: deque[tuple[int, Future[tuple[int, list[dict[str, Any]]]]]] = deque()
+        try:
+            while True:
+                while len(in_flight) < source.pagination_concurrency:
+                    in_flight.append((position, pool.submit(_fetch_page, position)))
+                    position += step
+                page_position, future = in_flight.popleft()
+                item_count, page_rows = future.result()
+                last = walk.is_last(page_position, item_count)
+                yield page_rows
+                if last:
+                    return
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+
+def _rest_page_fetcher(
+    source: SourceConfig,
+    client: httpx.Client | httpx.AsyncClient,
+    current_watermark: str | None,
+) -> _RestPageFetcher:
+    headers = dict(source.headers)
+    headers.setdefault("Accept", "application/json")
+
+    oauth_provider: OAuthClientCredentialsTokenProvider | None = None
+    if source.oauth:
+        oauth_provider = OAuthClientCredentialsTokenProvider(source, client)
+    else:
+        if not source.secret_ref:
+            raise ExtractionError("source.secretRef is required for rest_pull mode")
+        token = resolve_secret(source.secret_ref)
+        headers.setdefault("Authorization", f"Bearer {token}")
+    return _RestPageFetcher(source, client, oauth_provider, headers, current_watermark)
+
+
+def _rest_pages(
+    source: SourceConfig, current_watermark: str | None
+) -> Iterator[list[dict[str, Any]]]:
+    with create_httpx_client(timeout=30.0) as client:
+        fetcher = _rest_page_fetcher(source, client, current_watermark)
+        if source.pagination_mode == "cursor":
+            yield from _cursor_rest_pages(fetcher, source)
+        else:
+            yield from _indexed_rest_pages(fetcher, source)
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch_chunks(chunks: Iterator[RowChunk], depth: int) -> Iterator[RowChunk]:
+    """Produce ``chunks`` on a background thread, buffering up to ``depth`` ahead."""
+    buffer: queue.Queue[tuple[Any, BaseException | None]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _put(item: tuple[Any, BaseException | None]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for chunk in chunks:
+                if not _put((chunk, None)):
+                    return
+            _put((_PREFETCH_DONE, None))
+        except BaseException as exc:  # noqa: BLE001
+            _put((_PREFETCH_DONE, exc))
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=_produce, name="rest-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            chunk, error = buffer.get()
+            if error is not None:
+                raise error
+            if chunk is _PREFETCH_DONE:
+                return
+            yield chunk
+    finally:
+        stop.set()
+        producer.join()
 
 
 def extract_rest_rows(source: SourceConfig, current_watermark: str | None) -> PullResult:
     if not source.url:
         raise ExtractionError("source.url is required for rest_pull mode")
 
+    pages = _rest_pages(source, current_watermark)
+    if source.pagination_prefetch:
+        stream = RowStream(
+            _prefetch_chunks(pages, source.pagination_prefetch),
+            source.watermark_field,
+            current_watermark,
+        )
+        return PullResult(rows=stream)
+
     rows: list[dict[str, Any]] = []
-    cursor: str | None = None
+    for page_rows in pages:
+        rows.extend(page_rows)
 
-    with create_httpx_client(timeout=30.0) as client:
-        headers = dict(source.headers)
-        headers.setdefault("Accept", "application/json")
+    watermark = _max_watermark(rows, source.watermark_field, current_watermark)
+    return PullResult(rows=rows, watermark=watermark)
 
-        oauth_provider: OAuthClientCredentialsTokenProvider | None = None
-        if source.oauth:
-            oauth_provider = OAuthClientCredentialsTokenProvider(source, client)
-        else:
-            if not source.secret_ref:
-                raise ExtractionError("source.secretRef is required for rest_pull mode")
-            token = resolve_secret(source.secret_ref)
-            headers.setdefault("Authorization", f"Bearer {token}")
-
-        def _request_headers(*, force_oauth_refresh: bool = False) -> dict[str, str]:
-            request_headers = dict(headers)
-            if oauth_provider:
-                request_headers["Authorization"] = oauth_provider.authorization_header(
-                    force_refresh=force_oauth_refresh
-                )
-            return request_headers
 
-        while True:
-            params: dict[str, Any] = {}
-            if current_watermark:
-                params["watermark"] = current_watermark
-            if cursor and source.pagination_cursor_field:
-                params[source.pagination_cursor_field] = cursor
+async def _cursor_rest_pages_async(
+    fetcher: _RestPageFetcher, source: SourceConfig
+) -> AsyncIterator[list[dict[str, Any]]]:
+    cursor: str | None = None
+    while True:
+        page_params = _cursor_page_params(source, cursor)
+        if source.stream_items:
+            parser = JsonItemsParser()
+            async for items in fetcher.fetch_streamed_async(page_params, parser):
+                yield _dict_items(items)
+            payload: Any = parser.envelope
+        else:
+            payload = await fetcher.fetch_async(page_params)
+            yield _dict_items(_rest_page_items(payload))
 
-            response = _request_with_retry(
-                client,
-                source.method,
-                source.url,
-                headers=_request_headers(),
-                params=params,
-                json=source.payload,
-            )
-            if oauth_provider and response.status_code == 401:
-                response = _request_with_retry(
-                    client,
-                    source.method,
-                    source.url,
-                    headers=_request_headers(force_oauth_refresh=True),
-                    params=params,
-                    json=source.payload,
-                )
-            response.raise_for_status()
-            payload = response.json()
+        cursor = _next_cursor(payload, source)
+        if cursor is None:
+            return
 
-            if isinstance(payload, list):
-                page_rows = payload
-            elif isinstance(payload, dict):
-                page_rows = payload.get("items", [])
-            else:
-                raise ExtractionError(
-                    "Unsupported REST payload. Expected list or object with 'items'."
-                )
 
-            if not isinstance(page_rows, list):
-                raise ExtractionError("REST 'items' must be a list")
+async def _indexed_rest_pages_async(
+    fetcher: _RestPageFetcher, source: SourceConfig
+) -> AsyncIterator[list[dict[str, Any]]]:
+    _, position, step = _indexed_pagination_plan(source)
 
-            rows.extend([item for item in page_rows if isinstance(item, dict)])
+    async def _fetch_page(page_position: int) -> tuple[int, list[dict[str, Any]]]:
+        page_params = _indexed_page_params(source, page_position)
+        if source.stream_items:
+            parser = JsonItemsParser()
+            rows: list[dict[str, Any]] = []
+            async for items in fetcher.fetch_streamed_async(page_params, parser):
+                rows.extend(_dict_items(items))
+            return parser.item_count, rows
+        items = _rest_page_items(await fetcher.fetch_async(page_params))
+        return len(items), _dict_items(items)
+
+    walk = _IndexedPageWalk(source)
+    in_flight: deque[tuple[int, asyncio.Task[tuple[int, list[dict[str, Any]]]]]] = deque()
+    try:
+        while True:
+            while len(in_flight) < source.pagination_concurrency:
+                in_flight.append((position, asyncio.create_task(_fetch_page(position))))
+                position += step
+            page_position, task = in_flight.popleft()
+            item_count, page_rows = await task
+            last = walk.is_last(page_position, item_count)
+            yield page_rows
+            if last:
+                return
+    finally:
+        for _, task in in_flight:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in in_flight), return_exceptions=True)
+
+
+async def extract_rest_rows_async(
+    source: SourceConfig,
+    current_watermark: str | None,
+    client: httpx.AsyncClient,
+) -> PullResult:
+    """Async ``extract_rest_rows`` on a caller-owned, typically pooled, client."""
+    if not source.url:
+        raise ExtractionError("source.url is required for rest_pull mode")
 
-            next_cursor = None
-            if source.pagination_next_cursor_json_path and isinstance(payload, dict):
-                next_cursor = _extract_json_path(payload, source.pagination_next_cursor_json_path)
-            if not next_cursor:
-                break
-            cursor = str(next_cursor)
+    fetcher = _rest_page_fetcher(source, client, current_watermark)
+    pages = (
+        _cursor_rest_pages_async(fetcher, source)
+        if source.pagination_mode == "cursor"
+        else _indexed_rest_pages_async(fetcher, source)
+    )
+    rows: list[dict[str, Any]] = []
+    async for page_rows in pages:
+        rows.extend(page_rows)
 
     watermark = _max_watermark(rows, source.watermark_field, current_watermark)
     return PullResult(rows=rows, watermark=watermark)
+
+
+def extract_rest_rows_pooled(source: SourceConfig, current_watermark: str | None) -> PullResult:
+    """Run ``extract_rest_rows_async`` on the process-wide per-host client pool."""
+    if not source.url:
+        raise ExtractionError("source.url is required for rest_pull mode")
+    pool = get_async_client_pool()
+    return pool.run(extract_rest_rows_async(source, current_watermark, pool.client_for(source.url)))
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+_RESCAN_THRESHOLD = 64 * 1024
+
+_START = "start"
+_OBJECT_MEMBER = "object_member"
+_OBJECT_VALUE = "object_value"
+_OBJECT_NEXT = "object_next"
+_ITEMS_FIRST = "items_first"
+_ITEM = "item"
+_ITEMS_NEXT = "items_next"
+_DONE = "done"
+
+
+class JsonItemsParser:
+    """Push parser that emits elements of a REST page's ``items`` array one by one.
+
+    Accepts either a top-level JSON array or an object with an ``items`` array.
+    Other top-level object members are decoded whole and exposed as
+    ``envelope`` once the body is complete, so cursor paths such as
+    ``paging.next_cursor`` still resolve. Only the current element is held in
+    memory, never the full body or decoded tree.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._retry_at = 0
+        self._closed = False
+        self._state = _START
+        self._top_level_list = False
+        self._first_member = True
+        self._member_key = ""
+        self._members: dict[str, Any] = {}
+        self.item_count = 0
+
+    @property
+    def envelope(self) -> dict[str, Any] | None:
+        """Top-level object members other than ``items``; ``None`` for array pages."""
+        return None if self._top_level_list else self._members
+
+    def feed(self, data: bytes) -> list[Any]:
+        self._buffer += self._text_decoder.decode(data)
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._drain()
+
+    def close(self) -> list[Any]:
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._closed = True
+        items = self._drain()
+        if self._state != _DONE:
+            raise ValueError("REST page ended before the JSON document was complete.")
+        if self._buffer[self._pos :].strip():
+            raise ValueError("REST page has trailing data after the JSON document.")
+        return items
+
+    def _skip_whitespace(self) -> bool:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._pos < len(self._buffer)
+
+    def _decode_value(self) -> tuple[bool, Any]:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as exc:
+            if self._closed:
+                raise ValueError(f"REST page is not valid JSON: {exc}") from exc
+            return False, None
+        # A value is only complete once a delimiter follows it; "12" or "2." at
+        # the end of the buffer may still be the prefix of a longer number.
+        if not self._closed and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _drain(self) -> list[Any]:
+        items: list[Any] = []
+        while self._step(items):
+            pass
+        # Drop consumed text. A large value that is still incomplete is only
+        # re-scanned once the buffer doubled, keeping parsing linear overall.
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        pending = len(self._buffer)
+        self._retry_at = pending * 2 if pending > _RESCAN_THRESHOLD else 0
+        return items
+
+    def _step(self, items: list[Any]) -> bool:
+        if self._state == _DONE or not self._skip_whitespace():
+            return False
+        char = self._buffer[self._pos]
+
+        if self._state == _START:
+            if char == "[":
+                self._top_level_list = True
+                self._state = _ITEMS_FIRST
+            elif char == "{":
+                self._state = _OBJECT_MEMBER
+            else:
+                raise ValueError("Unsupported REST payload. Expected list or object with 'items'.")
+            self._pos += 1
+            return True
+
+        if self._state == _OBJECT_MEMBER:
+            if char == "}" and self._first_member:
+                self._pos += 1
+                self._state = _DONE
+                return True
+            return self._read_member_key()
+
+        if self._state == _OBJECT_VALUE:
+            if self._member_key == "items":
+                if char != "[":
+                    raise ValueError("REST 'items' must be a list")
+                self._pos += 1
+                self._state = _ITEMS_FIRST
+                return True
+            complete, value = self._decode_value()
+            if not complete:
+                return False
+            self._members[self._member_key] = value
+            self._state = _OBJECT_NEXT
+            return True
+
+        if self._state == _OBJECT_NEXT:
+            self._pos += 1
+            if char == ",":
+                self._state = _OBJECT_MEMBER
+            elif char == "}":
+                self._state = _DONE
+            else:
+                raise ValueError(f"REST page is not valid JSON: unexpected {char!r} in object.")
+            return True
+
+        if self._state == _ITEMS_FIRST and char == "]":
+            self._pos += 1
+            self._finish_items()
+            return True
+
+        if self._state in (_ITEMS_FIRST, _ITEM):
+            complete, value = self._decode_value()
+            if not complete:
+                return False
+            items.append(value)
+            self.item_count += 1
+            self._state = _ITEMS_NEXT
+            return True
+
+        # _ITEMS_NEXT
+        self._pos += 1
+        if char == ",":
+            self._state = _ITEM
+        elif char == "]":
+            self._finish_items()
+        else:
+            raise ValueError(f"REST page is not valid JSON: unexpected {char!r} in 'items'.")
+        return True
+
+    def _read_member_key(self) -> bool:
+        start = self._pos
+        complete, key = self._decode_value()
+        if not complete:
+            return False
+        if not isinstance(key, str):
+            raise ValueError("REST page is not valid JSON: object keys must be strings.")
+        if not self._skip_whitespace():
+            self._pos = start
+            return False
+        if self._buffer[self._pos] != ":":
+            raise ValueError("REST page is not valid JSON: expected ':' after object key.")
+        self._pos += 1
+        self._member_key = key
+        self._first_member = False
+        self._state = _OBJECT_VALUE
+        return True
+
+    def _finish_items(self) -> None:
+        self._state = _DONE if self._top_level_list else _OBJECT_NEXT
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import hashlib
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Mapping
+from typing import Any
+
+
+class LazyText(ABC):
+    """Text field of an extracted record that is only produced when read.
+
+    Extractors put these in records for large values (whole file contents)
+    so a record stays cheap until normalization needs the text. Each
+    ``materialize`` call builds a fresh string; nothing is cached on the
+    object, so a record never pins a copy of the text.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def materialize(self) -> str: ...
+
+    def digest(self) -> str:
+        """Hash that changes whenever the text does, computed without keeping it.
+
+        The default hashes the materialized text; subclasses backed by files
+        hash the file as a stream instead.
+        """
+        text = self.materialize()
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def __str__(self) -> str:
+        return self.materialize()
+
+
+def lazy_text_fields(row: Mapping[str, Any], fields: Collection[str]) -> list[str]:
+    """Names in ``fields`` whose value in ``row`` is a ``LazyText``."""
+    return [name for name in fields if isinstance(row.get(name), LazyText)]
+
+
+def materialize_fields(row: Mapping[str, Any], fields: Collection[str]) -> dict[str, Any]:
+    """Copy of ``row`` with the ``LazyText`` values of ``fields`` turned into strings.
+
+    Lazy values of other fields are left untouched, so content no template
+    references is never read.
+    """
+    materialized = dict(row)
+    for name in fields:
+        value = materialized.get(name)
+        if isinstance(value, LazyText):
+            materialized[name] = value.materialize()
+    return materialized
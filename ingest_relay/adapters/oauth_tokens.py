@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Protocol
+
+from ingest_relay.schemas import OAuthConfig
+from ingest_relay.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    access_token: str
+    token_type: str
+    expires_at: float
+
+    @property
+    def header_value(self) -> str:
+        return f"{self.token_type} {self.access_token}"
+
+
+def oauth_token_cache_key(oauth: OAuthConfig) -> str:
+    """Identify a client-credentials grant by token URL, client, scopes and audience."""
+    scopes = sorted({scope.strip() for scope in oauth.scopes if scope.strip()})
+    encoded = json.dumps(
+        [oauth.token_url, oauth.client_id, scopes, oauth.audience], ensure_ascii=True
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class OAuthTokenStore(Protocol):
+    def load(self, cache_key: str) -> CachedToken | None: ...
+
+    def save(self, cache_key: str, token: CachedToken) -> None: ...
+
+
+class OAuthTokenCache:
+    """Client-credentials tokens shared by every connector run using the same grant.
+
+    Tokens are refreshed ``refresh_window_seconds`` before they expire. Only
+    one refresh per grant is in flight at a time: concurrent callers wait for
+    it and reuse its token. A 401 handler passes the token that was rejected
+    as ``stale`` so a token another caller already replaced is not refreshed
+    again. With a ``store``, tokens are also shared with other workers and
+    survive restarts.
+    """
+
+    def __init__(
+        self, store: OAuthTokenStore | None = None, *, refresh_window_seconds: float = 30.0
+    ) -> None:
+        self.store = store
+        self.refresh_window_seconds = refresh_window_seconds
+        self._tokens: dict[str, CachedToken] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._async_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Lock]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(
+        self,
+        cache_key: str,
+        fetch: Callable[[], CachedToken],
+        *,
+        stale: CachedToken | None = None,
+    ) -> CachedToken:
+        token = self._usable(self._tokens.get(cache_key), stale)
+        if token:
+            return token
+        with self._lock_for(cache_key):
+            token = self._usable(self._tokens.get(cache_key), stale)
+            if token is None and self.store is not None:
+                token = self._adopt(cache_key, self.store.load(cache_key), stale)
+            if token is None:
+                token = fetch()
+                self._remember(cache_key, token)
+            return token
+
+    async def get_async(
+        self,
+        cache_key: str,
+        fetch: Callable[[], Awaitable[CachedToken]],
+        *,
+        stale: CachedToken | None = None,
+    ) -> CachedToken:
+        token = self._usable(self._tokens.get(cache_key), stale)
+        if token:
+            return token
+        async with self._async_lock_for(cache_key):
+            token = self._usable(self._tokens.get(cache_key), stale)
+            if token is None and self.store is not None:
+                stored = await asyncio.to_thread(self.store.load, cache_key)
+                token = self._adopt(cache_key, stored, stale)
+            if token is None:
+                token = await fetch()
+                self._tokens[cache_key] = token
+                if self.store is not None:
+                    try:
+                        await asyncio.to_thread(self.store.save, cache_key, token)
+                    except Exception:
+                        _log_save_failure(cache_key)
+            return token
+
+    def clear(self) -> None:
+        self._tokens.clear()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def _usable(self, token: CachedToken | None, stale: CachedToken | None) -> CachedToken | None:
+        if token is None or token == stale:
+            return None
+        if token.expires_at - time.time() <= self.refresh_window_seconds:
+            return None
+        return token
+
+    def _adopt(
+        self, cache_key: str, stored: CachedToken | None, stale: CachedToken | None
+    ) -> CachedToken | None:
+        token = self._usable(stored, stale)
+        if token is not None:
+            self._tokens[cache_key] = token
+        return token
+
+    def _remember(self, cache_key: str, token: CachedToken) -> None:
+        self._tokens[cache_key] = token
+        if self.store is not None:
+            try:
+                self.store.save(cache_key, token)
+            except Exception:
+                _log_save_failure(cache_key)
+
+    def _lock_for(self, cache_key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(cache_key, threading.Lock())
+
+    def _async_lock_for(self, cache_key: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._locks_guard:
+            locks = self._async_locks.setdefault(loop, {})
+            return locks.setdefault(cache_key, asyncio.Lock())
+
+
+def _log_save_failure(cache_key: str) -> None:
+    # A fetched token stays usable in this process even if it cannot be shared.
+    logger.warning("oauth_token_persist_failed", exc_info=True, extra={"cache_key": cache_key})
+
+
+@lru_cache(maxsize=1)
+def get_oauth_token_cache() -> OAuthTokenCache:
+    settings = get_settings()
+    store: OAuthTokenStore | None = None
+    if settings.oauth_token_cache_persist:
+        from ingest_relay.db import SessionLocal
+        from ingest_relay.services.oauth_token_store import SqlOAuthTokenStore
+
+        store = SqlOAuthTokenStore(SessionLocal, settings.managed_secret_encryption_key)
+    return OAuthTokenCache(store, refresh_window_seconds=settings.oauth_token_refresh_seconds)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -24,6 +25,14 @@ class ObjectStore:
     ) -> ObjectLocation:
         raise NotImplementedError
 
+    def upload_file(
+        self,
+        uri: str,
+        path: Path,
+        content_type: str = "application/json",
+    ) -> ObjectLocation:
+        return self.upload_text(uri, path.read_text(encoding="utf-8"), content_type=content_type)
+
 
 class GCSObjectStore(ObjectStore):
     def __init__(self) -> None:
@@ -45,6 +54,22 @@ class GCSObjectStore(ObjectStore):
         blob.upload_from_string(data=data, content_type=content_type)
         return ObjectLocation(uri=uri)
 
+    def upload_file(
+        self,
+        uri: str,
+        path: Path,
+        content_type: str = "application/json",
+    ) -> ObjectLocation:
+        if not uri.startswith("gs://"):
+            raise ObjectStoreError(f"GCS URI must start with gs://, got {uri}")
+
+        without_scheme = uri.removeprefix("gs://")
+        bucket_name, _, object_name = without_scheme.partition("/")
+        blob = self.client.bucket(bucket_name).blob(object_name)
+        # Resumable upload straight from disk; the file is never read into memory.
+        blob.upload_from_filename(str(path), content_type=content_type)
+        return ObjectLocation(uri=uri)
+
 
 class LocalObjectStore(ObjectStore):
     def __init__(self, base_dir: str) -> None:
@@ -65,3 +90,17 @@ class LocalObjectStore(ObjectStore):
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(data, encoding="utf-8")
         return ObjectLocation(uri=uri)
+
+    def upload_file(
+        self,
+        uri: str,
+        path: Path,
+        content_type: str = "application/json",
+    ) -> ObjectLocation:
+        if not uri.startswith("file://"):
+            raise ObjectStoreError(f"Local URI must start with file://, got {uri}")
+
+        file_path = self.base_dir / uri.removeprefix("file://")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, file_path)
+        return ObjectLocation(uri=uri)
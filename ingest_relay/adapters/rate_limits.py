@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+from tenacity import RetryCallState
+from tenacity.wait import wait_base
+
+# Server hints beyond this are treated as misconfiguration rather than obeyed verbatim.
+MAX_THROTTLE_SECONDS = 300.0
+# Epoch timestamps in X-RateLimit-Reset are far larger than any delta-seconds value.
+_EPOCH_THRESHOLD = 1_000_000_000
+_MIN_RATE = 0.1
+_RECOVERY_FACTOR = 1.05
+
+
+def _header(headers: Mapping[str, str], *names: str) -> str | None:
+    for name in names:
+        value = headers.get(name)
+        if value is not None and value.strip():
+            return value.strip()
+    return None
+
+
+def retry_after_seconds(headers: Mapping[str, str]) -> float | None:
+    """Parse ``Retry-After`` as delta seconds or an HTTP date."""
+    raw = _header(headers, "Retry-After")
+    if raw is None:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(tz=UTC)).total_seconds())
+
+
+def rate_limit_window(
+    headers: Mapping[str, str], wall_clock: Callable[[], float] = time.time
+) -> tuple[int, float] | None:
+    """Return ``(remaining, seconds_until_reset)`` from rate-limit headers."""
+    remaining_raw = _header(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+    reset_raw = _header(headers, "X-RateLimit-Reset", "RateLimit-Reset")
+    if remaining_raw is None or reset_raw is None:
+        return None
+    try:
+        remaining = int(float(remaining_raw))
+        reset = float(reset_raw)
+    except ValueError:
+        return None
+    reset_in = reset - wall_clock() if reset > _EPOCH_THRESHOLD else reset
+    return max(0, remaining), max(0.0, reset_in)
+
+
+class _TokenBucket:
+    """Token bucket whose rate is supplied on every take."""
+
+    def __init__(self) -> None:
+        self._tokens: float | None = None
+        self._updated: float | None = None
+
+    def take(self, rate: float, now: float) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        capacity = max(1.0, rate)
+        if self._tokens is None or self._updated is None:
+            tokens = capacity
+        else:
+            tokens = min(capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+        self._tokens = tokens - 1.0
+        return -self._tokens / rate if self._tokens < 0 else 0.0
+
+
+class _HostThrottle:
+    """Server throttling state shared by every limiter that calls one host."""
+
+    def __init__(self) -> None:
+        self.learned_rate: float | None = None
+        self.blocked_until = 0.0
+        self.bucket = _TokenBucket()
+        self.lock = threading.Lock()
+
+
+class HostRateLimiter:
+    """Rate limiter for one connector run that also follows server throttling hints.
+
+    ``max_rate`` is the connector's requests-per-second ceiling and paces only
+    this limiter's own requests. What the server says about the host is shared
+    with every limiter on the same host: the rate learned from
+    ``X-RateLimit-Remaining``/``-Reset`` (halved on 429 responses and recovered
+    gradually after successful ones) and pauses until ``Retry-After`` or the
+    reset time.
+    """
+
+    def __init__(
+        self,
+        max_rate: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        host: _HostThrottle | None = None,
+    ) -> None:
+        self.max_rate = max_rate
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._host = host if host is not None else _HostThrottle()
+        self._bucket = _TokenBucket()
+
+    @property
+    def rate(self) -> float | None:
+        rates = [rate for rate in (self.max_rate, self._host.learned_rate) if rate is not None]
+        return min(rates) if rates else None
+
+    def reserve(self) -> float:
+        """Take one request slot and return how long the caller must wait for it."""
+        host = self._host
+        with host.lock:
+            now = self._clock()
+            wait = max(0.0, host.blocked_until - now)
+            if self.max_rate is not None:
+                wait = max(wait, self._bucket.take(self.max_rate, now))
+            if host.learned_rate is not None:
+                wait = max(wait, host.bucket.take(host.learned_rate, now))
+            return wait
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, response: httpx.Response) -> None:
+        headers = response.headers
+        host = self._host
+        with host.lock:
+            now = self._clock()
+            retry_after = retry_after_seconds(headers)
+            window = rate_limit_window(headers, self._wall_clock)
+            if retry_after is not None and response.status_code in (429, 503):
+                self._block(now, retry_after)
+            if window is not None:
+                remaining, reset_in = window
+                if remaining == 0:
+                    self._block(now, reset_in)
+                elif reset_in > 0:
+                    host.learned_rate = remaining / reset_in
+            learned = host.learned_rate
+            if response.status_code == 429:
+                current = learned if learned is not None else self.max_rate
+                if current is not None:
+                    host.learned_rate = max(_MIN_RATE, current / 2)
+            elif (
+                response.status_code < 400
+                and window is None
+                and learned
+                # Only requests paced by the learned rate say anything about raising it.
+                and (self.max_rate is None or learned < self.max_rate)
+            ):
+                recovered = learned * _RECOVERY_FACTOR
+                if self.max_rate is not None and recovered >= self.max_rate:
+                    host.learned_rate = None
+                else:
+                    host.learned_rate = recovered
+
+    def _block(self, now: float, seconds: float) -> None:
+        host = self._host
+        host.blocked_until = max(host.blocked_until, now + min(seconds, MAX_THROTTLE_SECONDS))
+
+
+_hosts: dict[str, _HostThrottle] = {}
+_hosts_lock = threading.Lock()
+
+
+def host_rate_limiter(url: str, max_rate: float | None = None) -> HostRateLimiter:
+    """Return a limiter with its own ``max_rate`` that shares ``url``'s host throttling."""
+    host = httpx.URL(url).netloc.decode("ascii")
+    with _hosts_lock:
+        throttle = _hosts.get(host)
+        if throttle is None:
+            throttle = _HostThrottle()
+            _hosts[host] = throttle
+    return HostRateLimiter(max_rate, host=throttle)
+
+
+def reset_host_rate_limiters() -> None:
+    with _hosts_lock:
+        _hosts.clear()
+
+
+class wait_retry_after(wait_base):  # noqa: N801 - matches tenacity's wait_* naming
+    """Wait for the server's ``Retry-After`` when present, else use ``fallback``."""
+
+    def __init__(self, fallback: wait_base, max_wait: float = 60.0) -> None:
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        outcome = retry_state.outcome
+        error = outcome.exception() if outcome is not None else None
+        if isinstance(error, httpx.HTTPStatusError):
+            delay = retry_after_seconds(error.response.headers)
+            if delay is not None:
+                return min(delay, self.max_wait)
+        return self.fallback(retry_state)
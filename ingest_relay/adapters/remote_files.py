@@ -0,0 +1,509 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+import json
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Protocol
+from urllib.parse import parse_qsl, quote
+from xml.etree import ElementTree
+
+import httpx
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from ingest_relay.schemas import ObjectStoreConfig
+from ingest_relay.utils.http_clients import create_httpx_client
+
+REMOTE_SCHEMES = ("gs://", "s3://")
+_S3_XML_NAMESPACE = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+
+
+class RemoteReadError(OSError):
+    """Listing or reading an object failed; an ``OSError`` like local file errors."""
+
+
+def is_remote_path(path: str) -> bool:
+    return path.startswith(REMOTE_SCHEMES)
+
+
+class RemoteStore(Protocol):
+    scheme: str
+    bucket: str
+    config: ObjectStoreConfig
+
+    def list_objects(self, prefix: str) -> Iterator[RemoteObject]: ...
+
+    def read_range(self, obj: RemoteObject, start: int, length: int) -> bytes: ...
+
+
+@dataclass(frozen=True)
+class RemoteObject:
+    """One object in a bucket, with the ``Path`` surface the file extractors use.
+
+    ``version`` (ETag or generation) pins every ranged read to the listed
+    object, and ``content_hash`` is the store's own checksum, so changes are
+    detected without downloading anything.
+    """
+
+    store: RemoteStore = field(repr=False, compare=False)
+    key: str
+    size: int
+    mtime: str
+    version: str
+    content_hash: str
+
+    @property
+    def uri(self) -> str:
+        return f"{self.store.scheme}://{self.store.bucket}/{self.key}"
+
+    @property
+    def name(self) -> str:
+        return self.key.rsplit("/", 1)[-1]
+
+    @property
+    def suffix(self) -> str:
+        name = self.name
+        index = name.rfind(".")
+        return name[index:] if 0 < index < len(name) - 1 else ""
+
+    def __str__(self) -> str:
+        return self.uri
+
+    def read_range(self, start: int, length: int) -> bytes:
+        length = max(0, min(length, self.size - start))
+        if not length:
+            return b""
+        return self.store.read_range(self, start, length)
+
+    def open(
+        self,
+        mode: str = "r",
+        buffering: int = -1,
+        encoding: str | None = None,
+    ) -> io.IOBase:
+        """Open for reading like ``Path.open``; ``buffering=0`` returns the raw reader."""
+        if mode not in {"r", "rb"}:
+            raise ValueError(f"Remote objects can only be opened for reading, not {mode!r}")
+        raw = RangedReader(
+            self.read_range,
+            self.size,
+            block_size=self.store.config.range_size,
+            concurrency=self.store.config.read_concurrency,
+        )
+        if mode == "rb" and buffering == 0:
+            return raw
+        binary = io.BufferedReader(raw, buffering if buffering > 0 else io.DEFAULT_BUFFER_SIZE)
+        if mode == "rb":
+            return binary
+        return io.TextIOWrapper(binary, encoding=encoding)
+
+    def read_text(self, encoding: str | None = None) -> str:
+        with self.open(encoding=encoding) as handle:
+            return handle.read()
+
+
+class RangedReader(io.RawIOBase):
+    """Seekable raw stream over ranged GETs of one object.
+
+    Reading front to back fetches ``block_size`` blocks and keeps up to
+    ``concurrency`` of the following blocks in flight, so streaming a large
+    object overlaps network latency while holding at most ``concurrency``
+    blocks in memory. Reads anywhere else, such as Parquet seeking to its
+    footer and column chunks, fetch exactly the requested bytes.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int], bytes],
+        size: int,
+        *,
+        block_size: int,
+        concurrency: int,
+    ) -> None:
+        super().__init__()
+        self._fetch = fetch
+        self._size = size
+        self._block_size = block_size
+        self._concurrency = concurrency
+        self._position = 0
+        # Where a front-to-back read would continue; reads elsewhere are random access.
+        self._stream_position = 0
+        self._current: tuple[int, bytes] | None = None
+        self._pending: dict[int, Future[bytes]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        remaining = self._size - self._position
+        if remaining <= 0 or not len(view):
+            return 0
+        if self._position != self._stream_position:
+            data = self._fetch(self._position, min(len(view), remaining))
+            return self._copy(view, memoryview(data))
+        index, offset = divmod(self._position, self._block_size)
+        if self._current is None or self._current[0] != index:
+            self._current = (index, self._take_block(index))
+        count = self._copy(view, memoryview(self._current[1])[offset:])
+        self._stream_position = self._position
+        return count
+
+    def _copy(self, view: memoryview, data: memoryview) -> int:
+        count = min(len(view), len(data))
+        view[:count] = data[:count]
+        self._position += count
+        return count
+
+    def _fetch_block(self, index: int) -> bytes:
+        start = index * self._block_size
+        expected = min(self._block_size, self._size - start)
+        data = self._fetch(start, expected)
+        if len(data) != expected:
+            raise RemoteReadError(
+                f"Short read at byte {start}: expected {expected} bytes, got {len(data)}"
+            )
+        return data
+
+    def _take_block(self, index: int) -> bytes:
+        if self._concurrency <= 1:
+            return self._fetch_block(index)
+        for stale in [key for key in self._pending if key < index]:
+            self._pending.pop(stale).cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._concurrency, thread_name_prefix="remote-read"
+            )
+        block_count = -(-self._size // self._block_size)
+        for ahead in range(index, min(index + self._concurrency, block_count)):
+            if ahead not in self._pending:
+                self._pending[ahead] = self._executor.submit(self._fetch_block, ahead)
+        return self._pending.pop(index).result()
+
+    def close(self) -> None:
+        if not self.closed:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._current = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+
+@dataclass(frozen=True)
+class S3Credentials:
+    access_key_id: str
+    secret_access_key: str
+    session_token: str | None = None
+
+    @classmethod
+    def from_secret(cls, secret: str) -> S3Credentials:
+        """Parse ``{"accessKeyId": ..., "secretAccessKey": ..., "sessionToken": ...}``."""
+        try:
+            payload = json.loads(secret)
+        except ValueError:
+            payload = None
+        if (
+            not isinstance(payload, dict)
+            or not payload.get("accessKeyId")
+            or not payload.get("secretAccessKey")
+        ):
+            raise ValueError("S3 secret must be a JSON object with accessKeyId and secretAccessKey")
+        return cls(
+            access_key_id=payload["accessKeyId"],
+            secret_access_key=payload["secretAccessKey"],
+            session_token=payload.get("sessionToken"),
+        )
+
+
+class SigV4Auth(httpx.Auth):
+    """AWS Signature Version 4 for S3 and S3-compatible endpoints."""
+
+    def __init__(
+        self,
+        credentials: S3Credentials,
+        region: str,
+        service: str = "s3",
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self.credentials = credentials
+        self.region = region
+        self.service = service
+        self._clock = clock
+
+    def auth_flow(self, request: httpx.Request) -> Iterator[httpx.Request]:
+        self.sign(request)
+        yield request
+
+    def sign(self, request: httpx.Request) -> None:
+        amz_date = self._clock().strftime("%Y%m%dT%H%M%SZ")
+        scope = f"{amz_date[:8]}/{self.region}/{self.service}/aws4_request"
+        request.headers["x-amz-date"] = amz_date
+        request.headers["x-amz-content-sha256"] = hashlib.sha256(request.content).hexdigest()
+        if self.credentials.session_token:
+            request.headers["x-amz-security-token"] = self.credentials.session_token
+
+        headers = {
+            name.lower(): " ".join(value.split())
+            for name, value in request.headers.items()
+            if name.lower() in {"host", "range"} or name.lower().startswith("x-amz-")
+        }
+        signed_headers = ";".join(sorted(headers))
+        query = "&".join(
+            f"{quote(key, safe='-_.~')}={quote(value, safe='-_.~')}"
+            for key, value in sorted(
+                parse_qsl(request.url.query.decode("ascii"), keep_blank_values=True)
+            )
+        )
+        canonical_request = "\n".join(
+            [
+                request.method,
+                request.url.raw_path.split(b"?", 1)[0].decode("ascii"),
+                query,
+                "".join(f"{name}:{headers[name]}\n" for name in sorted(headers)),
+                signed_headers,
+                request.headers["x-amz-content-sha256"],
+            ]
+        )
+        string_to_sign = "\n".join(
+            [
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+            ]
+        )
+        key = f"AWS4{self.credentials.secret_access_key}".encode()
+        for part in (amz_date[:8], self.region, self.service, "aws4_request"):
+            key = hmac.new(key, part.encode("utf-8"), hashlib.sha256).digest()
+        signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+        request.headers["Authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.credentials.access_key_id}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+
+
+@retry(
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+def _send(client: httpx.Client, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    response = client.request(method, url, **kwargs)
+    if response.status_code >= 500 or response.status_code == 429:
+        response.raise_for_status()
+    return response
+
+
+@retry(
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+def _get_range(
+    client: httpx.Client, url: str, *, auth: httpx.Auth, headers: dict[str, str]
+) -> tuple[int, bytes]:
+    """GET a byte range; the body is only downloaded for ``206 Partial Content``."""
+    with client.stream("GET", url, auth=auth, headers=headers) as response:
+        if response.status_code >= 500 or response.status_code == 429:
+            response.raise_for_status()
+        return response.status_code, response.read() if response.status_code == 206 else b""
+
+
+class S3Store:
+    """Bucket on AWS S3 or an S3-compatible endpoint (MinIO, Ceph, R2, ...).
+
+    A custom ``endpointUrl`` uses path-style URLs, which every compatible
+    server accepts; AWS itself is addressed virtual-hosted style.
+    """
+
+    scheme = "s3"
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        bucket: str,
+        *,
+        credentials: S3Credentials,
+        config: ObjectStoreConfig,
+    ) -> None:
+        self.bucket = bucket
+        self._client = client
+        self.config = config
+        self._auth = SigV4Auth(credentials, config.region)
+        if config.endpoint_url:
+            self._base_url = f"{config.endpoint_url.rstrip('/')}/{quote(bucket, safe='')}"
+        else:
+            self._base_url = f"https://{bucket}.s3.{config.region}.amazonaws.com"
+
+    def _url(self, key: str) -> str:
+        return f"{self._base_url}/{quote(key, safe='/~')}"
+
+    def _request(self, method: str, key: str, **kwargs: Any) -> httpx.Response:
+        url = self._url(key)
+        try:
+            return _send(self._client, method, url, auth=self._auth, **kwargs)
+        except httpx.HTTPError as exc:
+            raise RemoteReadError(f"{method} {url} failed: {exc}") from exc
+
+    def list_objects(self, prefix: str) -> Iterator[RemoteObject]:
+        params = {"list-type": "2", "prefix": prefix}
+        while True:
+            response = self._request("GET", "", params=params)
+            if response.status_code != 200:
+                raise RemoteReadError(
+                    f"Listing s3://{self.bucket}/{prefix} returned HTTP {response.status_code}"
+                )
+            root = ElementTree.fromstring(response.content)
+            for contents in root.iter(f"{_S3_XML_NAMESPACE}Contents"):
+                key = contents.findtext(f"{_S3_XML_NAMESPACE}Key") or ""
+                if key.endswith("/"):
+                    continue
+                etag = contents.findtext(f"{_S3_XML_NAMESPACE}ETag") or ""
+                modified = contents.findtext(f"{_S3_XML_NAMESPACE}LastModified") or ""
+                yield RemoteObject(
+                    store=self,
+                    key=key,
+                    size=int(contents.findtext(f"{_S3_XML_NAMESPACE}Size") or 0),
+                    mtime=datetime.fromisoformat(modified).astimezone(UTC).isoformat(),
+                    version=etag,
+                    content_hash="etag:" + etag.strip('"'),
+                )
+            token = root.findtext(f"{_S3_XML_NAMESPACE}NextContinuationToken")
+            if root.findtext(f"{_S3_XML_NAMESPACE}IsTruncated") != "true" or not token:
+                return
+            params = {**params, "continuation-token": token}
+
+    def read_range(self, obj: RemoteObject, start: int, length: int) -> bytes:
+        url = self._url(obj.key)
+        headers = {"Range": f"bytes={start}-{start + length - 1}", "If-Match": obj.version}
+        try:
+            status_code, data = _get_range(self._client, url, auth=self._auth, headers=headers)
+        except httpx.HTTPError as exc:
+            raise RemoteReadError(f"GET {url} failed: {exc}") from exc
+        if status_code == 412:
+            raise RemoteReadError(f"{obj.uri} changed while it was being read")
+        if status_code == 200:
+            # Every block would download the whole object again; fail on the first one.
+            raise RemoteReadError(
+                f"Reading {obj.uri} failed: the endpoint ignored the Range header, "
+                "and file_pull needs ranged GETs on object stores"
+            )
+        if status_code != 206:
+            raise RemoteReadError(f"Reading {obj.uri} returned HTTP {status_code}")
+        return data
+
+
+class GCSStore:
+    """Google Cloud Storage bucket read through ``google-cloud-storage``."""
+
+    scheme = "gs"
+
+    def __init__(self, client: Any, bucket: str, *, config: ObjectStoreConfig) -> None:
+        self.bucket = bucket
+        self.config = config
+        self._client = client
+
+    def list_objects(self, prefix: str) -> Iterator[RemoteObject]:
+        from google.api_core import exceptions
+
+        try:
+            for blob in self._client.list_blobs(self.bucket, prefix=prefix or None):
+                if blob.name.endswith("/"):
+                    continue
+                checksum = f"md5:{blob.md5_hash}" if blob.md5_hash else f"crc32c:{blob.crc32c}"
+                yield RemoteObject(
+                    store=self,
+                    key=blob.name,
+                    size=int(blob.size or 0),
+                    mtime=blob.updated.astimezone(UTC).isoformat(),
+                    version=str(blob.generation),
+                    content_hash=checksum,
+                )
+        except exceptions.GoogleAPIError as exc:
+            raise RemoteReadError(f"Listing gs://{self.bucket}/{prefix} failed: {exc}") from exc
+
+    def read_range(self, obj: RemoteObject, start: int, length: int) -> bytes:
+        from google.api_core import exceptions
+
+        blob = self._client.bucket(self.bucket).blob(obj.key, generation=int(obj.version))
+        try:
+            # raw_download keeps gzip-encoded objects byte-for-byte, matching obj.size.
+            return blob.download_as_bytes(
+                start=start, end=start + length - 1, raw_download=True, checksum=None
+            )
+        except exceptions.NotFound as exc:
+            raise RemoteReadError(f"{obj.uri} changed while it was being read") from exc
+        except exceptions.GoogleAPIError as exc:
+            raise RemoteReadError(f"Reading {obj.uri} failed: {exc}") from exc
+
+
+@lru_cache(maxsize=1)
+def _s3_http_client() -> httpx.Client:
+    return create_httpx_client(timeout=httpx.Timeout(60.0, connect=10.0))
+
+
+@lru_cache(maxsize=1)
+def _gcs_client() -> Any:
+    from google.cloud import storage
+
+    return storage.Client()
+
+
+def open_remote_store(
+    uri: str, config: ObjectStoreConfig, secret: str | None
+) -> tuple[RemoteStore, str]:
+    """Return the store for a ``gs://`` or ``s3://`` ``source.path`` and its key prefix.
+
+    HTTP and storage clients are shared across runs, like the REST client pool.
+    """
+    scheme, _, rest = uri.partition("://")
+    bucket, _, prefix = rest.partition("/")
+    if not bucket:
+        raise ValueError(f"source.path has no bucket: {uri}")
+    prefix = prefix.strip("/")
+    prefix = f"{prefix}/" if prefix else ""
+    if scheme == "s3":
+        if secret is None:
+            raise ValueError("source.secretRef is required for s3:// file_pull sources")
+        credentials = S3Credentials.from_secret(secret)
+        return S3Store(_s3_http_client(), bucket, credentials=credentials, config=config), prefix
+    if scheme == "gs":
+        return GCSStore(_gcs_client(), bucket, config=config), prefix
+    raise ValueError(f"Unsupported object store scheme: {scheme}://")
+
+
+def close_remote_clients() -> None:
+    if _s3_http_client.cache_info().currsize:
+        _s3_http_client().close()
+        _s3_http_client.cache_clear()
+    if _gcs_client.cache_info().currsize:
+        _gcs_client().close()
+        _gcs_client.cache_clear()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+
+class _Absent:
+    """Cell of a record that did not have the column's key at all."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "_ABSENT"
+
+    def __reduce__(self) -> str:
+        # Unpickles as the module singleton, so identity checks survive worker pools.
+        return "_ABSENT"
+
+
+_ABSENT = _Absent()
+
+
+class ColumnBatch:
+    """Column-oriented block of rows that share a single header.
+
+    Each column is stored as one list, so column names are held once per batch
+    instead of once per row. Records are only materialized on iteration.
+    Batches built from records with differing keys are sparse: records come
+    back with exactly the keys they had.
+    """
+
+    __slots__ = ("columns", "_data", "_index", "_sparse")
+
+    def __init__(
+        self, columns: Sequence[str | None], data: Sequence[list[Any]], *, sparse: bool = False
+    ) -> None:
+        if len(columns) != len(data):
+            raise ValueError("ColumnBatch needs exactly one value list per column")
+        self.columns: tuple[str | None, ...] = tuple(columns)
+        self._data = list(data)
+        self._index = {name: idx for idx, name in enumerate(self.columns)}
+        self._sparse = sparse
+
+    @classmethod
+    def from_rows(cls, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> ColumnBatch:
+        materialized = rows if isinstance(rows, list) else list(rows)
+        if not materialized:
+            return cls(columns, [[] for _ in columns])
+        return cls(columns, [list(values) for values in zip(*materialized, strict=True)])
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str | None, Any]]) -> ColumnBatch:
+        materialized = records if isinstance(records, list) else list(records)
+        columns: list[str | None] = []
+        seen: set[str | None] = set()
+        for record in materialized:
+            for key in record:
+                if key not in seen:
+                    seen.add(key)
+                    columns.append(key)
+        width = len(columns)
+        if all(len(record) == width for record in materialized):
+            return cls(columns, [[record[name] for record in materialized] for name in columns])
+        return cls(
+            columns,
+            [[record.get(name, _ABSENT) for record in materialized] for name in columns],
+            sparse=True,
+        )
+
+    def __len__(self) -> int:
+        return len(self._data[0]) if self._data else 0
+
+    def has_column(self, name: str | None) -> bool:
+        return name in self._index
+
+    def column(self, name: str | None) -> list[Any]:
+        """Values of ``name``, with ``None`` where a record lacked the key."""
+        values = self._data[self._index[name]]
+        if self._sparse:
+            return [None if value is _ABSENT else value for value in values]
+        return values
+
+    def select(self, names: Iterable[str]) -> ColumnBatch:
+        wanted = set(names)
+        selected = [name for name in self.columns if name in wanted]
+        return ColumnBatch(
+            selected, [self._data[self._index[name]] for name in selected], sparse=self._sparse
+        )
+
+    def with_constants(self, values: Mapping[str, Any]) -> ColumnBatch:
+        size = len(self)
+        columns = [name for name in self.columns if name not in values]
+        data = [self._data[self._index[name]] for name in columns]
+        for name, value in values.items():
+            columns.append(name)
+            data.append([value] * size)
+        return ColumnBatch(columns, data, sparse=self._sparse)
+
+    def iter_tuples(self) -> Iterator[tuple[Any, ...]]:
+        if self._sparse:
+            return (
+                tuple(None if value is _ABSENT else value for value in values)
+                for values in zip(*self._data, strict=True)
+            )
+        return zip(*self._data, strict=True) if self._data else iter(())
+
+    def iter_records(self) -> Iterator[dict[str | None, Any]]:
+        columns = self.columns
+        if not self._sparse:
+            for values in self.iter_tuples():
+                yield dict(zip(columns, values, strict=True))
+            return
+        for values in zip(*self._data, strict=True):
+            yield {
+                name: value
+                for name, value in zip(columns, values, strict=True)
+                if value is not _ABSENT
+            }
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+
+from ingest_relay.settings import get_settings
+
+
+@dataclass
+class _EngineEntry:
+    engine: Engine
+    last_used: float
+    checkouts: int = 0
+
+
+def _engine_key(dsn: str) -> str:
+    return hashlib.sha256(dsn.encode("utf-8")).hexdigest()
+
+
+class SqlEngineRegistry:
+    """Process-wide cache of pooled SQLAlchemy engines keyed by resolved DSN.
+
+    Engines are created on first use, reused across connector runs, and
+    disposed once they have been idle longer than ``idle_seconds``. Pool
+    checkouts are counted, so an engine with a connection in use is never
+    disposed, and returning a connection counts as using the engine.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 5,
+        max_overflow: int = 5,
+        pre_ping: bool = True,
+        recycle_seconds: int = 1800,
+        idle_seconds: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pre_ping = pre_ping
+        self.recycle_seconds = recycle_seconds
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._entries: dict[str, _EngineEntry] = {}
+        self._lock = threading.Lock()
+
+    def _engine_kwargs(self, dsn: str) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {
+            "future": True,
+            "pool_pre_ping": self.pre_ping,
+            "pool_recycle": self.recycle_seconds,
+        }
+        # SQLite uses file/singleton pools that do not accept queue sizing arguments.
+        if make_url(dsn).get_backend_name() != "sqlite":
+            kwargs["pool_size"] = self.pool_size
+            kwargs["max_overflow"] = self.max_overflow
+        return kwargs
+
+    def get_engine(self, dsn: str) -> Engine:
+        key = _engine_key(dsn)
+        now = self._clock()
+        with self._lock:
+            self._evict_idle_locked(now, keep=key)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _EngineEntry(
+                    engine=create_engine(dsn, **self._engine_kwargs(dsn)),
+                    last_used=now,
+                )
+                self._track_checkouts(entry)
+                self._entries[key] = entry
+            entry.last_used = now
+            return entry.engine
+
+    def evict_idle(self) -> int:
+        with self._lock:
+            return self._evict_idle_locked(self._clock())
+
+    def dispose_all(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.engine.dispose()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _track_checkouts(self, entry: _EngineEntry) -> None:
+        def on_checkout(*_: Any) -> None:
+            with self._lock:
+                entry.checkouts += 1
+
+        def on_checkin(*_: Any) -> None:
+            with self._lock:
+                entry.checkouts -= 1
+                entry.last_used = self._clock()
+
+        event.listen(entry.engine, "checkout", on_checkout)
+        event.listen(entry.engine, "checkin", on_checkin)
+
+    def _evict_idle_locked(self, now: float, keep: str | None = None) -> int:
+        if self.idle_seconds <= 0:
+            return 0
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if key != keep and entry.checkouts <= 0 and now - entry.last_used > self.idle_seconds
+        ]
+        for key in expired:
+            self._entries.pop(key).engine.dispose()
+        return len(expired)
+
+
+@lru_cache(maxsize=1)
+def get_engine_registry() -> SqlEngineRegistry:
+    settings = get_settings()
+    return SqlEngineRegistry(
+        pool_size=settings.sql_pool_size,
+        max_overflow=settings.sql_pool_max_overflow,
+        pre_ping=settings.sql_pool_pre_ping,
+        recycle_seconds=settings.sql_pool_recycle_seconds,
+        idle_seconds=settings.sql_engine_idle_seconds,
+    )
+
+
+def get_sql_engine(dsn: str) -> Engine:
+    return get_engine_registry().get_engine(dsn)
+
+
+def dispose_sql_engines() -> None:
+    get_engine_registry().dispose_all()
@@ -25,6 +25,8 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
+from ingest_relay.adapters.remote_files import close_remote_clients
+from ingest_relay.adapters.sql_engines import dispose_sql_engines
 from ingest_relay.db import SessionLocal, get_session
 from ingest_relay.models import IdempotencyKey, ManualRunRequest, PushBatch, PushEvent
 from ingest_relay.ops_schemas import ConnectorDetail, OpsSnapshot, RunDetail
@@ -61,8 +63,10 @@ from ingest_relay.studio_schemas import (
     UpsertSecretRequest,
     ValidateDraftRequest,
 )
+from ingest_relay.utils.http_clients import close_async_client_pool
 from ingest_relay.utils.logging import configure_logging
 from ingest_relay.utils.paths import configured_connectors_dir
+from ingest_relay.utils.process_pools import close_process_pools
 
 
 @asynccontextmanager
@@ -70,6 +74,10 @@ async def lifespan(_: FastAPI):
     settings = get_settings()
     configure_logging(settings.log_level)
     yield
+    dispose_sql_engines()
+    close_async_client_pool()
+    close_remote_clients()
+    close_process_pools()
 
 
 app = FastAPI(title="IngestRelay", version="0.1.0", lifespan=lifespan)
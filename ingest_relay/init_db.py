@@ -1,9 +1,30 @@
+from sqlalchemy import Engine, inspect, text
+
 from ingest_relay.db import engine
 from ingest_relay.models import Base
 
+# Nullable columns added to tables after their first release. ``create_all``
+# only creates missing tables, so existing databases get these in place.
+_ADDED_COLUMNS = (("record_state", "source_fingerprint"),)
+
+
+def upgrade_schema(bind: Engine) -> None:
+    inspector = inspect(bind)
+    for table_name, column_name in _ADDED_COLUMNS:
+        existing = {column["name"] for column in inspector.get_columns(table_name)}
+        if column_name in existing:
+            continue
+        column = Base.metadata.tables[table_name].c[column_name]
+        column_type = column.type.compile(dialect=bind.dialect)
+        with bind.begin() as connection:
+            connection.execute(
+                text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
+            )
+
 
 def init_db() -> None:
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
 
 
 if __name__ == "__main__":
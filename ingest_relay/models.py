@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     DateTime,
     Integer,
@@ -30,6 +31,41 @@ class ConnectorCheckpoint(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
 
+class ConnectorCheckpointPayload(Base):
+    __tablename__ = "connector_checkpoint_payloads"
+
+    connector_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    payload_hash: Mapped[str] = mapped_column(String(80), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+
+class ConnectorResumePoint(Base):
+    __tablename__ = "connector_resume_points"
+
+    connector_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    base_watermark: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    source_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    keyset_value: Mapped[str] = mapped_column(Text, nullable=False)
+    pages_committed: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+
+class ConnectorFileManifest(Base):
+    __tablename__ = "connector_file_manifest"
+
+    connector_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    path: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    mtime: Mapped[str] = mapped_column(String(64), nullable=False)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(80), nullable=False)
+    source_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    row_watermark: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    doc_ids_json: Mapped[str] = mapped_column(Text, nullable=False)
+    last_run_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+
 class RecordState(Base):
     __tablename__ = "record_state"
     __table_args__ = (
@@ -42,6 +78,7 @@ class RecordState(Base):
     checksum: Mapped[str] = mapped_column(String(255), nullable=False)
     source_updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     last_seen_run_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    source_fingerprint: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
 
 class RunState(Base):
@@ -100,6 +137,16 @@ class ManagedSecret(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
 
+class OAuthTokenCacheEntry(Base):
+    __tablename__ = "oauth_token_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    token_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    encrypted_token: Mapped[str] = mapped_column(Text, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+
 class ProposalHistory(Base):
     __tablename__ = "proposal_history"
 
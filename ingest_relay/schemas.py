@@ -9,9 +9,11 @@ Mode = Literal["sql_pull", "rest_pull", "rest_push", "file_pull"]
 SourceType = Literal["postgres", "mssql", "mysql", "oracle", "http", "file"]
 DeletePolicy = Literal["auto_delete_missing", "soft_delete_only", "never_delete"]
 OAuthClientAuthMethod = Literal["client_secret_post", "client_secret_basic"]
-SourceFormat = Literal["csv"]
+SourceFormat = Literal["csv", "parquet", "ndjson"]
 CsvDocumentMode = Literal["row", "file"]
 OutputFormat = Literal["ndjson", "csv"]
+PaginationMode = Literal["cursor", "offset", "page"]
+ChecksumAlgorithm = Literal["sha256", "blake2b", "blake3", "xxh3_128"]
 
 
 class Metadata(BaseModel):
@@ -41,6 +43,11 @@ class CsvConfig(BaseModel):
     encoding: str = "utf-8"
     normalize_headers: bool = Field(default=False, alias="normalizeHeaders")
     clean_errors: bool = Field(default=False, alias="cleanErrors")
+    columnar: bool = False
+    stream_rows: bool = Field(default=False, alias="streamRows")
+    buffer_size: int = Field(default=1024 * 1024, alias="bufferSize", ge=4096)
+    parse_workers: int = Field(default=1, alias="parseWorkers", ge=1, le=32)
+    lazy_content: bool = Field(default=False, alias="lazyContent")
 
     @field_validator("delimiter")
     @classmethod
@@ -50,6 +57,31 @@ class CsvConfig(BaseModel):
         return value
 
 
+class ObjectStoreConfig(BaseModel):
+    endpoint_url: str | None = Field(default=None, alias="endpointUrl")
+    region: str = "us-east-1"
+    read_concurrency: int = Field(default=4, alias="readConcurrency", ge=1, le=32)
+    range_size: int = Field(default=8 * 1024 * 1024, alias="rangeSize", ge=64 * 1024)
+
+
+class SqlConfig(BaseModel):
+    stream_results: bool = Field(default=False, alias="streamResults")
+    fetch_size: int = Field(default=1000, alias="fetchSize", ge=1)
+    columnar: bool = False
+    keyset_column: str | None = Field(default=None, alias="keysetColumn")
+    page_size: int = Field(default=10000, alias="pageSize", ge=1)
+    partition_column: str | None = Field(default=None, alias="partitionColumn")
+    partition_count: int = Field(default=4, alias="partitionCount", ge=1)
+
+    @model_validator(mode="after")
+    def validate_extraction_strategy(self) -> SqlConfig:
+        if self.keyset_column and self.partition_column:
+            raise ValueError(
+                "source.sql.keysetColumn and source.sql.partitionColumn cannot be combined"
+            )
+        return self
+
+
 class SourceConfig(BaseModel):
     type: SourceType
     secret_ref: str | None = Field(default=None, alias="secretRef")
@@ -60,15 +92,44 @@ class SourceConfig(BaseModel):
     glob: str | None = None
     format: SourceFormat | None = None
     csv: CsvConfig | None = None
+    skip_unchanged_files: bool = Field(default=False, alias="skipUnchangedFiles")
+    include_patterns: list[str] = Field(default_factory=list, alias="includePatterns")
+    exclude_patterns: list[str] = Field(default_factory=list, alias="excludePatterns")
+    shard_count: int = Field(default=1, alias="shardCount", ge=1)
+    shard_index: int = Field(default=0, alias="shardIndex", ge=0)
+    object_store: ObjectStoreConfig | None = Field(default=None, alias="objectStore")
+    sql: SqlConfig | None = None
     method: str = "GET"
     payload: dict[str, Any] | None = None
     pagination_cursor_field: str | None = Field(default=None, alias="paginationCursorField")
     pagination_next_cursor_json_path: str | None = Field(
         default=None, alias="paginationNextCursorJsonPath"
     )
+    pagination_mode: PaginationMode = Field(default="cursor", alias="paginationMode")
+    pagination_page_size: int | None = Field(default=None, alias="paginationPageSize", ge=1)
+    pagination_limit_param: str | None = Field(default=None, alias="paginationLimitParam")
+    pagination_concurrency: int = Field(default=1, alias="paginationConcurrency", ge=1, le=32)
+    pagination_prefetch: int = Field(default=0, alias="paginationPrefetch", ge=0)
+    stream_items: bool = Field(default=False, alias="streamItems")
+    max_requests_per_second: float | None = Field(default=None, alias="maxRequestsPerSecond", gt=0)
     headers: dict[str, str] = Field(default_factory=dict)
     oauth: OAuthConfig | None = None
 
+    @model_validator(mode="after")
+    def validate_pagination(self) -> SourceConfig:
+        if self.pagination_mode == "cursor":
+            if self.pagination_concurrency > 1:
+                raise ValueError(
+                    "source.paginationConcurrency requires paginationMode offset or page"
+                )
+        elif self.pagination_page_size is None:
+            raise ValueError(
+                "source.paginationPageSize is required when paginationMode is offset or page"
+            )
+        if self.shard_index >= self.shard_count:
+            raise ValueError("source.shardIndex must be lower than source.shardCount")
+        return self
+
 
 class MappingConfig(BaseModel):
     id_field: str = Field(alias="idField")
@@ -79,6 +140,8 @@ class MappingConfig(BaseModel):
     acl_users_field: str | None = Field(default=None, alias="aclUsersField")
     acl_groups_field: str | None = Field(default=None, alias="aclGroupsField")
     metadata_fields: list[str] = Field(default_factory=list, alias="metadataFields")
+    normalize_workers: int = Field(default=1, alias="normalizeWorkers", ge=1, le=32)
+    checksum_algorithm: ChecksumAlgorithm = Field(default="sha256", alias="checksumAlgorithm")
 
 
 class OutputConfig(BaseModel):
@@ -156,10 +219,12 @@ class ConnectorSpec(BaseModel):
                 raise ValueError("source.path is required for file_pull mode")
             if not self.source.glob:
                 raise ValueError("source.glob is required for file_pull mode")
-            if self.source.format != "csv":
-                raise ValueError("source.format must be csv for file_pull mode")
-            if self.source.csv is None:
+            if self.source.format is None:
+                raise ValueError("source.format is required for file_pull mode")
+            if self.source.format == "csv" and self.source.csv is None:
                 raise ValueError("source.csv is required for file_pull mode")
+            if self.source.path.startswith("s3://") and not self.source.secret_ref:
+                raise ValueError("source.secretRef is required for s3:// file_pull sources")
 
         if self.ingestion.enabled and self.gemini is None:
             raise ValueError("spec.gemini is required when spec.ingestion.enabled is true")
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from ingest_relay.models import ConnectorCheckpoint, ConnectorCheckpointPayload
+
+logger = logging.getLogger(__name__)
+
+# Length of ConnectorCheckpoint.watermark; longer checkpoints are stored by reference.
+INLINE_CHECKPOINT_LIMIT = 255
+
+
+def _payload_hash(watermark: str) -> str:
+    return f"sha256:{hashlib.sha256(watermark.encode('utf-8')).hexdigest()}"
+
+
+def compact_checkpoint(watermark: str | None) -> str | None:
+    """Form of ``watermark`` that fits the checkpoint column.
+
+    Short checkpoints are returned unchanged. Longer ones become a
+    ``{"v":2,"ref":...}`` reference to their content hash, which is stable,
+    so it can also stand in for the checkpoint in other 255-character
+    columns such as resume points.
+    """
+    if watermark is None or len(watermark) <= INLINE_CHECKPOINT_LIMIT:
+        return watermark
+    return json.dumps({"v": 2, "ref": _payload_hash(watermark)}, separators=(",", ":"))
+
+
+def _reference_hash(stored: str) -> str | None:
+    if not stored.startswith("{"):
+        return None
+    try:
+        payload = json.loads(stored)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(payload, dict) and payload.get("v") == 2 and isinstance(payload.get("ref"), str):
+        return payload["ref"]
+    return None
+
+
+def load_checkpoint(session: Session, connector_id: str) -> str | None:
+    """Return the full checkpoint of ``connector_id``, following payload references.
+
+    A reference whose payload is missing or does not match its hash is
+    treated as no checkpoint, so the next run re-extracts everything
+    rather than resuming from the wrong position.
+    """
+    checkpoint = session.get(ConnectorCheckpoint, connector_id)
+    stored = checkpoint.watermark if checkpoint else None
+    if stored is None:
+        return None
+    reference = _reference_hash(stored)
+    if reference is None:
+        return stored
+    payload = session.get(ConnectorCheckpointPayload, connector_id)
+    if payload is None or payload.payload_hash != reference:
+        logger.warning(
+            "checkpoint_payload_missing",
+            extra={"connector_id": connector_id, "payload_hash": reference},
+        )
+        return None
+    return payload.payload
+
+
+def save_checkpoint(session: Session, connector_id: str, watermark: str | None) -> None:
+    """Stage ``watermark`` as the checkpoint of ``connector_id``.
+
+    Checkpoints over ``INLINE_CHECKPOINT_LIMIT`` characters are written to
+    ``connector_checkpoint_payloads`` and referenced from the checkpoint
+    row. Both are staged on the same session, so they commit atomically.
+    """
+    now = datetime.now(tz=UTC)
+    stored = compact_checkpoint(watermark)
+    if watermark is not None and stored != watermark:
+        payload = session.get(ConnectorCheckpointPayload, connector_id)
+        if payload is None:
+            payload = ConnectorCheckpointPayload(connector_id=connector_id)
+            session.add(payload)
+        payload.payload_hash = _payload_hash(watermark)
+        payload.payload = watermark
+        payload.updated_at = now
+    else:
+        session.execute(
+            delete(ConnectorCheckpointPayload).where(
+                ConnectorCheckpointPayload.connector_id == connector_id
+            )
+        )
+
+    checkpoint = session.get(ConnectorCheckpoint, connector_id)
+    if checkpoint:
+        checkpoint.watermark = stored
+        checkpoint.updated_at = now
+    else:
+        session.add(
+            ConnectorCheckpoint(connector_id=connector_id, watermark=stored, updated_at=now)
+        )
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, Protocol
+
+from ingest_relay.adapters.lazy_text import LazyText
+from ingest_relay.schemas import CanonicalDocument, ChecksumAlgorithm
+
+CHECKSUM_VERSION = "v2"
+_LEGACY_PREFIX = "sha256:"
+_TEXT_SLICE = 1 << 20
+
+
+class ChecksumError(RuntimeError):
+    pass
+
+
+class _Hasher(Protocol):
+    def update(self, data: bytes, /) -> object: ...
+
+    def hexdigest(self) -> str: ...
+
+
+def _blake3() -> _Hasher:
+    try:
+        import blake3
+    except ImportError as exc:
+        raise ChecksumError(
+            "checksumAlgorithm blake3 requires the optional blake3 package "
+            "(pip install 'ingest-relay[fasthash]')"
+        ) from exc
+    return blake3.blake3()
+
+
+def _xxh3_128() -> _Hasher:
+    try:
+        import xxhash
+    except ImportError as exc:
+        raise ChecksumError(
+            "checksumAlgorithm xxh3_128 requires the optional xxhash package "
+            "(pip install 'ingest-relay[fasthash]')"
+        ) from exc
+    return xxhash.xxh3_128()
+
+
+_HASHERS: dict[str, Callable[[], _Hasher]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+    "blake3": _blake3,
+    "xxh3_128": _xxh3_128,
+}
+# Field order is part of the v2 format; changing it changes every checksum.
+_TEXT_FIELDS = ("doc_id", "title", "content")
+
+
+def _update_text(hasher: _Hasher, value: str) -> None:
+    # Prefixed with the code point count, which delimits the UTF-8 bytes as
+    # unambiguously as a byte length but is known before encoding, so large
+    # values are encoded and hashed slice by slice.
+    hasher.update(f"{len(value)}:".encode("ascii"))
+    for start in range(0, len(value), _TEXT_SLICE):
+        hasher.update(value[start : start + _TEXT_SLICE].encode("utf-8", "surrogatepass"))
+
+
+def _update_json(hasher: _Hasher, value: Any) -> None:
+    _update_text(
+        hasher, json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    )
+
+
+def document_checksum(payload: Mapping[str, Any], algorithm: ChecksumAlgorithm) -> str:
+    """Versioned checksum of a document payload, hashed field by field.
+
+    Text fields go to the hash as UTF-8 without JSON escaping; only the small
+    structured fields (metadata, ACLs) are serialized. The result looks like
+    ``v2:blake2b:<hex>``.
+    """
+    factory = _HASHERS.get(algorithm)
+    if factory is None:
+        raise ChecksumError(f"Unsupported checksum algorithm: {algorithm}")
+    hasher = factory()
+    for name in _TEXT_FIELDS:
+        _update_text(hasher, payload[name])
+    uri = payload["uri"]
+    if uri is None:
+        hasher.update(b"-")
+    else:
+        hasher.update(b"+")
+        _update_text(hasher, uri)
+    _update_text(hasher, payload["mime_type"])
+    _update_json(hasher, payload["metadata"])
+    _update_json(hasher, payload["acl_users"])
+    _update_json(hasher, payload["acl_groups"])
+    return f"{CHECKSUM_VERSION}:{algorithm}:{hasher.hexdigest()}"
+
+
+def legacy_checksum(payload: Mapping[str, Any]) -> str:
+    """The unversioned ``sha256:`` checksum of the whole payload as sorted JSON."""
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+    return f"{_LEGACY_PREFIX}{hashlib.sha256(encoded).hexdigest()}"
+
+
+def checksum_payload(doc: CanonicalDocument) -> dict[str, Any]:
+    return {
+        "doc_id": doc.doc_id,
+        "title": doc.title,
+        "content": doc.content,
+        "uri": doc.uri,
+        "mime_type": doc.mime_type,
+        "metadata": doc.metadata,
+        "acl_users": doc.acl_users,
+        "acl_groups": doc.acl_groups,
+    }
+
+
+def checksum_matches(stored: str, doc: CanonicalDocument) -> bool:
+    """Whether ``stored`` was computed from the same content as ``doc``.
+
+    Checksums written by another scheme (the legacy ``sha256:`` format or a
+    different ``checksumAlgorithm``) are recomputed from ``doc`` in that
+    scheme, so changing the scheme does not re-upsert unchanged documents.
+    """
+    if stored == doc.checksum:
+        return True
+    if stored.startswith(_LEGACY_PREFIX):
+        return legacy_checksum(checksum_payload(doc)) == stored
+    version, _, rest = stored.partition(":")
+    algorithm, _, _ = rest.partition(":")
+    current_version, _, current_rest = doc.checksum.partition(":")
+    if version != CHECKSUM_VERSION or algorithm not in _HASHERS:
+        return False
+    if current_version == version and current_rest.startswith(f"{algorithm}:"):
+        # Same scheme, different digest: the content changed.
+        return False
+    return document_checksum(checksum_payload(doc), algorithm) == stored
+
+
+def source_fingerprint(mapping_version: str, fields: Iterable[str], row: Mapping[str, Any]) -> str:
+    """Fingerprint of the source values a mapping reads from ``row``.
+
+    The fields present are hashed as one JSON object, which keeps this far
+    cheaper than rendering the row; ``1`` and ``"1"`` differ as they do in
+    document metadata, and a missing field differs from ``None``. Values JSON
+    cannot represent (dates, decimals) are hashed by ``repr``. Lazy text is
+    hashed through its ``digest``, so file contents are never loaded whole.
+    """
+    values: dict[str, Any] = {}
+    lazy_digests: list[tuple[str, str]] = []
+    for name in fields:
+        if name not in row:
+            continue
+        value = row[name]
+        if isinstance(value, LazyText):
+            lazy_digests.append((name, value.digest()))
+        else:
+            values[name] = value
+    encoded = json.dumps(values, sort_keys=True, ensure_ascii=False, default=repr)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(mapping_version.encode("utf-8") + b"\0")
+    hasher.update(encoded.encode("utf-8", "surrogatepass"))
+    for name, digest in sorted(lazy_digests):
+        hasher.update(f"\0{name}\0{digest}".encode("utf-8", "surrogatepass"))
+    return hasher.hexdigest()
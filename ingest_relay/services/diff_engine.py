@@ -1,19 +1,46 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
+from itertools import islice
+from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from ingest_relay.models import RecordState
 from ingest_relay.schemas import CanonicalDocument, DeletePolicy
+from ingest_relay.services.checksums import checksum_matches
+from ingest_relay.services.normalizer import RowFingerprinter
 
 
 def _delete_checksum(doc_id: str) -> str:
     return f"sha256:{hashlib.sha256(doc_id.encode('utf-8')).hexdigest()}"
 
 
+def _delete_document(
+    connector_id: str, doc_id: str, delete_policy: DeletePolicy, state_updated_at: datetime
+) -> CanonicalDocument:
+    soft = delete_policy == "soft_delete_only"
+    metadata: dict[str, object] = {"connector_id": connector_id}
+    if soft:
+        metadata["soft_delete"] = True
+    return CanonicalDocument(
+        doc_id=doc_id,
+        title="",
+        content="",
+        uri=None,
+        mime_type="text/plain",
+        updated_at=state_updated_at if soft else datetime.now(tz=UTC),
+        acl_users=[],
+        acl_groups=[],
+        metadata=metadata,
+        checksum=_delete_checksum(doc_id),
+        op="DELETE",
+    )
+
+
 def compute_diffs(
     session: Session,
     connector_id: str,
@@ -28,48 +55,16 @@ def compute_diffs(
     upserts: list[CanonicalDocument] = []
     for doc in current_docs:
         previous = previous_by_doc.get(doc.doc_id)
-        if not previous or previous.checksum != doc.checksum:
+        if not previous or not checksum_matches(previous.checksum, doc):
             upserts.append(doc)
 
     deletes: list[CanonicalDocument] = []
-    if delete_policy == "auto_delete_missing":
-        current_ids = {doc.doc_id for doc in current_docs}
-        for doc_id in previous_by_doc:
-            if doc_id not in current_ids:
-                deletes.append(
-                    CanonicalDocument(
-                        doc_id=doc_id,
-                        title="",
-                        content="",
-                        uri=None,
-                        mime_type="text/plain",
-                        updated_at=datetime.now(tz=UTC),
-                        acl_users=[],
-                        acl_groups=[],
-                        metadata={"connector_id": connector_id},
-                        checksum=_delete_checksum(doc_id),
-                        op="DELETE",
-                    )
-                )
-
-    if delete_policy == "soft_delete_only":
+    if delete_policy in ("auto_delete_missing", "soft_delete_only"):
         current_ids = {doc.doc_id for doc in current_docs}
         for doc_id, state in previous_by_doc.items():
             if doc_id not in current_ids:
                 deletes.append(
-                    CanonicalDocument(
-                        doc_id=doc_id,
-                        title="",
-                        content="",
-                        uri=None,
-                        mime_type="text/plain",
-                        updated_at=state.source_updated_at,
-                        acl_users=[],
-                        acl_groups=[],
-                        metadata={"connector_id": connector_id, "soft_delete": True},
-                        checksum=_delete_checksum(doc_id),
-                        op="DELETE",
-                    )
+                    _delete_document(connector_id, doc_id, delete_policy, state.source_updated_at)
                 )
 
     return upserts, deletes
@@ -112,3 +107,184 @@ def apply_record_state(
                 RecordState.doc_id.in_(delete_ids),
             )
         )
+
+
+class RecordStateDiff:
+    """Compares a document stream with record state one batch at a time.
+
+    ``upserts`` looks up the stored checksums of each batch, yields the new
+    and changed documents and stages their record state on the session, so
+    only one batch of documents is held at a time. The IDs seen are kept for
+    ``deletes``. Unchanged documents whose stored checksum uses an older
+    scheme get the current checksum written back without being upserted.
+    ``changed_rows`` goes one step earlier and drops source rows whose
+    fingerprint matches record state before they are normalized.
+    Nothing is committed here: staged rows commit with the
+    checkpoint, or roll back with the run.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        connector_id: str,
+        run_id: str,
+        delete_policy: DeletePolicy,
+        batch_size: int = 1000,
+    ) -> None:
+        self.session = session
+        self.connector_id = connector_id
+        self.run_id = run_id
+        self.delete_policy = delete_policy
+        self.batch_size = batch_size
+        self.seen_doc_ids: set[str] = set()
+        self.duplicate_doc_ids: set[str] = set()
+        self.upsert_count = 0
+        self.restamp_count = 0
+        self.unchanged_row_count = 0
+        self._row_fingerprints: dict[str, str] = {}
+
+    def changed_rows(
+        self,
+        rows: Iterable[dict[str, Any]],
+        fingerprinter: RowFingerprinter,
+        doc_ids: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the source rows whose fingerprint differs from record state.
+
+        Rows with a matching fingerprint count as seen without being
+        normalized. The fingerprints of the rows yielded are written with
+        their documents by ``upserts``. The document ID of every row is
+        appended to ``doc_ids`` in source order when it is given.
+        """
+        iterator = iter(rows)
+        while batch := list(islice(iterator, self.batch_size)):
+            keyed = [(row, *fingerprinter.key(row)) for row in batch]
+            stored_rows = self.session.execute(
+                select(RecordState.doc_id, RecordState.source_fingerprint).where(
+                    RecordState.connector_id == self.connector_id,
+                    RecordState.doc_id.in_(
+                        [doc_id for _, doc_id, _ in keyed if doc_id is not None]
+                    ),
+                )
+            )
+            stored = {doc_id: fingerprint for doc_id, fingerprint in stored_rows}
+            for row, doc_id, fingerprint in keyed:
+                if doc_id is None:
+                    yield row
+                    continue
+                if doc_ids is not None:
+                    doc_ids.append(doc_id)
+                if stored.get(doc_id) == fingerprint:
+                    if doc_id in self.seen_doc_ids:
+                        self.duplicate_doc_ids.add(doc_id)
+                    self.seen_doc_ids.add(doc_id)
+                    self.unchanged_row_count += 1
+                else:
+                    self._row_fingerprints[doc_id] = fingerprint
+                    yield row
+
+    def upserts(self, docs: Iterable[CanonicalDocument]) -> Iterator[CanonicalDocument]:
+        iterator = iter(docs)
+        while batch := list(islice(iterator, self.batch_size)):
+            stored = self._stored_state(doc.doc_id for doc in batch)
+            fingerprints = {doc.doc_id: self._row_fingerprints.get(doc.doc_id) for doc in batch}
+            changed: list[CanonicalDocument] = []
+            restamped: list[dict[str, object]] = []
+            for doc in batch:
+                if doc.doc_id in self.seen_doc_ids:
+                    self.duplicate_doc_ids.add(doc.doc_id)
+                self.seen_doc_ids.add(doc.doc_id)
+                previous = stored.get(doc.doc_id)
+                fingerprint = fingerprints[doc.doc_id]
+                if previous is None or not checksum_matches(previous[1], doc):
+                    changed.append(doc)
+                elif previous[1] != doc.checksum or previous[2] != fingerprint:
+                    # Unchanged, but stored under another checksum scheme or
+                    # without the fingerprint of the current source row.
+                    restamped.append(
+                        {
+                            "id": previous[0],
+                            "checksum": doc.checksum,
+                            "source_fingerprint": fingerprint,
+                        }
+                    )
+            self._stage_upserts(changed, stored, fingerprints)
+            if restamped:
+                self.session.execute(update(RecordState), restamped)
+            for doc_id in fingerprints:
+                self._row_fingerprints.pop(doc_id, None)
+            self.upsert_count += len(changed)
+            self.restamp_count += len(restamped)
+            yield from changed
+
+    def _stored_state(self, doc_ids: Iterable[str]) -> dict[str, tuple[int, str, str | None]]:
+        rows = self.session.execute(
+            select(
+                RecordState.doc_id,
+                RecordState.id,
+                RecordState.checksum,
+                RecordState.source_fingerprint,
+            ).where(
+                RecordState.connector_id == self.connector_id,
+                RecordState.doc_id.in_(list(doc_ids)),
+            )
+        )
+        return {
+            doc_id: (row_id, checksum, fingerprint)
+            for doc_id, row_id, checksum, fingerprint in rows
+        }
+
+    def _stage_upserts(
+        self,
+        docs: list[CanonicalDocument],
+        stored: dict[str, tuple[int, str, str | None]],
+        fingerprints: dict[str, str | None],
+    ) -> None:
+        updates = []
+        inserts = []
+        # A repeated ID within one batch stages its last document only.
+        for doc in {doc.doc_id: doc for doc in docs}.values():
+            values = {
+                "checksum": doc.checksum,
+                "source_updated_at": doc.updated_at,
+                "last_seen_run_id": self.run_id,
+                "source_fingerprint": fingerprints[doc.doc_id],
+            }
+            if doc.doc_id in stored:
+                updates.append({"id": stored[doc.doc_id][0], **values})
+            else:
+                inserts.append({"connector_id": self.connector_id, "doc_id": doc.doc_id, **values})
+        if updates:
+            self.session.execute(update(RecordState), updates)
+        if inserts:
+            self.session.execute(insert(RecordState), inserts)
+
+    def deletes(self, keep: Iterable[str] = ()) -> list[CanonicalDocument]:
+        """Delete documents for stored IDs that the drained ``upserts`` stream never saw.
+
+        Call after ``upserts`` is exhausted. IDs in ``keep`` (documents that
+        still exist but were not re-extracted) are left alone.
+        """
+        if self.delete_policy not in ("auto_delete_missing", "soft_delete_only"):
+            return []
+        kept = set(keep)
+        rows = self.session.execute(
+            select(RecordState.doc_id, RecordState.source_updated_at)
+            .where(RecordState.connector_id == self.connector_id)
+            .execution_options(yield_per=self.batch_size)
+        )
+        return [
+            _delete_document(self.connector_id, doc_id, self.delete_policy, updated_at)
+            for doc_id, updated_at in rows
+            if doc_id not in self.seen_doc_ids and doc_id not in kept
+        ]
+
+    def stage_deletes(self, deletes: list[CanonicalDocument]) -> None:
+        doc_ids = [doc.doc_id for doc in deletes]
+        for start in range(0, len(doc_ids), self.batch_size):
+            self.session.execute(
+                delete(RecordState).where(
+                    RecordState.connector_id == self.connector_id,
+                    RecordState.doc_id.in_(doc_ids[start : start + self.batch_size]),
+                )
+            )
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from ingest_relay.adapters.extractors import FileManifestEntry
+from ingest_relay.models import ConnectorFileManifest
+from ingest_relay.schemas import MappingConfig, SourceConfig
+
+
+def file_manifest_fingerprint(source: SourceConfig, mapping: MappingConfig) -> str:
+    """Hash everything that shapes documents besides file content itself."""
+    encoded = json.dumps(
+        [
+            source.model_dump(
+                mode="json",
+                by_alias=True,
+                include={
+                    "path",
+                    "glob",
+                    "format",
+                    "csv",
+                    "include_patterns",
+                    "exclude_patterns",
+                    "object_store",
+                },
+            ),
+            source.watermark_field,
+            # Worker count and checksum scheme do not change document content.
+            mapping.model_dump(
+                mode="json",
+                by_alias=True,
+                exclude={"normalize_workers", "checksum_algorithm"},
+            ),
+        ],
+        sort_keys=True,
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def assign_file_doc_ids(entries: list[FileManifestEntry], doc_ids: list[str]) -> set[str]:
+    """Record which documents each re-parsed file produced.
+
+    Document IDs come back from normalization in extraction order, one per
+    row, so they are split by each file's row count. Returns the document IDs
+    carried forward from unchanged files.
+    """
+    carried: set[str] = set()
+    offset = 0
+    for entry in entries:
+        if entry.carried_forward:
+            carried.update(entry.doc_ids)
+            continue
+        entry.doc_ids = doc_ids[offset : offset + entry.row_count]
+        offset += entry.row_count
+    if offset != len(doc_ids):
+        raise ValueError(
+            f"file_pull manifest covers {offset} rows but normalization produced {len(doc_ids)}."
+        )
+    return carried
+
+
+class FileManifestStore:
+    """Per-file manifest of a ``file_pull`` connector, kept next to its record state.
+
+    Entries written under a different source fingerprint (another path, glob,
+    format, CSV dialect, include/exclude patterns, object store or mapping)
+    are ignored, so configuration changes trigger a full re-read.
+    ``last_run_id`` is the run that last parsed the file.
+    ``save`` only stages changes on the session; they commit together with
+    record state and the checkpoint.
+    """
+
+    def __init__(self, session: Session, connector_id: str, source_fingerprint: str) -> None:
+        self.session = session
+        self.connector_id = connector_id
+        self.source_fingerprint = source_fingerprint
+
+    def _rows(self) -> dict[str, ConnectorFileManifest]:
+        rows = self.session.execute(
+            select(ConnectorFileManifest).where(
+                ConnectorFileManifest.connector_id == self.connector_id
+            )
+        ).scalars()
+        return {row.path: row for row in rows}
+
+    def load(self) -> dict[str, FileManifestEntry]:
+        return {
+            path: FileManifestEntry(
+                path=path,
+                mtime=row.mtime,
+                size_bytes=row.size_bytes,
+                content_hash=row.content_hash,
+                row_watermark=row.row_watermark,
+                doc_ids=json.loads(row.doc_ids_json),
+            )
+            for path, row in self._rows().items()
+            if row.source_fingerprint == self.source_fingerprint
+        }
+
+    def save(self, entries: list[FileManifestEntry], run_id: str) -> None:
+        existing = self._rows()
+        now = datetime.now(tz=UTC)
+        for entry in entries:
+            row = existing.pop(entry.path, None)
+            if (
+                row is not None
+                and entry.carried_forward
+                and row.mtime == entry.mtime
+                and row.source_fingerprint == self.source_fingerprint
+            ):
+                # Untouched file: keep the row as written by the run that parsed it.
+                continue
+            if row is None:
+                row = ConnectorFileManifest(connector_id=self.connector_id, path=entry.path)
+                self.session.add(row)
+            row.mtime = entry.mtime
+            row.size_bytes = entry.size_bytes
+            row.content_hash = entry.content_hash
+            row.source_fingerprint = self.source_fingerprint
+            row.row_watermark = entry.row_watermark
+            row.doc_ids_json = json.dumps(entry.doc_ids, ensure_ascii=True, separators=(",", ":"))
+            row.last_run_id = run_id
+            row.updated_at = now
+        if existing:
+            self.session.execute(
+                delete(ConnectorFileManifest).where(
+                    ConnectorFileManifest.connector_id == self.connector_id,
+                    ConnectorFileManifest.path.in_(list(existing)),
+                )
+            )
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
+from functools import partial
+from itertools import chain
 from typing import Any
 
-from jinja2 import StrictUndefined, Template
-
+from ingest_relay.adapters.lazy_text import lazy_text_fields, materialize_fields
 from ingest_relay.schemas import CanonicalDocument, MappingConfig
 from ingest_relay.security import validate_prompt_injection_safe
+from ingest_relay.services.checksums import document_checksum, source_fingerprint
+from ingest_relay.services.templates import compiled_template, template_variables
+from ingest_relay.utils.process_pools import discard_process_pool, get_process_pool
 
 
 class NormalizationError(RuntimeError):
@@ -34,25 +42,124 @@ def _normalize_acl(raw: Any) -> list[str]:
     return [str(raw)]
 
 
-def _checksum(payload: dict[str, Any]) -> str:
-    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
-    return f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+def mapping_source_fields(mapping: MappingConfig, source_watermark_field: str | None) -> set[str]:
+    """Return the source columns that ``normalize_records`` reads for ``mapping``."""
+    fields = {mapping.id_field, mapping.title_field, *mapping.metadata_fields}
+    fields |= template_variables(mapping.content_template)
+    if mapping.uri_template:
+        fields |= template_variables(mapping.uri_template)
+    for optional_field in (
+        mapping.acl_users_field,
+        mapping.acl_groups_field,
+        source_watermark_field,
+    ):
+        if optional_field:
+            fields.add(optional_field)
+    return fields
+
+
+# Bump when normalization changes how a row becomes a document, so stored
+# source fingerprints stop matching and every row is rendered again.
+_SOURCE_FINGERPRINT_VERSION = "1"
+
+
+class RowFingerprinter:
+    """Keys source rows by document ID and source fingerprint.
+
+    The fingerprint covers the fields ``mapping`` reads and a hash of the
+    mapping itself, so a row whose fingerprint matches the one in record
+    state normalizes to the same document and need not be rendered again.
+    """
+
+    def __init__(
+        self,
+        connector_id: str,
+        mapping: MappingConfig,
+        source_watermark_field: str | None,
+    ) -> None:
+        self.connector_id = connector_id
+        self.id_field = mapping.id_field
+        self._fields = sorted(mapping_source_fields(mapping, source_watermark_field))
+        version = [
+            _SOURCE_FINGERPRINT_VERSION,
+            connector_id,
+            source_watermark_field,
+            mapping.model_dump(mode="json", exclude={"normalize_workers"}),
+        ]
+        self.mapping_version = hashlib.sha256(
+            json.dumps(version, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def key(self, row: dict[str, Any]) -> tuple[str | None, str]:
+        """Return the document ID and source fingerprint of ``row``.
+
+        Lazy text is hashed as a stream and left unread in ``row``. The ID
+        is ``None`` when the row has no id field; normalizing the row
+        reports that.
+        """
+        doc_id = f"{self.connector_id}:{row[self.id_field]}" if self.id_field in row else None
+        return doc_id, source_fingerprint(self.mapping_version, self._fields, row)
+
+
+_NORMALIZE_CHUNK_ROWS = 2000
 
 
 def normalize_records(
     connector_id: str,
     mapping: MappingConfig,
     source_watermark_field: str | None,
-    rows: list[dict[str, Any]],
+    rows: Iterable[dict[str, Any]],
 ) -> list[CanonicalDocument]:
-    content_template = Template(mapping.content_template, undefined=StrictUndefined)
-    uri_template = (
-        Template(mapping.uri_template, undefined=StrictUndefined) if mapping.uri_template else None
-    )
+    return list(iter_normalized_records(connector_id, mapping, source_watermark_field, rows))
+
 
-    docs: list[CanonicalDocument] = []
+def iter_normalized_records(
+    connector_id: str,
+    mapping: MappingConfig,
+    source_watermark_field: str | None,
+    rows: Iterable[dict[str, Any]],
+) -> Iterator[CanonicalDocument]:
+    """Yield documents for ``rows`` in source order as they are normalized.
+
+    Rows are pulled from ``rows`` only as documents are consumed, so a
+    streamed extraction is never held in memory as a whole.
+    """
+    if mapping.normalize_workers > 1:
+        yield from _normalize_parallel(connector_id, mapping, source_watermark_field, rows)
+    else:
+        yield from _iter_documents(connector_id, mapping, source_watermark_field, rows)
+
+
+def _normalize_chunk(
+    connector_id: str,
+    mapping: MappingConfig,
+    source_watermark_field: str | None,
+    rows: Iterable[dict[str, Any]],
+) -> list[CanonicalDocument]:
+    return list(_iter_documents(connector_id, mapping, source_watermark_field, rows))
+
+
+def _iter_documents(
+    connector_id: str,
+    mapping: MappingConfig,
+    source_watermark_field: str | None,
+    rows: Iterable[dict[str, Any]],
+) -> Iterator[CanonicalDocument]:
+    # Compiled once per process and reused by every run with the same mapping.
+    content_template = compiled_template(mapping.content_template)
+    uri_template = compiled_template(mapping.uri_template) if mapping.uri_template else None
+
+    fields_read: set[str] | None = None
+    lazy_fields: list[str] = []
 
     for row in rows:
+        if fields_read is None:
+            # Extractors emit lazy values in the same fields of every record.
+            fields_read = mapping_source_fields(mapping, source_watermark_field)
+            lazy_fields = lazy_text_fields(row, fields_read)
+        if lazy_fields:
+            # Only text the mapping reads is produced, and only for this row.
+            row = materialize_fields(row, lazy_fields)
         if mapping.id_field not in row:
             raise NormalizationError(f"Missing id field '{mapping.id_field}' in source record")
         if mapping.title_field not in row:
@@ -101,9 +208,61 @@ def normalize_records(
             acl_users=payload_for_hash["acl_users"],
             acl_groups=payload_for_hash["acl_groups"],
             metadata=metadata,
-            checksum=_checksum(payload_for_hash),
+            checksum=document_checksum(payload_for_hash, mapping.checksum_algorithm),
             op="UPSERT",
         )
-        docs.append(doc)
+        yield doc
 
-    return docs
+
+def _normalize_parallel(
+    connector_id: str,
+    mapping: MappingConfig,
+    source_watermark_field: str | None,
+    rows: Iterable[dict[str, Any]],
+) -> Iterator[CanonicalDocument]:
+    """Normalize row chunks on the shared process pool, keeping source order.
+
+    Chunks are collected in submission order, so the first failing row raises
+    the same error the serial loop would; later chunks are cancelled. At most
+    two chunks per worker are in flight, which bounds the rows held in memory
+    for streamed sources.
+    """
+    chunks = _row_chunks(rows)
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    normalize = partial(_normalize_chunk, connector_id, mapping, source_watermark_field)
+    if second is None:
+        # Not worth a round trip through the pool.
+        yield from normalize(first)
+        return
+
+    workers = mapping.normalize_workers
+    pool = get_process_pool(workers)
+    pending: deque[Future[list[CanonicalDocument]]] = deque()
+    try:
+        for chunk in chain((first, second), chunks):
+            pending.append(pool.submit(normalize, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    except BrokenProcessPool as exc:
+        discard_process_pool(pool)
+        raise NormalizationError(f"Normalization worker pool failed: {exc}") from exc
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _row_chunks(rows: Iterable[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+    # Lazy values are pickled unread; each worker reads the text of its own rows.
+    chunk: list[dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= _NORMALIZE_CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
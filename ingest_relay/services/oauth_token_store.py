@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from sqlalchemy.orm import Session
+
+from ingest_relay.adapters.oauth_tokens import CachedToken
+from ingest_relay.models import OAuthTokenCacheEntry
+from ingest_relay.services.secrets_registry import decrypt_secret, encrypt_secret
+
+
+class SqlOAuthTokenStore:
+    """Persists OAuth access tokens in the state database, encrypted at rest.
+
+    Workers sharing the database reuse each other's tokens instead of each
+    requesting its own from the identity provider.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], encryption_key: str) -> None:
+        self.session_factory = session_factory
+        self.encryption_key = encryption_key
+
+    def load(self, cache_key: str) -> CachedToken | None:
+        with self.session_factory() as session:
+            row = session.get(OAuthTokenCacheEntry, cache_key)
+            if row is None:
+                return None
+            expires_at = row.expires_at
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=UTC)
+            return CachedToken(
+                access_token=decrypt_secret(self.encryption_key, row.encrypted_token),
+                token_type=row.token_type,
+                expires_at=expires_at.timestamp(),
+            )
+
+    def save(self, cache_key: str, token: CachedToken) -> None:
+        encrypted_token = encrypt_secret(self.encryption_key, token.access_token)
+        expires_at = datetime.fromtimestamp(token.expires_at, tz=UTC)
+        now = datetime.now(tz=UTC)
+        with self.session_factory() as session:
+            row = session.get(OAuthTokenCacheEntry, cache_key)
+            if row is None:
+                session.add(
+                    OAuthTokenCacheEntry(
+                        cache_key=cache_key,
+                        token_type=token.token_type,
+                        encrypted_token=encrypted_token,
+                        expires_at=expires_at,
+                        updated_at=now,
+                    )
+                )
+            else:
+                row.token_type = token.token_type
+                row.encrypted_token = encrypted_token
+                row.expires_at = expires_at
+                row.updated_at = now
+            session.commit()
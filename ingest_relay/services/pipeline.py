@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections.abc import Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -11,19 +12,46 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ingest_relay.adapters.extractors import (
+    RowStream,
     extract_file_rows,
     extract_rest_rows,
+    extract_rest_rows_pooled,
     extract_sql_rows,
 )
+from ingest_relay.adapters.row_batches import ColumnBatch
 from ingest_relay.connector_loader import load_connector_config
 from ingest_relay.db import SessionLocal
-from ingest_relay.models import ConnectorCheckpoint, PushBatch, PushEvent, RunState
-from ingest_relay.schemas import CanonicalDocument
-from ingest_relay.services.diff_engine import apply_record_state, compute_diffs
+from ingest_relay.models import PushBatch, PushEvent, RunState
+from ingest_relay.schemas import CanonicalDocument, MappingConfig, SourceConfig
+from ingest_relay.services.checkpoint_store import (
+    compact_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+from ingest_relay.services.diff_engine import RecordStateDiff, apply_record_state
+from ingest_relay.services.file_manifest import (
+    FileManifestStore,
+    assign_file_doc_ids,
+    file_manifest_fingerprint,
+)
 from ingest_relay.services.gemini_ingestion import GeminiIngestionClient
-from ingest_relay.services.normalizer import normalize_records
+from ingest_relay.services.normalizer import (
+    RowFingerprinter,
+    iter_normalized_records,
+    mapping_source_fields,
+)
 from ingest_relay.services.observability import send_splunk_event, send_teams_alert
-from ingest_relay.services.publisher import publish_artifacts, publish_csv_artifacts
+from ingest_relay.services.publisher import (
+    NdjsonArtifacts,
+    publish_artifacts,
+    publish_csv_artifacts,
+    publish_ndjson_artifacts,
+)
+from ingest_relay.services.sql_resume import (
+    SqlKeysetResumeStore,
+    clear_resume_state,
+    keyset_source_fingerprint,
+)
 from ingest_relay.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -82,22 +110,11 @@ def _set_run_success(session: Session, run_id: str, upserts: int, deletes: int)
 
 
 def _get_checkpoint(session: Session, connector_id: str) -> str | None:
-    checkpoint = session.get(ConnectorCheckpoint, connector_id)
-    return checkpoint.watermark if checkpoint else None
+    return load_checkpoint(session, connector_id)
 
 
 def _set_checkpoint(session: Session, connector_id: str, watermark: str | None) -> None:
-    checkpoint = session.get(ConnectorCheckpoint, connector_id)
-    if checkpoint:
-        checkpoint.watermark = watermark
-        checkpoint.updated_at = datetime.now(tz=UTC)
-    else:
-        checkpoint = ConnectorCheckpoint(
-            connector_id=connector_id,
-            watermark=watermark,
-            updated_at=datetime.now(tz=UTC),
-        )
-        session.add(checkpoint)
+    save_checkpoint(session, connector_id, watermark)
 
 
 def _consume_push_batch(
@@ -159,13 +176,21 @@ def _split_push_docs(
     return upserts, deletes
 
 
-def _ensure_unique_doc_ids(docs: list[CanonicalDocument]) -> None:
-    seen: set[str] = set()
-    duplicates: set[str] = set()
-    for doc in docs:
-        if doc.doc_id in seen:
-            duplicates.add(doc.doc_id)
-        seen.add(doc.doc_id)
+def _project_row_stream(rows: Any, mapping: MappingConfig, source: SourceConfig) -> Any:
+    # Columnar batches only materialize the columns the mapping actually reads.
+    if isinstance(rows, RowStream):
+        return rows.project(mapping_source_fields(mapping, source.watermark_field))
+    return rows
+
+
+def _csv_row_count(rows: list[dict[str, Any]] | list[ColumnBatch]) -> int:
+    if rows and isinstance(rows[0], ColumnBatch):
+        return sum(len(batch) for batch in rows)
+    return len(rows)
+
+
+def _ensure_unique_doc_ids(diff: RecordStateDiff, carried_doc_ids: set[str]) -> None:
+    duplicates = diff.duplicate_doc_ids | (diff.seen_doc_ids & carried_doc_ids)
     if duplicates:
         ordered = sorted(duplicates)
         raise ValueError(
@@ -174,6 +199,19 @@ def _ensure_unique_doc_ids(docs: list[CanonicalDocument]) -> None:
         )
 
 
+def _resumed_watermark(
+    resume_store: SqlKeysetResumeStore | None, watermark: str | None, checkpoint: str | None
+) -> str | None:
+    """Keep the old checkpoint after a keyset run that resumed mid-way.
+
+    The resumed run did not re-read the rows before its resume point, so the
+    next run has to start from the same checkpoint to publish them.
+    """
+    if resume_store is not None and resume_store.resumed:
+        return checkpoint
+    return watermark
+
+
 def run_connector(connector_path: str, push_run_id: str | None = None) -> PipelineResult:
     settings = get_settings()
     connector = load_connector_config(connector_path)
@@ -189,54 +227,68 @@ def run_connector(connector_path: str, push_run_id: str | None = None) -> Pipeli
     try:
         with _session_scope() as session:
             checkpoint = _get_checkpoint(session, connector_id)
-            docs: list[CanonicalDocument] = []
+            source_rows: Iterable[dict[str, Any]] | None = None
+            diff: RecordStateDiff | None = None
             upserts: list[CanonicalDocument] = []
             deletes: list[CanonicalDocument] = []
-            rows_for_csv: list[dict[str, Any]] | None = None
+            rows_for_csv: list[dict[str, Any]] | list[ColumnBatch] | None = None
+            resume_store: SqlKeysetResumeStore | None = None
+            file_manifest: FileManifestStore | None = None
+            file_doc_ids: list[str] = []
+            carried_doc_ids: set[str] = set()
             upsert_count = 0
             delete_count = 0
 
             if connector.spec.mode == "sql_pull":
-                pulled = extract_sql_rows(connector.spec.source, checkpoint)
-                watermark = pulled.watermark
+                source = connector.spec.source
+                if source.sql and source.sql.keyset_column:
+                    resume_store = SqlKeysetResumeStore(
+                        SessionLocal,
+                        connector_id,
+                        base_watermark=compact_checkpoint(checkpoint),
+                        source_fingerprint=keyset_source_fingerprint(source),
+                    )
+                    pulled = extract_sql_rows(source, checkpoint, resume_store=resume_store)
+                else:
+                    pulled = extract_sql_rows(source, checkpoint)
                 push_batch_id = None
                 if connector.spec.output.format == "csv":
-                    rows_for_csv = pulled.rows
+                    rows_for_csv = (
+                        list(pulled.rows.iter_chunks())
+                        if source.sql and source.sql.columnar
+                        else list(pulled.rows)
+                    )
+                    # Streamed row sources only know their watermark once fully consumed.
+                    watermark = _resumed_watermark(resume_store, pulled.watermark, checkpoint)
                 else:
                     if connector.spec.mapping is None:
                         raise ValueError(
                             "spec.mapping is required when spec.output.format is ndjson"
                         )
-                    docs = normalize_records(
-                        connector_id,
-                        connector.spec.mapping,
-                        connector.spec.source.watermark_field,
-                        pulled.rows,
-                    )
+                    source_rows = _project_row_stream(pulled.rows, connector.spec.mapping, source)
             elif connector.spec.mode == "rest_pull":
                 if connector.spec.mapping is None:
                     raise ValueError("spec.mapping is required when spec.output.format is ndjson")
-                pulled = extract_rest_rows(connector.spec.source, checkpoint)
-                docs = normalize_records(
-                    connector_id,
-                    connector.spec.mapping,
-                    connector.spec.source.watermark_field,
-                    pulled.rows,
+                extract_rest = (
+                    extract_rest_rows_pooled if settings.rest_async_engine else extract_rest_rows
                 )
-                watermark = pulled.watermark
+                pulled = extract_rest(connector.spec.source, checkpoint)
+                source_rows = pulled.rows
                 push_batch_id = None
             elif connector.spec.mode == "file_pull":
                 if connector.spec.mapping is None:
                     raise ValueError("spec.mapping is required when spec.output.format is ndjson")
-                pulled = extract_file_rows(connector.spec.source, checkpoint)
-                docs = normalize_records(
-                    connector_id,
-                    connector.spec.mapping,
-                    connector.spec.source.watermark_field,
-                    pulled.rows,
-                )
-                _ensure_unique_doc_ids(docs)
-                watermark = pulled.watermark
+                source = connector.spec.source
+                if source.skip_unchanged_files:
+                    file_manifest = FileManifestStore(
+                        session,
+                        connector_id,
+                        file_manifest_fingerprint(source, connector.spec.mapping),
+                    )
+                    pulled = extract_file_rows(source, checkpoint, known_files=file_manifest.load())
+                else:
+                    pulled = extract_file_rows(source, checkpoint)
+                source_rows = _project_row_stream(pulled.rows, connector.spec.mapping, source)
                 push_batch_id = None
             elif connector.spec.mode == "rest_push":
                 docs, push_batch_id = _consume_push_batch(session, connector_id, push_run_id)
@@ -257,14 +309,6 @@ def run_connector(connector_path: str, push_run_id: str | None = None) -> Pipeli
             else:
                 raise ValueError(f"Unsupported connector mode: {connector.spec.mode}")
 
-            if connector.spec.mode != "rest_push" and connector.spec.output.format != "csv":
-                upserts, deletes = compute_diffs(
-                    session,
-                    connector_id,
-                    docs,
-                    connector.spec.reconciliation.delete_policy,
-                )
-
             if connector.spec.output.format == "csv":
                 if rows_for_csv is None:
                     raise ValueError(
@@ -278,6 +322,51 @@ def run_connector(connector_path: str, push_run_id: str | None = None) -> Pipeli
                     watermark=watermark,
                     started_at=started_at,
                 )
+            elif source_rows is not None and connector.spec.mapping is not None:
+                diff = RecordStateDiff(
+                    session,
+                    connector_id,
+                    run_id,
+                    connector.spec.reconciliation.delete_policy,
+                    batch_size=settings.pipeline_batch_size,
+                )
+                watermark_field = connector.spec.source.watermark_field
+                # Rows whose source fingerprint is unchanged skip normalization.
+                changed_rows = diff.changed_rows(
+                    source_rows,
+                    RowFingerprinter(connector_id, connector.spec.mapping, watermark_field),
+                    doc_ids=file_doc_ids if file_manifest is not None else None,
+                )
+                docs_stream = iter_normalized_records(
+                    connector_id, connector.spec.mapping, watermark_field, changed_rows
+                )
+                with NdjsonArtifacts() as artifacts:
+                    # Rows flow through normalization, checksum comparison and the
+                    # NDJSON spool one batch at a time; record state is staged per batch.
+                    artifacts.add_upserts(diff.upserts(docs_stream))
+                    # Streamed row sources only know their watermark once fully consumed.
+                    watermark = _resumed_watermark(resume_store, pulled.watermark, checkpoint)
+                    if file_manifest is not None:
+                        carried_doc_ids = assign_file_doc_ids(
+                            pulled.file_entries or [], file_doc_ids
+                        )
+                    if connector.spec.mode == "file_pull":
+                        _ensure_unique_doc_ids(diff, carried_doc_ids)
+                    if resume_store is not None and resume_store.resumed:
+                        # Rows before the resume point were not seen by this run.
+                        deletes = []
+                    else:
+                        # Documents of unchanged files were not re-extracted but still exist.
+                        deletes = diff.deletes(keep=carried_doc_ids)
+                    artifacts.add_deletes(deletes)
+                    manifest = publish_ndjson_artifacts(
+                        connector_id=connector_id,
+                        output=connector.spec.output,
+                        run_id=run_id,
+                        artifacts=artifacts,
+                        watermark=watermark,
+                        started_at=started_at,
+                    )
             else:
                 manifest = publish_artifacts(
                     connector_id=connector_id,
@@ -300,14 +389,22 @@ def run_connector(connector_path: str, push_run_id: str | None = None) -> Pipeli
                 ingestion_client.import_documents(connector.spec.gemini, manifest)
                 ingestion_client.delete_documents(connector.spec.gemini, deletes)
 
-            if connector.spec.output.format != "csv":
+            if connector.spec.output.format == "csv":
+                upsert_count = _csv_row_count(rows_for_csv or [])
+                delete_count = 0
+            elif diff is not None:
+                diff.stage_deletes(deletes)
+                upsert_count = diff.upsert_count
+                delete_count = len(deletes)
+            else:
                 apply_record_state(session, connector_id, run_id, upserts, deletes)
                 upsert_count = len(upserts)
                 delete_count = len(deletes)
-            else:
-                upsert_count = len(rows_for_csv or [])
-                delete_count = 0
             _set_checkpoint(session, connector_id, watermark)
+            if resume_store is not None:
+                clear_resume_state(session, connector_id)
+            if file_manifest is not None:
+                file_manifest.save(pulled.file_entries or [], run_id)
             if connector.spec.mode == "rest_push" and push_batch_id:
                 _mark_push_batch_processed(session, connector_id, push_batch_id)
 
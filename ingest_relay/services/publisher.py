@@ -4,16 +4,24 @@ import base64
 import csv
 import io
 import json
+import tempfile
+from collections.abc import Iterable
 from datetime import UTC, datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, TextIO
 
 from ingest_relay.adapters.object_store import GCSObjectStore, LocalObjectStore, ObjectStore
+from ingest_relay.adapters.row_batches import ColumnBatch
 from ingest_relay.schemas import CanonicalDocument, OutputConfig, RunManifest
 from ingest_relay.utils.doc_ids import to_discovery_doc_id
 
 
+def _canonical_line(doc: CanonicalDocument) -> str:
+    return doc.model_dump_json()
+
+
 def _canonical_ndjson(docs: list[CanonicalDocument]) -> str:
-    return "\n".join(doc.model_dump_json() for doc in docs)
+    return "\n".join(_canonical_line(doc) for doc in docs)
 
 
 def _non_empty_content(doc: CanonicalDocument) -> str:
@@ -24,30 +32,82 @@ def _non_empty_content(doc: CanonicalDocument) -> str:
     return doc.doc_id
 
 
+def _discovery_line(doc: CanonicalDocument) -> str:
+    discovery_doc = {
+        "id": to_discovery_doc_id(doc.doc_id),
+        "structData": {
+            "doc_id": doc.doc_id,
+            "title": doc.title,
+            "uri": doc.uri,
+            "updated_at": doc.updated_at.isoformat(),
+            "acl_users": doc.acl_users,
+            "acl_groups": doc.acl_groups,
+            "metadata": doc.metadata,
+            "checksum": doc.checksum,
+        },
+        "content": {
+            "mimeType": doc.mime_type,
+            "rawBytes": base64.b64encode(_non_empty_content(doc).encode("utf-8")).decode("ascii"),
+        },
+    }
+    return json.dumps(discovery_doc, sort_keys=True, ensure_ascii=True)
+
+
 def _discovery_document_ndjson(docs: list[CanonicalDocument]) -> str:
-    lines: list[str] = []
-    for doc in docs:
-        discovery_doc = {
-            "id": to_discovery_doc_id(doc.doc_id),
-            "structData": {
-                "doc_id": doc.doc_id,
-                "title": doc.title,
-                "uri": doc.uri,
-                "updated_at": doc.updated_at.isoformat(),
-                "acl_users": doc.acl_users,
-                "acl_groups": doc.acl_groups,
-                "metadata": doc.metadata,
-                "checksum": doc.checksum,
-            },
-            "content": {
-                "mimeType": doc.mime_type,
-                "rawBytes": base64.b64encode(
-                    _non_empty_content(doc).encode("utf-8")
-                ).decode("ascii"),
-            },
-        }
-        lines.append(json.dumps(discovery_doc, sort_keys=True, ensure_ascii=True))
-    return "\n".join(lines)
+    return "\n".join(_discovery_line(doc) for doc in docs)
+
+
+class NdjsonArtifacts:
+    """A run's NDJSON artifacts, spooled to local files one document at a time.
+
+    Documents are serialized as they arrive, so callers can feed a generator
+    and hold no more than the document being written. Files match what
+    ``_canonical_ndjson`` and ``_discovery_document_ndjson`` produce for the
+    same documents. Use as a context manager; the files are removed on exit.
+    """
+
+    def __init__(self) -> None:
+        self._spool = tempfile.TemporaryDirectory(prefix="ingest-relay-artifacts-")
+        root = Path(self._spool.name)
+        self.upserts_path = root / "upserts.ndjson"
+        self.import_upserts_path = root / "upserts.discovery.ndjson"
+        self.deletes_path = root / "deletes.ndjson"
+        for path in (self.upserts_path, self.import_upserts_path, self.deletes_path):
+            path.touch()
+        self.upserts_count = 0
+        self.deletes_count = 0
+
+    def __enter__(self) -> NdjsonArtifacts:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._spool.cleanup()
+
+    @staticmethod
+    def _append(handle: TextIO, line: str, written: int) -> None:
+        # Newline-separated without a trailing newline, like the in-memory writers.
+        if written:
+            handle.write("\n")
+        handle.write(line)
+
+    def add_upserts(self, docs: Iterable[CanonicalDocument]) -> None:
+        with (
+            self.upserts_path.open("a", encoding="utf-8") as canonical,
+            self.import_upserts_path.open("a", encoding="utf-8") as discovery,
+        ):
+            for doc in docs:
+                self._append(canonical, _canonical_line(doc), self.upserts_count)
+                self._append(discovery, _discovery_line(doc), self.upserts_count)
+                self.upserts_count += 1
+
+    def add_deletes(self, docs: Iterable[CanonicalDocument]) -> None:
+        with self.deletes_path.open("a", encoding="utf-8") as canonical:
+            for doc in docs:
+                self._append(canonical, _canonical_line(doc), self.deletes_count)
+                self.deletes_count += 1
 
 
 def _build_uri(bucket: str, relative_path: str) -> str:
@@ -95,12 +155,57 @@ def _csv_snapshot(rows: list[dict[str, Any]]) -> str:
     return buffer.getvalue()
 
 
+def _csv_snapshot_from_batches(batches: list[ColumnBatch]) -> str:
+    headers: list[str] = []
+    seen: set[str] = set()
+    for batch in batches:
+        for name in batch.columns:
+            if name not in seen:
+                seen.add(name)
+                headers.append(name)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+    writer.writerow(headers)
+    for batch in batches:
+        size = len(batch)
+        cells = [
+            [_csv_cell(value) for value in batch.column(name)]
+            if batch.has_column(name)
+            else [""] * size
+            for name in headers
+        ]
+        writer.writerows(zip(*cells, strict=True))
+    return buffer.getvalue()
+
+
 def publish_artifacts(
     connector_id: str,
     output: OutputConfig,
     run_id: str,
-    upserts: list[CanonicalDocument],
-    deletes: list[CanonicalDocument],
+    upserts: Iterable[CanonicalDocument],
+    deletes: Iterable[CanonicalDocument],
+    watermark: str | None,
+    started_at: datetime,
+) -> RunManifest:
+    with NdjsonArtifacts() as artifacts:
+        artifacts.add_upserts(upserts)
+        artifacts.add_deletes(deletes)
+        return publish_ndjson_artifacts(
+            connector_id=connector_id,
+            output=output,
+            run_id=run_id,
+            artifacts=artifacts,
+            watermark=watermark,
+            started_at=started_at,
+        )
+
+
+def publish_ndjson_artifacts(
+    connector_id: str,
+    output: OutputConfig,
+    run_id: str,
+    artifacts: NdjsonArtifacts,
     watermark: str | None,
     started_at: datetime,
 ) -> RunManifest:
@@ -112,13 +217,13 @@ def publish_artifacts(
     manifest_uri = _build_uri(output.bucket, f"{run_prefix}/manifest.json")
 
     store = _build_store(output.bucket)
-    store.upload_text(upserts_uri, _canonical_ndjson(upserts), content_type="application/x-ndjson")
-    store.upload_text(
+    store.upload_file(upserts_uri, artifacts.upserts_path, content_type="application/x-ndjson")
+    store.upload_file(
         import_upserts_uri,
-        _discovery_document_ndjson(upserts),
+        artifacts.import_upserts_path,
         content_type="application/x-ndjson",
     )
-    store.upload_text(deletes_uri, _canonical_ndjson(deletes), content_type="application/x-ndjson")
+    store.upload_file(deletes_uri, artifacts.deletes_path, content_type="application/x-ndjson")
 
     manifest = RunManifest(
         run_id=run_id,
@@ -129,8 +234,8 @@ def publish_artifacts(
         upserts_path=upserts_uri,
         import_upserts_path=import_upserts_uri,
         deletes_path=deletes_uri,
-        upserts_count=len(upserts),
-        deletes_count=len(deletes),
+        upserts_count=artifacts.upserts_count,
+        deletes_count=artifacts.deletes_count,
         watermark=watermark,
     )
     store.upload_text(
@@ -150,19 +255,19 @@ def publish_artifacts(
         latest_deletes_uri = _build_uri(output.bucket, f"{latest_prefix}/deletes.ndjson")
         latest_manifest_uri = _build_uri(output.bucket, f"{latest_prefix}/manifest.json")
 
-        store.upload_text(
+        store.upload_file(
             latest_upserts_uri,
-            _canonical_ndjson(upserts),
+            artifacts.upserts_path,
             content_type="application/x-ndjson",
         )
-        store.upload_text(
+        store.upload_file(
             latest_import_upserts_uri,
-            _discovery_document_ndjson(upserts),
+            artifacts.import_upserts_path,
             content_type="application/x-ndjson",
         )
-        store.upload_text(
+        store.upload_file(
             latest_deletes_uri,
-            _canonical_ndjson(deletes),
+            artifacts.deletes_path,
             content_type="application/x-ndjson",
         )
 
@@ -197,7 +302,7 @@ def publish_csv_artifacts(
     connector_id: str,
     output: OutputConfig,
     run_id: str,
-    rows: list[dict[str, Any]],
+    rows: list[dict[str, Any]] | list[ColumnBatch],
     watermark: str | None,
     started_at: datetime,
 ) -> RunManifest:
@@ -206,7 +311,12 @@ def publish_csv_artifacts(
     csv_uri = _build_uri(output.bucket, f"{run_prefix}/rows.csv")
     manifest_uri = _build_uri(output.bucket, f"{run_prefix}/manifest.json")
 
-    csv_data = _csv_snapshot(rows)
+    if rows and isinstance(rows[0], ColumnBatch):
+        csv_data = _csv_snapshot_from_batches(rows)
+        row_count = sum(len(batch) for batch in rows)
+    else:
+        csv_data = _csv_snapshot(rows)
+        row_count = len(rows)
     store = _build_store(output.bucket)
     store.upload_text(csv_uri, csv_data, content_type="text/csv")
 
@@ -217,7 +327,7 @@ def publish_csv_artifacts(
         completed_at=datetime.now(tz=UTC),
         manifest_path=manifest_uri,
         csv_path=csv_uri,
-        upserts_count=len(rows),
+        upserts_count=row_count,
         deletes_count=0,
         watermark=watermark,
     )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from ingest_relay.models import ConnectorResumePoint
+from ingest_relay.schemas import SourceConfig
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"$td": [value.days, value.seconds, value.microseconds]}
+    if isinstance(value, UUID):
+        return {"$uuid": str(value)}
+    if isinstance(value, bytes):
+        return {"$b64": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Keyset values of type {type(value).__name__} cannot be stored for resume")
+
+
+def _decode_object(payload: dict[str, Any]) -> Any:
+    if len(payload) == 1:
+        ((tag, raw),) = payload.items()
+        if tag == "$dt":
+            return datetime.fromisoformat(raw)
+        if tag == "$date":
+            return date.fromisoformat(raw)
+        if tag == "$dec":
+            return Decimal(raw)
+        if tag == "$time":
+            return time.fromisoformat(raw)
+        if tag == "$td":
+            days, seconds, microseconds = raw
+            return timedelta(days=days, seconds=seconds, microseconds=microseconds)
+        if tag == "$uuid":
+            return UUID(raw)
+        if tag == "$b64":
+            return base64.b64decode(raw)
+    return payload
+
+
+def dumps_keyset_value(value: Any) -> str:
+    """Serialize a keyset value so it binds with its original Python type on resume."""
+    return json.dumps(value, default=_encode_value, ensure_ascii=True, separators=(",", ":"))
+
+
+def loads_keyset_value(encoded: str) -> Any:
+    return json.loads(encoded, object_hook=_decode_object)
+
+
+def keyset_source_fingerprint(source: SourceConfig) -> str:
+    keyset_column = source.sql.keyset_column if source.sql else None
+    encoded = json.dumps([source.query, keyset_column], ensure_ascii=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class KeysetResumeState:
+    last_key: Any
+    pages_committed: int
+
+
+class SqlKeysetResumeStore:
+    """Persists the keyset position of an in-flight sql_pull run next to its checkpoint.
+
+    After each fetched page only the last keyset value and the page count are
+    committed, never the rows. A restarted run continues after that key, and
+    ``resumed`` tells the pipeline that the rows before it were not read again.
+    A resume point is discarded when the checkpoint or the query changed since
+    it was written.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        connector_id: str,
+        base_watermark: str | None,
+        source_fingerprint: str,
+    ) -> None:
+        self.session_factory = session_factory
+        self.connector_id = connector_id
+        self.base_watermark = base_watermark
+        self.source_fingerprint = source_fingerprint
+        self.resumed: KeysetResumeState | None = None
+
+    def load(self) -> KeysetResumeState | None:
+        with self.session_factory() as session:
+            point = session.get(ConnectorResumePoint, self.connector_id)
+            if point is None:
+                return None
+            if (
+                point.base_watermark != self.base_watermark
+                or point.source_fingerprint != self.source_fingerprint
+            ):
+                clear_resume_state(session, self.connector_id)
+                session.commit()
+                return None
+            self.resumed = KeysetResumeState(
+                last_key=loads_keyset_value(point.keyset_value),
+                pages_committed=point.pages_committed,
+            )
+            return self.resumed
+
+    def commit_page(self, page_index: int, last_key: Any) -> None:
+        keyset_value = dumps_keyset_value(last_key)
+        with self.session_factory() as session:
+            point = session.get(ConnectorResumePoint, self.connector_id)
+            if point is None:
+                point = ConnectorResumePoint(connector_id=self.connector_id)
+                session.add(point)
+            point.base_watermark = self.base_watermark
+            point.source_fingerprint = self.source_fingerprint
+            point.keyset_value = keyset_value
+            point.pages_committed = page_index + 1
+            point.updated_at = datetime.now(tz=UTC)
+            session.commit()
+
+
+def clear_resume_state(session: Session, connector_id: str) -> None:
+    session.execute(
+        delete(ConnectorResumePoint).where(ConnectorResumePoint.connector_id == connector_id)
+    )
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from jinja2 import Environment, StrictUndefined, Template, TemplateError, meta
+from jinja2 import TemplateError
 from sqlalchemy import desc, select
 from sqlalchemy.orm import Session
 
@@ -17,6 +17,7 @@ from ingest_relay.models import ManualRunRequest, ProposalHistory, RunState
 from ingest_relay.schemas import CanonicalDocument, ConnectorConfig
 from ingest_relay.services.github_pr import GitHubPRService, build_branch_name
 from ingest_relay.services.secrets_registry import ManagedSecretsRegistry
+from ingest_relay.services.templates import compiled_template, template_variables
 from ingest_relay.settings import get_settings
 from ingest_relay.studio_schemas import (
     CatalogItem,
@@ -98,9 +99,22 @@ def _prune_incompatible_source_fields(spec: dict[str, Any]) -> dict[str, Any]:
             "glob",
             "format",
             "csv",
+            "skipUnchangedFiles",
+            "includePatterns",
+            "excludePatterns",
+            "shardCount",
+            "shardIndex",
+            "objectStore",
             "payload",
             "paginationCursorField",
             "paginationNextCursorJsonPath",
+            "paginationMode",
+            "paginationPageSize",
+            "paginationLimitParam",
+            "paginationConcurrency",
+            "paginationPrefetch",
+            "streamItems",
+            "maxRequestsPerSecond",
             "headers",
             "method",
             "oauth",
@@ -115,6 +129,13 @@ def _prune_incompatible_source_fields(spec: dict[str, Any]) -> dict[str, Any]:
         source.pop("glob", None)
         source.pop("format", None)
         source.pop("csv", None)
+        source.pop("skipUnchangedFiles", None)
+        source.pop("includePatterns", None)
+        source.pop("excludePatterns", None)
+        source.pop("shardCount", None)
+        source.pop("shardIndex", None)
+        source.pop("objectStore", None)
+        source.pop("sql", None)
         return spec
 
     if mode == "rest_push":
@@ -127,10 +148,24 @@ def _prune_incompatible_source_fields(spec: dict[str, Any]) -> dict[str, Any]:
             "glob",
             "format",
             "csv",
+            "skipUnchangedFiles",
+            "includePatterns",
+            "excludePatterns",
+            "shardCount",
+            "shardIndex",
+            "objectStore",
+            "sql",
             "method",
             "payload",
             "paginationCursorField",
             "paginationNextCursorJsonPath",
+            "paginationMode",
+            "paginationPageSize",
+            "paginationLimitParam",
+            "paginationConcurrency",
+            "paginationPrefetch",
+            "streamItems",
+            "maxRequestsPerSecond",
             "headers",
             "oauth",
         ):
@@ -139,23 +174,34 @@ def _prune_incompatible_source_fields(spec: dict[str, Any]) -> dict[str, Any]:
 
     if mode == "file_pull":
         source["type"] = "file"
-        source["format"] = "csv"
-        source.setdefault(
-            "csv",
-            {
-                "documentMode": "row",
-                "delimiter": ",",
-                "hasHeader": True,
-                "encoding": "utf-8",
-            },
-        )
+        source["format"] = source.get("format") or "csv"
+        if source["format"] == "csv":
+            source.setdefault(
+                "csv",
+                {
+                    "documentMode": "row",
+                    "delimiter": ",",
+                    "hasHeader": True,
+                    "encoding": "utf-8",
+                },
+            )
+        else:
+            source.pop("csv", None)
         for key in (
             "query",
+            "sql",
             "url",
             "method",
             "payload",
             "paginationCursorField",
             "paginationNextCursorJsonPath",
+            "paginationMode",
+            "paginationPageSize",
+            "paginationLimitParam",
+            "paginationConcurrency",
+            "paginationPrefetch",
+            "streamItems",
+            "maxRequestsPerSecond",
             "headers",
             "oauth",
         ):
@@ -258,22 +304,16 @@ def preview_connector_draft(
     row.setdefault("body", "Sample body")
     row.setdefault(watermark_field, "2026-02-16T08:30:00Z")
 
-    template_env = Environment()
     content_template_text = mapping.get("contentTemplate", "{{ title }}")
-    content_ast = template_env.parse(content_template_text)
-    for variable in sorted(meta.find_undeclared_variables(content_ast)):
+    for variable in sorted(template_variables(content_template_text)):
         row.setdefault(variable, f"sample-{variable}")
 
     uri_template = mapping.get("uriTemplate")
     if uri_template:
-        uri_ast = template_env.parse(uri_template)
-        for variable in sorted(meta.find_undeclared_variables(uri_ast)):
+        for variable in sorted(template_variables(uri_template)):
             row.setdefault(variable, f"sample-{variable}")
 
-    content_template = Template(
-        content_template_text,
-        undefined=StrictUndefined,
-    )
+    content_template = compiled_template(content_template_text)
     try:
         content = content_template.render(**row)
     except TemplateError as exc:
@@ -282,7 +322,7 @@ def preview_connector_draft(
     uri = None
     if uri_template:
         try:
-            uri = Template(uri_template, undefined=StrictUndefined).render(**row)
+            uri = compiled_template(uri_template).render(**row)
         except TemplateError as exc:
             raise ValueError(f"Unable to render URI template: {exc}") from exc
 
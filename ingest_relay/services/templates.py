@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    StrictUndefined,
+    Template,
+    meta,
+)
+from jinja2 import Undefined as JinjaUndefined
+
+from ingest_relay.settings import get_settings
+
+
+class TemplateCache:
+    """Process-wide LRU of compiled mapping templates.
+
+    Entries are keyed by template text and undefined policy, so every
+    connector run and Studio preview that uses the same mapping shares one
+    compiled ``Template``. With ``bytecode_dir`` the compiled code is also
+    written to disk, and a fresh worker process loads it from there instead
+    of parsing and compiling the template again.
+    """
+
+    def __init__(self, max_entries: int = 256, bytecode_dir: str | Path | None = None) -> None:
+        self.max_entries = max_entries
+        self._bytecode_cache: BytecodeCache | None = None
+        if bytecode_dir:
+            Path(bytecode_dir).mkdir(parents=True, exist_ok=True)
+            self._bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+        self._environments: dict[type[JinjaUndefined], Environment] = {}
+        self._templates: OrderedDict[tuple[type[JinjaUndefined], str], Template] = OrderedDict()
+        self._variables: OrderedDict[str, frozenset[str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _environment(self, undefined: type[JinjaUndefined]) -> Environment:
+        environment = self._environments.get(undefined)
+        if environment is None:
+            # Same defaults as ``Template(source, undefined=...)``.
+            environment = Environment(undefined=undefined, bytecode_cache=self._bytecode_cache)
+            self._environments[undefined] = environment
+        return environment
+
+    def get(self, source: str, *, undefined: type[JinjaUndefined] = StrictUndefined) -> Template:
+        """Return the compiled template for ``source``, compiling it on first use."""
+        key = (undefined, source)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+            self.misses += 1
+            environment = self._environment(undefined)
+        # Compiled outside the lock; a concurrent miss compiles twice at worst.
+        template = self._compile(environment, source)
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_entries:
+                self._templates.popitem(last=False)
+        return template
+
+    def _compile(self, environment: Environment, source: str) -> Template:
+        bytecode_cache = environment.bytecode_cache
+        if bytecode_cache is None:
+            return environment.from_string(source)
+        # ``from_string`` bypasses bytecode caches, which only loaders consult;
+        # this is the bucket round trip of ``BaseLoader.load``.
+        name = f"mapping-{hashlib.sha256(source.encode('utf-8')).hexdigest()}"
+        bucket = bytecode_cache.get_bucket(environment, name, None, source)
+        code = bucket.code
+        if code is None:
+            code = environment.compile(source, name)
+            bucket.code = code
+            bytecode_cache.set_bucket(bucket)
+        return environment.template_class.from_code(
+            environment, code, environment.make_globals(None)
+        )
+
+    def variables(self, source: str) -> frozenset[str]:
+        """Undeclared variables of ``source``, i.e. the record fields it reads."""
+        with self._lock:
+            found = self._variables.get(source)
+            if found is not None:
+                self._variables.move_to_end(source)
+                return found
+            environment = self._environment(StrictUndefined)
+        found = frozenset(meta.find_undeclared_variables(environment.parse(source)))
+        with self._lock:
+            self._variables[source] = found
+            while len(self._variables) > self.max_entries:
+                self._variables.popitem(last=False)
+        return found
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._variables.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+@lru_cache(maxsize=1)
+def get_template_cache() -> TemplateCache:
+    settings = get_settings()
+    return TemplateCache(
+        max_entries=settings.template_cache_size,
+        bytecode_dir=settings.template_bytecode_cache_dir or None,
+    )
+
+
+def compiled_template(
+    source: str, *, undefined: type[JinjaUndefined] = StrictUndefined
+) -> Template:
+    return get_template_cache().get(source, undefined=undefined)
+
+
+def template_variables(source: str) -> frozenset[str]:
+    return get_template_cache().variables(source)
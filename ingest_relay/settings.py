@@ -29,6 +29,22 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     max_retries: int = Field(default=3, alias="MAX_RETRIES")
     retry_backoff_seconds: float = Field(default=2.0, alias="RETRY_BACKOFF_SECONDS")
+    sql_pool_size: int = Field(default=5, alias="SQL_POOL_SIZE")
+    sql_pool_max_overflow: int = Field(default=5, alias="SQL_POOL_MAX_OVERFLOW")
+    sql_pool_pre_ping: bool = Field(default=True, alias="SQL_POOL_PRE_PING")
+    sql_pool_recycle_seconds: int = Field(default=1800, alias="SQL_POOL_RECYCLE_SECONDS")
+    sql_engine_idle_seconds: float = Field(default=900.0, alias="SQL_ENGINE_IDLE_SECONDS")
+    rest_async_engine: bool = Field(default=False, alias="REST_ASYNC_ENGINE")
+    rest_http2: bool = Field(default=True, alias="REST_HTTP2")
+    rest_max_connections_per_host: int = Field(default=20, alias="REST_MAX_CONNECTIONS_PER_HOST")
+    rest_keepalive_expiry_seconds: float = Field(
+        default=30.0, alias="REST_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    oauth_token_refresh_seconds: float = Field(default=30.0, alias="OAUTH_TOKEN_REFRESH_SECONDS")
+    oauth_token_cache_persist: bool = Field(default=False, alias="OAUTH_TOKEN_CACHE_PERSIST")
+    pipeline_batch_size: int = Field(default=1000, alias="PIPELINE_BATCH_SIZE")
+    template_cache_size: int = Field(default=256, alias="TEMPLATE_CACHE_SIZE")
+    template_bytecode_cache_dir: str = Field(default="", alias="TEMPLATE_BYTECODE_CACHE_DIR")
 
 
 @lru_cache(maxsize=1)
@@ -1,11 +1,128 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import importlib.util
+import threading
+from collections.abc import Coroutine
+from functools import lru_cache
+from typing import Any, TypeVar
 
 import httpx
 
+from ingest_relay.settings import get_settings
+
+T = TypeVar("T")
+
 
 def create_httpx_client(**kwargs: Any) -> httpx.Client:
     """Create outbound HTTPX clients with explicit env-based proxy/CA support."""
     kwargs["trust_env"] = True
     return httpx.Client(**kwargs)
+
+
+def create_async_httpx_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Async counterpart of ``create_httpx_client`` with the same proxy/CA handling."""
+    kwargs["trust_env"] = True
+    return httpx.AsyncClient(**kwargs)
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _origin(url: str) -> str:
+    parsed = httpx.URL(url)
+    return f"{parsed.scheme}://{parsed.netloc.decode('ascii')}"
+
+
+class AsyncHttpClientPool:
+    """Keep-alive ``httpx.AsyncClient`` instances shared per origin.
+
+    All clients live on one event loop running in a daemon thread, so
+    synchronous callers (scheduled runs, API background tasks) can submit
+    coroutines with ``run`` and connectors that hit the same host reuse the
+    same HTTP/2 connections across runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        max_connections_per_host: int = 20,
+        keepalive_expiry_seconds: float = 30.0,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        self.http2 = http2 and http2_available()
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_expiry_seconds = keepalive_expiry_seconds
+        self.timeout_seconds = timeout_seconds
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="async-http-pool", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the pool's event loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        key = _origin(url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = create_async_httpx_client(
+                    http2=self.http2,
+                    timeout=self.timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections_per_host,
+                        max_keepalive_connections=self.max_connections_per_host,
+                        keepalive_expiry=self.keepalive_expiry_seconds,
+                    ),
+                )
+                self._clients[key] = client
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        for client in clients:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+@lru_cache(maxsize=1)
+def get_async_client_pool() -> AsyncHttpClientPool:
+    settings = get_settings()
+    return AsyncHttpClientPool(
+        http2=settings.rest_http2,
+        max_connections_per_host=settings.rest_max_connections_per_host,
+        keepalive_expiry_seconds=settings.rest_keepalive_expiry_seconds,
+    )
+
+
+def close_async_client_pool() -> None:
+    if get_async_client_pool.cache_info().currsize:
+        get_async_client_pool().close()
+        get_async_client_pool.cache_clear()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+_LOCK = threading.Lock()
+
+
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool with ``max_workers`` workers.
+
+    Pools are created on first use and kept for the life of the process so
+    scheduled runs do not pay worker start-up on every run. Workers use the
+    ``spawn`` start method: the API process runs threads (scheduler, HTTP
+    pool loop) that must not be forked mid-flight.
+    """
+    with _LOCK:
+        pool = _POOLS.get(max_workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _POOLS[max_workers] = pool
+        return pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool after ``BrokenProcessPool`` so the next caller gets a fresh one."""
+    with _LOCK:
+        for key, candidate in list(_POOLS.items()):
+            if candidate is pool:
+                del _POOLS[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def close_process_pools() -> None:
+    with _LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import re
+import time
+import unicodedata
+from typing import Any
+
+from ingest_relay.adapters.extractors import _csv_rows_from_content
+
+_ERROR_PATTERN = re.compile(r"^#ERROR\b")
+
+
+def _baseline_rows(content: str) -> list[dict[str, Any]]:
+    """Per-row DictReader path that the compiled CSV plan replaced."""
+
+    def normalize(name: str) -> str:
+        ascii_str = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+        return re.sub(r"[^a-zA-Z0-9]+", "_", ascii_str).strip("_").lower()
+
+    rows: list[dict[str, Any]] = []
+    header_map: dict[str, str] | None = None
+    for raw_row in csv.DictReader(io.StringIO(content)):
+        if header_map is None:
+            header_map = {key: normalize(key) for key in raw_row}
+        row = {header_map[key]: value for key, value in raw_row.items()}
+        rows.append(
+            {
+                key: "" if isinstance(value, str) and _ERROR_PATTERN.match(value) else value
+                for key, value in row.items()
+            }
+        )
+    return rows
+
+
+def _best_of(repeat: int, func: Any) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark for CSV parsing with normalizeHeaders and cleanErrors"
+    )
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-speedup", type=float, default=1.5)
+    args = parser.parse_args()
+
+    header = ",".join(f"Spalte Größe {idx}" for idx in range(args.columns))
+    lines = [header]
+    for row in range(args.rows):
+        lines.append(
+            ",".join(
+                "#ERROR div/0" if (row + col) % 97 == 0 else f"value {row}-{col}"
+                for col in range(args.columns)
+            )
+        )
+    content = "\n".join(lines) + "\n"
+
+    def compiled() -> list[dict[str, Any]]:
+        return _csv_rows_from_content(
+            content=content,
+            has_header=True,
+            delimiter=",",
+            normalize_headers=True,
+            clean_errors=True,
+        )
+
+    if compiled() != _baseline_rows(content):
+        print("compiled plan rows differ from the baseline")
+        return 1
+
+    baseline_seconds = _best_of(args.repeat, lambda: _baseline_rows(content))
+    compiled_seconds = _best_of(args.repeat, compiled)
+    speedup = baseline_seconds / compiled_seconds
+
+    payload = {
+        "rows": args.rows,
+        "columns": args.columns,
+        "baseline_seconds": baseline_seconds,
+        "compiled_seconds": compiled_seconds,
+        "speedup": speedup,
+        "min_speedup": args.min_speedup,
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+
+    return 0 if speedup >= args.min_speedup else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
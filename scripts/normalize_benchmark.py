@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any
+
+from ingest_relay.schemas import MappingConfig
+from ingest_relay.services.normalizer import normalize_records
+from ingest_relay.utils.process_pools import close_process_pools
+
+
+def _mapping(workers: int) -> MappingConfig:
+    return MappingConfig(
+        idField="id",
+        titleField="title",
+        contentTemplate="{{ title }}\n{{ department }} / {{ role }}\n{{ body }}",
+        uriTemplate="https://docs.local/{{ department }}/{{ id }}",
+        aclUsersField="owners",
+        metadataFields=["department", "role"],
+        normalizeWorkers=workers,
+    )
+
+
+def _best_of(repeat: int, func: Any) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark serial and process-pool normalization (mapping.normalizeWorkers)"
+    )
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-speedup", type=float, default=0.0)
+    args = parser.parse_args()
+
+    rows = [
+        {
+            "id": index,
+            "title": f"Document {index}",
+            "department": f"dept-{index % 37}",
+            "role": f"role-{index % 11}",
+            "body": f"Body text for record {index}. " * 8,
+            "owners": [f"user{index % 101}@example.com"],
+            "updated_at": "2026-02-16T08:30:00Z",
+        }
+        for index in range(args.rows)
+    ]
+
+    def run(workers: int) -> list[Any]:
+        return normalize_records("benchmark", _mapping(workers), "updated_at", rows)
+
+    try:
+        if [doc.checksum for doc in run(1)] != [doc.checksum for doc in run(args.workers)]:
+            print("parallel documents differ from the serial normalizer")
+            return 1
+        serial_seconds = _best_of(args.repeat, lambda: run(1))
+        parallel_seconds = _best_of(args.repeat, lambda: run(args.workers))
+    finally:
+        close_process_pools()
+    speedup = serial_seconds / parallel_seconds
+
+    payload = {
+        "rows": args.rows,
+        "workers": args.workers,
+        "serial_seconds": serial_seconds,
+        "parallel_seconds": parallel_seconds,
+        "speedup": speedup,
+        "min_speedup": args.min_speedup,
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+
+    return 0 if speedup >= args.min_speedup else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from ingest_relay.adapters.oauth_tokens import get_oauth_token_cache
 from ingest_relay.api import app
 from ingest_relay.db import get_session
 from ingest_relay.models import Base
@@ -42,3 +43,11 @@ def client(db_session_factory):
         yield test_client
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_oauth_token_cache():
+    # Tokens are cached process-wide; keep them from leaking between tests.
+    get_oauth_token_cache.cache_clear()
+    yield
+    get_oauth_token_cache.cache_clear()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+
+from ingest_relay.models import ConnectorCheckpoint, ConnectorCheckpointPayload
+from ingest_relay.services.checkpoint_store import (
+    compact_checkpoint,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+
+def test_short_checkpoints_stay_inline(db_session_factory) -> None:
+    with db_session_factory() as session:
+        save_checkpoint(session, "hr-files", "2026-02-16T10:00:00+00:00")
+        session.commit()
+
+    with db_session_factory() as session:
+        assert session.get(ConnectorCheckpoint, "hr-files").watermark == (
+            "2026-02-16T10:00:00+00:00"
+        )
+        assert session.get(ConnectorCheckpointPayload, "hr-files") is None
+        assert load_checkpoint(session, "hr-files") == "2026-02-16T10:00:00+00:00"
+
+
+def test_long_checkpoints_are_stored_by_reference(db_session_factory) -> None:
+    watermark = json.dumps({"v": 1, "rw": "x" * 400, "fc": 3})
+    with db_session_factory() as session:
+        save_checkpoint(session, "hr-files", watermark)
+        session.commit()
+
+    with db_session_factory() as session:
+        stored = session.get(ConnectorCheckpoint, "hr-files").watermark
+        assert len(stored) <= 255
+        assert stored == compact_checkpoint(watermark)
+        assert json.loads(stored)["v"] == 2
+        assert load_checkpoint(session, "hr-files") == watermark
+
+        # Going back to a short checkpoint drops the payload row.
+        save_checkpoint(session, "hr-files", "short")
+        session.commit()
+        assert session.get(ConnectorCheckpointPayload, "hr-files") is None
+        assert load_checkpoint(session, "hr-files") == "short"
+
+
+def test_reference_without_matching_payload_loads_as_no_checkpoint(db_session_factory) -> None:
+    with db_session_factory() as session:
+        save_checkpoint(session, "hr-files", "y" * 300)
+        session.commit()
+        session.get(ConnectorCheckpointPayload, "hr-files").payload_hash = "sha256:other"
+        session.commit()
+
+        assert load_checkpoint(session, "hr-files") is None
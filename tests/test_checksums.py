@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from datetime import UTC, datetime
+
+import pytest
+
+from ingest_relay.models import RecordState
+from ingest_relay.schemas import CanonicalDocument, MappingConfig
+from ingest_relay.services.checksums import (
+    ChecksumError,
+    checksum_matches,
+    checksum_payload,
+    document_checksum,
+    legacy_checksum,
+    source_fingerprint,
+)
+from ingest_relay.services.diff_engine import RecordStateDiff
+from ingest_relay.services.normalizer import normalize_records
+
+
+def _doc(algorithm: str = "sha256", content: str = "Engineering Manager") -> CanonicalDocument:
+    mapping = MappingConfig(
+        idField="employee_id",
+        titleField="full_name",
+        contentTemplate="{{ body }}",
+        uriTemplate="https://hr.local/{{ employee_id }}",
+        aclUsersField="allowed_users",
+        metadataFields=["department"],
+        checksumAlgorithm=algorithm,
+    )
+    row = {
+        "employee_id": 123,
+        "full_name": "Jane Doe",
+        "body": content,
+        "department": "Engineering",
+        "allowed_users": ["jane@example.com"],
+    }
+    return normalize_records("hr-employees", mapping, None, [row])[0]
+
+
+def test_legacy_checksum_matches_previous_normalizer_output() -> None:
+    doc = _doc()
+    payload = {
+        "doc_id": "hr-employees:123",
+        "title": "Jane Doe",
+        "content": "Engineering Manager",
+        "uri": "https://hr.local/123",
+        "mime_type": "text/plain",
+        "metadata": {"connector_id": "hr-employees", "department": "Engineering"},
+        "acl_users": ["jane@example.com"],
+        "acl_groups": [],
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+
+    assert legacy_checksum(checksum_payload(doc)) == (
+        f"sha256:{hashlib.sha256(encoded).hexdigest()}"
+    )
+
+
+def test_document_checksum_separates_fields() -> None:
+    payload = checksum_payload(_doc())
+
+    shifted = {**payload, "title": payload["title"] + "E", "content": payload["content"][1:]}
+    empty_uri = {**payload, "uri": ""}
+    no_uri = {**payload, "uri": None}
+
+    checksums = {
+        document_checksum(candidate, "sha256")
+        for candidate in (payload, shifted, empty_uri, no_uri)
+    }
+    assert len(checksums) == 4
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake2b"])
+def test_document_checksum_is_versioned_per_algorithm(algorithm: str) -> None:
+    doc = _doc(algorithm)
+
+    assert doc.checksum.startswith(f"v2:{algorithm}:")
+    assert doc.checksum == document_checksum(checksum_payload(doc), algorithm)
+
+
+def test_optional_checksum_algorithms_report_missing_packages(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "blake3", None)
+    monkeypatch.setitem(sys.modules, "xxhash", None)
+
+    with pytest.raises(ChecksumError, match="ingest-relay\\[fasthash\\]"):
+        _doc("blake3")
+    with pytest.raises(ChecksumError, match="xxh3_128 requires"):
+        _doc("xxh3_128")
+
+
+def test_checksum_matches_across_schemes_but_not_content_changes() -> None:
+    doc = _doc("blake2b")
+    payload = checksum_payload(doc)
+
+    assert checksum_matches(legacy_checksum(payload), doc)
+    assert checksum_matches(document_checksum(payload, "sha256"), doc)
+    changed = checksum_payload(_doc("blake2b", content="Engineering Director"))
+    assert not checksum_matches(legacy_checksum(changed), doc)
+    assert not checksum_matches(document_checksum(changed, "blake2b"), doc)
+    assert not checksum_matches("v9:sha256:abc", doc)
+
+
+def test_record_state_diff_restamps_legacy_checksums_without_upserting(
+    db_session_factory,
+) -> None:
+    unchanged = _doc()
+    changed = _doc(content="Engineering Director").model_copy(update={"doc_id": "hr-employees:456"})
+    session = db_session_factory()
+    try:
+        for doc_id, payload in (
+            (unchanged.doc_id, checksum_payload(unchanged)),
+            (changed.doc_id, {**checksum_payload(changed), "content": "old"}),
+        ):
+            session.add(
+                RecordState(
+                    connector_id="hr-employees",
+                    doc_id=doc_id,
+                    checksum=legacy_checksum(payload),
+                    source_updated_at=datetime.now(tz=UTC),
+                    last_seen_run_id="run-old",
+                )
+            )
+        session.commit()
+
+        diff = RecordStateDiff(session, "hr-employees", "run-new", "auto_delete_missing")
+        upserts = list(diff.upserts([unchanged, changed]))
+        session.commit()
+
+        assert [doc.doc_id for doc in upserts] == [changed.doc_id]
+        assert diff.restamp_count == 1
+        stored = {row.doc_id: row for row in session.query(RecordState).all()}
+        assert stored[unchanged.doc_id].checksum == unchanged.checksum
+        assert stored[unchanged.doc_id].last_seen_run_id == "run-old"
+        assert stored[changed.doc_id].checksum == changed.checksum
+    finally:
+        session.close()
+
+
+def test_source_fingerprint_separates_types_and_missing_fields() -> None:
+    fields = ["id", "note", "when"]
+    when = datetime(2026, 2, 16, tzinfo=UTC)
+    rows = [
+        {"id": 1, "note": None, "when": when},
+        {"id": "1", "note": None, "when": when},
+        {"id": 1, "when": when},
+        {"id": 1, "note": "", "when": when},
+        {"id": 1, "note": None, "when": when.replace(hour=1)},
+    ]
+
+    fingerprints = {source_fingerprint("mapping-v1", fields, row) for row in rows}
+
+    assert len(fingerprints) == len(rows)
+    assert source_fingerprint("mapping-v1", fields, {**rows[0], "unread": "x"}) in fingerprints
+    assert source_fingerprint("mapping-v2", fields, rows[0]) not in fingerprints
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import tracemalloc
 from datetime import UTC, datetime
 
+from ingest_relay.adapters.extractors import MappedFileText
 from ingest_relay.models import RecordState
-from ingest_relay.schemas import CanonicalDocument
-from ingest_relay.services.diff_engine import compute_diffs
+from ingest_relay.schemas import CanonicalDocument, MappingConfig
+from ingest_relay.services.diff_engine import RecordStateDiff, compute_diffs
+from ingest_relay.services.normalizer import (
+    RowFingerprinter,
+    iter_normalized_records,
+    normalize_records,
+)
 
 
 def test_compute_diffs_detects_updates_and_deletes(db_session_factory) -> None:
@@ -71,3 +78,189 @@ def test_compute_diffs_detects_updates_and_deletes(db_session_factory) -> None:
         assert all(doc.op == "DELETE" for doc in deletes)
     finally:
         session.close()
+
+
+def _doc(doc_id: str, checksum: str) -> CanonicalDocument:
+    return CanonicalDocument(
+        doc_id=doc_id,
+        title=doc_id,
+        content=doc_id,
+        uri=None,
+        mime_type="text/plain",
+        updated_at=datetime.now(tz=UTC),
+        acl_users=[],
+        acl_groups=[],
+        metadata={"connector_id": "hr-employees"},
+        checksum=checksum,
+        op="UPSERT",
+    )
+
+
+def test_record_state_diff_streams_batches_and_stages_record_state(db_session_factory) -> None:
+    session = db_session_factory()
+    try:
+        for doc_id, checksum in (("same", "sha256:same"), ("changed", "sha256:v1"), ("gone", "x")):
+            session.add(
+                RecordState(
+                    connector_id="hr-employees",
+                    doc_id=f"hr-employees:{doc_id}",
+                    checksum=checksum,
+                    source_updated_at=datetime.now(tz=UTC),
+                    last_seen_run_id="run-old",
+                )
+            )
+        session.add(
+            RecordState(
+                connector_id="hr-employees",
+                doc_id="hr-employees:carried",
+                checksum="sha256:carried",
+                source_updated_at=datetime.now(tz=UTC),
+                last_seen_run_id="run-old",
+            )
+        )
+        session.commit()
+
+        pulled: list[str] = []
+
+        def stream():
+            for doc in (
+                _doc("hr-employees:same", "sha256:same"),
+                _doc("hr-employees:changed", "sha256:v2"),
+                _doc("hr-employees:new", "sha256:new"),
+            ):
+                pulled.append(doc.doc_id)
+                yield doc
+
+        diff = RecordStateDiff(
+            session, "hr-employees", "run-new", "auto_delete_missing", batch_size=2
+        )
+        upserts = diff.upserts(stream())
+
+        assert next(upserts).doc_id == "hr-employees:changed"
+        # Only the first batch has been pulled from the source.
+        assert len(pulled) == 2
+        assert [doc.doc_id for doc in upserts] == ["hr-employees:new"]
+        assert diff.upsert_count == 2
+
+        deletes = diff.deletes(keep={"hr-employees:carried"})
+        assert [doc.doc_id for doc in deletes] == ["hr-employees:gone"]
+        diff.stage_deletes(deletes)
+        session.commit()
+
+        stored = {
+            row.doc_id: (row.checksum, row.last_seen_run_id)
+            for row in session.query(RecordState).all()
+        }
+        assert stored == {
+            "hr-employees:same": ("sha256:same", "run-old"),
+            "hr-employees:changed": ("sha256:v2", "run-new"),
+            "hr-employees:new": ("sha256:new", "run-new"),
+            "hr-employees:carried": ("sha256:carried", "run-old"),
+        }
+    finally:
+        session.close()
+
+
+def test_record_state_diff_skips_rows_with_unchanged_source_fingerprints(
+    db_session_factory,
+) -> None:
+    mapping = MappingConfig(idField="id", titleField="title", contentTemplate="{{ body }}")
+    fingerprinter = RowFingerprinter("hr-employees", mapping, None)
+    rows = [{"id": index, "title": f"Doc {index}", "body": "b"} for index in range(4)]
+    session = db_session_factory()
+    try:
+        first = RecordStateDiff(session, "hr-employees", "run-1", "auto_delete_missing")
+        docs = iter_normalized_records(
+            "hr-employees", mapping, None, first.changed_rows(rows, fingerprinter)
+        )
+        assert len(list(first.upserts(docs))) == 4
+        session.commit()
+
+        rows[2] = {**rows[2], "body": "changed"}
+        rendered: list[int] = []
+        doc_ids: list[str] = []
+        second = RecordStateDiff(
+            session, "hr-employees", "run-2", "auto_delete_missing", batch_size=3
+        )
+
+        def rendering(changed_rows):
+            for row in changed_rows:
+                rendered.append(row["id"])
+                yield row
+
+        changed = second.changed_rows(rows[:3], fingerprinter, doc_ids=doc_ids)
+        docs = iter_normalized_records("hr-employees", mapping, None, rendering(changed))
+
+        assert [doc.doc_id for doc in second.upserts(docs)] == ["hr-employees:2"]
+        assert rendered == [2]
+        assert second.unchanged_row_count == 2
+        assert doc_ids == ["hr-employees:0", "hr-employees:1", "hr-employees:2"]
+        assert [doc.doc_id for doc in second.deletes()] == ["hr-employees:3"]
+        session.commit()
+
+        stored = {row.doc_id: row for row in session.query(RecordState).all()}
+        assert stored["hr-employees:2"].source_fingerprint == fingerprinter.key(rows[2])[1]
+        assert stored["hr-employees:0"].last_seen_run_id == "run-1"
+    finally:
+        session.close()
+
+
+def test_record_state_diff_stamps_fingerprints_of_unchanged_documents(
+    db_session_factory,
+) -> None:
+    mapping = MappingConfig(idField="id", titleField="title", contentTemplate="{{ body }}")
+    fingerprinter = RowFingerprinter("hr-employees", mapping, None)
+    rows = [{"id": 1, "title": "Doc", "body": "b"}]
+    session = db_session_factory()
+    try:
+        # Record state written before fingerprints existed.
+        legacy = RecordStateDiff(session, "hr-employees", "run-1", "auto_delete_missing")
+        list(legacy.upserts(normalize_records("hr-employees", mapping, None, rows)))
+        session.commit()
+
+        diff = RecordStateDiff(session, "hr-employees", "run-2", "auto_delete_missing")
+        docs = iter_normalized_records(
+            "hr-employees", mapping, None, diff.changed_rows(rows, fingerprinter)
+        )
+        assert list(diff.upserts(docs)) == []
+        assert diff.restamp_count == 1
+        session.commit()
+
+        diff = RecordStateDiff(session, "hr-employees", "run-3", "auto_delete_missing")
+        assert list(diff.changed_rows(rows, fingerprinter)) == []
+        assert diff.unchanged_row_count == 1
+    finally:
+        session.close()
+
+
+def test_record_state_diff_fingerprints_lazy_file_content_without_loading_it(
+    db_session_factory, tmp_path
+) -> None:
+    mapping = MappingConfig(
+        idField="file_name", titleField="file_name", contentTemplate="{{ file_content_raw }}"
+    )
+    fingerprinter = RowFingerprinter("files", mapping, None)
+    rows = []
+    for index in range(20):
+        path = tmp_path / f"{index}.csv"
+        path.write_text(f"{index}," + "x" * 1_000_000)
+        rows.append({"file_name": path.name, "file_content_raw": MappedFileText(path, "utf-8")})
+    session = db_session_factory()
+    try:
+        diff = RecordStateDiff(session, "files", "run-1", "auto_delete_missing")
+
+        tracemalloc.start()
+        try:
+            changed = list(diff.changed_rows(rows, fingerprinter))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert [row["file_content_raw"] for row in changed] == [
+            row["file_content_raw"] for row in rows
+        ]
+        assert all(isinstance(row["file_content_raw"], MappedFileText) for row in changed)
+        # Far below the 20 MB the batch would hold with its contents loaded.
+        assert peak < 2_000_000
+    finally:
+        session.close()
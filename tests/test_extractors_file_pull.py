@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import bz2
+import gzip
 import json
+import os
+import sys
 from pathlib import Path
 
 import pytest
 
 from ingest_relay.adapters import extractors
 from ingest_relay.schemas import SourceConfig
+from ingest_relay.utils.process_pools import close_process_pools
 
 
 def _file_source(
@@ -20,6 +25,10 @@ def _file_source(
     watermark_field: str | None = "updated_at",
     normalize_headers: bool = False,
     clean_errors: bool = False,
+    columnar: bool = False,
+    stream_rows: bool = False,
+    parse_workers: int = 1,
+    lazy_content: bool = False,
 ) -> SourceConfig:
     return SourceConfig(
         type="file",
@@ -34,6 +43,11 @@ def _file_source(
             "encoding": encoding,
             "normalizeHeaders": normalize_headers,
             "cleanErrors": clean_errors,
+            "columnar": columnar,
+            "streamRows": stream_rows,
+            "bufferSize": 4096,
+            "parseWorkers": parse_workers,
+            "lazyContent": lazy_content,
         },
     )
 
@@ -150,14 +164,112 @@ def test_extract_file_rows_checkpoint_fallback_accepts_v1_checkpoint_json(tmp_pa
     assert checkpoint["rw"] == "2026-02-03T00:00:00+00:00"
 
 
-def test_extract_file_rows_rejects_recursive_glob(tmp_path) -> None:
+def _write_tree(root: Path, relative_paths: list[str]) -> None:
+    for relative_path in relative_paths:
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("id,name\n1,Ada\n", encoding="utf-8")
+
+
+def test_extract_file_rows_walks_recursive_glob_with_include_and_exclude(
+    tmp_path, monkeypatch
+) -> None:
     source_dir = tmp_path / "source"
-    source_dir.mkdir()
-    (source_dir / "employees.csv").write_text("id,name\n1,Ada\n", encoding="utf-8")
+    _write_tree(
+        source_dir,
+        [
+            "top.csv",
+            "2026/01/a.csv",
+            "2026/01/notes.txt",
+            "2026/02/b.csv",
+            "2026/02/tmp/partial.csv",
+            "archive/old.csv",
+        ],
+    )
+    source = _file_source(path=str(source_dir), glob="**/*.csv", watermark_field=None)
+    source = source.model_copy(
+        update={"include_patterns": ["2026/**", "*.csv"], "exclude_patterns": ["**/tmp"]}
+    )
+    path_calls: list[str] = []
+    for name in ("is_file", "stat"):
+        original = getattr(Path, name)
 
-    source = _file_source(path=str(source_dir), glob="**/*.csv")
-    with pytest.raises(extractors.ExtractionError):
-        extractors.extract_file_rows(source, None)
+        def spy(self, *args, _original=original, _name=name, **kwargs):
+            if source_dir in self.parents:
+                path_calls.append(_name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, name, spy)
+
+    result = extractors.extract_file_rows(source, None)
+    monkeypatch.undo()
+
+    # Type checks and stats come from the scandir entries.
+    assert path_calls == []
+
+    assert [Path(row["file_path"]).relative_to(source_dir).as_posix() for row in result.rows] == [
+        "2026/01/a.csv",
+        "2026/02/b.csv",
+        "top.csv",
+    ]
+    assert json.loads(result.watermark or "")["fc"] == 3
+
+
+def test_extract_file_rows_non_recursive_glob_stays_in_source_path(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    _write_tree(source_dir, ["a.csv", "nested/b.csv", "nested/deeper/c.csv"])
+
+    top = extractors.extract_file_rows(_file_source(path=str(source_dir)), None)
+    nested = extractors.extract_file_rows(_file_source(path=str(source_dir), glob="*/*.csv"), None)
+
+    assert [row["file_name"] for row in top.rows] == ["a.csv"]
+    assert [row["file_name"] for row in nested.rows] == ["b.csv"]
+
+
+def test_extract_file_rows_follows_symlinked_directories(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    _write_tree(tmp_path, ["shared/b.csv", "shared/deeper/c.csv"])
+    _write_tree(source_dir, ["a.csv"])
+    (source_dir / "link").symlink_to(tmp_path / "shared", target_is_directory=True)
+    # A cycle back to the source directory must not loop under "**".
+    (source_dir / "link" / "loop").symlink_to(source_dir, target_is_directory=True)
+
+    def relative_paths(glob: str) -> list[str]:
+        result = extractors.extract_file_rows(
+            _file_source(path=str(source_dir), glob=glob, watermark_field=None), None
+        )
+        return [Path(row["file_path"]).relative_to(source_dir).as_posix() for row in result.rows]
+
+    assert relative_paths("link/*.csv") == ["link/b.csv"]
+    assert relative_paths("*/*.csv") == ["link/b.csv"]
+    assert relative_paths("**/*.csv") == ["a.csv", "link/b.csv", "link/deeper/c.csv"]
+
+
+def test_extract_file_rows_shards_cover_every_file_once(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    relative_paths = [f"part-{idx:02d}/data.csv" for idx in range(12)]
+    _write_tree(source_dir, relative_paths)
+    source = _file_source(path=str(source_dir), glob="**/*.csv", watermark_field=None)
+
+    shards = [
+        [
+            row["file_path"]
+            for row in extractors.extract_file_rows(
+                source.model_copy(update={"shard_count": 3, "shard_index": index}), None
+            ).rows
+        ]
+        for index in range(3)
+    ]
+
+    assert sorted(path for shard in shards for path in shard) == [
+        str(source_dir / relative_path) for relative_path in relative_paths
+    ]
+    assert all(shards)
+
+
+def test_source_config_rejects_shard_index_outside_shard_count() -> None:
+    with pytest.raises(ValueError, match="shardIndex"):
+        SourceConfig(type="file", shardCount=2, shardIndex=2)
 
 
 def test_extract_sql_rows_requires_secret_ref() -> None:
@@ -180,9 +292,9 @@ def test_extract_rest_rows_requires_secret_ref_without_oauth() -> None:
         extractors.extract_rest_rows(source, None)
 
 
-def test_extract_file_rows_requires_csv_format() -> None:
+def test_extract_file_rows_requires_supported_format() -> None:
     source = SourceConfig(type="file", path=".", glob="*.csv", csv={"documentMode": "row"})
-    with pytest.raises(extractors.ExtractionError, match="source.format must be csv"):
+    with pytest.raises(extractors.ExtractionError, match="source.format must be csv, parquet"):
         extractors.extract_file_rows(source, None)
 
 
@@ -250,14 +362,16 @@ def test_extract_file_rows_keeps_non_v1_json_watermark_as_legacy_fallback(tmp_pa
     assert checkpoint["rw"] == '{"foo":"bar"}'
 
 
-def test_file_checkpoint_builder_enforces_compact_length_limit() -> None:
-    with pytest.raises(extractors.ExtractionError, match="checkpoint exceeded 255 characters"):
-        extractors._build_file_checkpoint(  # noqa: SLF001
-            row_watermark="x" * 240,
-            file_count=1,
-            latest_file_mtime="2026-02-16T10:00:00+00:00",
-            file_manifest_hash="sha256:test",
-        )
+def test_file_checkpoint_builder_keeps_long_row_watermarks() -> None:
+    checkpoint = extractors._build_file_checkpoint(  # noqa: SLF001
+        row_watermark="x" * 240,
+        file_count=1,
+        latest_file_mtime="2026-02-16T10:00:00+00:00",
+        file_manifest_hash="sha256:test",
+    )
+
+    assert len(checkpoint) > 255
+    assert extractors._extract_row_watermark_from_checkpoint(checkpoint) == "x" * 240  # noqa: SLF001
 
 
 def test_resolve_source_path_normalizes_relative_paths() -> None:
@@ -370,3 +484,504 @@ def test_extract_file_rows_multiline_with_semicolon_delimiter(tmp_path) -> None:
     assert len(result.rows) == 2
     assert result.rows[0]["kinder"] == "Child 1\nChild 2\nChild 3"
     assert result.rows[0]["titel"] == "Root Process"
+
+
+def test_extract_file_rows_columnar_matches_row_mode_records(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv").write_text(
+        "Employee ID,Full Name,updated_at\n1,#ERROR x,2026-02-16T08:00:00+00:00\n\n2,Bob\n",
+        encoding="utf-8",
+    )
+    (source_dir / "b.csv").write_text(
+        "Employee ID,Full Name,updated_at\n3,Cam,2026-02-16T10:00:00+00:00\n",
+        encoding="utf-8",
+    )
+    options = {"normalize_headers": True, "clean_errors": True}
+
+    expected = extractors.extract_file_rows(_file_source(path=str(source_dir), **options), None)
+    result = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), columnar=True, **options), None
+    )
+
+    assert isinstance(result.rows, extractors.RowStream)
+    rows = list(result.rows)
+    assert rows == expected.rows
+    assert [row["employee_id"] for row in rows] == ["1", "2", "3"]
+    assert rows[0]["full_name"] == ""
+    assert rows[1]["updated_at"] is None
+    assert [row["file_name"] for row in rows] == ["a.csv", "a.csv", "b.csv"]
+    assert result.watermark == expected.watermark
+
+
+@pytest.mark.parametrize("has_header", [True, False])
+@pytest.mark.parametrize("stream_rows", [False, True])
+def test_extract_file_rows_columnar_keeps_ragged_rows_like_row_mode(
+    tmp_path, has_header: bool, stream_rows: bool
+) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv").write_text(
+        "id,name\n1,Ada\n2,Bob,extra,#ERROR x\n3\n4,Cam\n", encoding="utf-8"
+    )
+    options = {
+        "has_header": has_header,
+        "watermark_field": None,
+        "clean_errors": True,
+        "stream_rows": stream_rows,
+    }
+
+    expected = extractors.extract_file_rows(_file_source(path=str(source_dir), **options), None)
+    result = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), columnar=True, **options), None
+    )
+
+    rows = list(result.rows)
+    assert rows == list(expected.rows)
+    if has_header:
+        assert [None in row for row in rows] == [False, True, False, False]
+        assert rows[2]["name"] is None
+    else:
+        assert ["column_3" in row for row in rows] == [False, False, True, False, False]
+        assert "column_2" not in rows[3]
+
+
+def test_extract_file_rows_skips_files_known_from_manifest(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    header = "employee_id,full_name,updated_at\n"
+    (source_dir / "a.csv").write_text(header + "1,Ada,2026-02-16T08:00:00+00:00\n")
+    (source_dir / "b.csv").write_text(header + "2,Bob,2026-02-16T09:00:00+00:00\n")
+    (source_dir / "c.csv").write_text(header + "3,Cam,2026-02-16T07:00:00+00:00\n")
+    source = _file_source(path=str(source_dir))
+
+    first = extractors.extract_file_rows(source, None, known_files={})
+    known = {entry.path: entry for entry in first.file_entries}
+    for entry in known.values():
+        entry.doc_ids = [f"doc-{entry.path[-5]}"]
+
+    # Touch b.csv without changing it, and rewrite c.csv.
+    b_path = source_dir / "b.csv"
+    stat = b_path.stat()
+    os.utime(b_path, (stat.st_atime, stat.st_mtime + 60))
+    (source_dir / "c.csv").write_text(header + "3,Cameron,2026-02-16T07:30:00+00:00\n")
+
+    second = extractors.extract_file_rows(source, first.watermark, known_files=known)
+
+    assert [entry.row_count for entry in first.file_entries] == [1, 1, 1]
+    assert [row["full_name"] for row in second.rows] == ["Cameron"]
+    assert [entry.carried_forward for entry in second.file_entries] == [True, True, False]
+    assert second.file_entries[0].doc_ids == ["doc-a"]
+    assert second.file_entries[1].mtime != known[str(b_path)].mtime
+    checkpoint = json.loads(second.watermark)
+    # Watermarks of carried files still count towards the checkpoint.
+    assert checkpoint["rw"] == "2026-02-16T09:00:00+00:00"
+    assert checkpoint["fc"] == 3
+
+
+def test_extract_file_rows_stream_rows_matches_buffered_rows(tmp_path, monkeypatch) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv").write_bytes(
+        b"Employee ID,Full Name,updated_at\r\n"
+        b'1,"Ada\r\nLovelace",2026-02-16T08:00:00+00:00\r\n'
+        b"2,#ERROR x,2026-02-16T11:00:00+00:00\r\n"
+        b"3,Cam,2026-02-16T09:00:00+00:00\r\n"
+    )
+    (source_dir / "b.csv").write_text(
+        "Employee ID,Full Name,updated_at\n4,Dee,2026-02-16T10:00:00+00:00\n",
+        encoding="utf-8",
+    )
+    options = {"normalize_headers": True, "clean_errors": True}
+    expected = extractors.extract_file_rows(_file_source(path=str(source_dir), **options), None)
+
+    monkeypatch.setattr(extractors, "_CSV_STREAM_CHUNK_ROWS", 2)
+    monkeypatch.setattr(
+        Path, "read_text", lambda *args, **kwargs: pytest.fail("streamRows must not read_text")
+    )
+    result = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), stream_rows=True, **options), None
+    )
+
+    assert isinstance(result.rows, extractors.RowStream)
+    chunks = list(result.rows.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [2, 1, 1]
+    assert [row for chunk in chunks for row in chunk] == expected.rows
+    assert result.watermark == expected.watermark
+
+
+def test_extract_file_rows_stream_rows_columnar_and_manifest(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    header = "employee_id,full_name,updated_at\n"
+    (source_dir / "a.csv").write_text(header + "1,Ada,2026-02-16T08:00:00+00:00\n")
+    (source_dir / "b.csv").write_text(
+        header + "2,Bob,2026-02-16T09:00:00+00:00\n3,Cam,2026-02-16T07:00:00+00:00\n"
+    )
+    buffered = extractors.extract_file_rows(_file_source(path=str(source_dir)), None, {})
+
+    result = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), stream_rows=True, columnar=True), None, {}
+    )
+    rows = list(result.rows)
+
+    assert rows == buffered.rows
+    assert result.watermark == buffered.watermark
+    # Manifest entries are filled in as each file is consumed.
+    assert [(e.row_count, e.row_watermark, e.content_hash) for e in result.file_entries] == [
+        (e.row_count, e.row_watermark, e.content_hash) for e in buffered.file_entries
+    ]
+
+
+def test_extract_file_rows_stream_rows_wraps_decode_errors(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv").write_bytes(b"employee_id,full_name\n1,\xff\xfe\n")
+
+    result = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), stream_rows=True, watermark_field=None), None
+    )
+
+    with pytest.raises(extractors.ExtractionError, match="Unable to read CSV file"):
+        list(result.rows)
+
+
+@pytest.fixture
+def _process_pools():
+    yield
+    close_process_pools()
+
+
+@pytest.mark.usefixtures("_process_pools")
+def test_extract_file_rows_parse_workers_match_serial_results(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    header = "Employee ID,Full Name,updated_at\n"
+    for index, name in enumerate(["d", "a", "c", "b"]):
+        (source_dir / f"{name}.csv").write_text(
+            header
+            + "".join(
+                f"{index}{row},#ERROR {name},2026-02-1{index}T0{row}:00:00+00:00\n"
+                for row in range(3)
+            )
+        )
+    options = {"normalize_headers": True, "clean_errors": True}
+    serial = extractors.extract_file_rows(_file_source(path=str(source_dir), **options), None, {})
+    parallel = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), parse_workers=3, **options), None, {}
+    )
+    known = {entry.path: entry for entry in serial.file_entries}
+    b_path = source_dir / "b.csv"
+    stat = b_path.stat()
+    os.utime(b_path, (stat.st_atime, stat.st_mtime + 60))
+    (source_dir / "c.csv").write_text(header + "9,Cy,2026-02-19T00:00:00+00:00\n")
+    serial_rerun = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), **options), serial.watermark, known
+    )
+
+    parallel_rerun = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), parse_workers=3, **options), serial.watermark, known
+    )
+
+    assert [row["file_name"] for row in parallel.rows][::3] == ["a.csv", "b.csv", "c.csv", "d.csv"]
+    for expected, actual in [(serial, parallel), (serial_rerun, parallel_rerun)]:
+        assert actual.rows == expected.rows
+        assert actual.watermark == expected.watermark
+        assert actual.file_entries == expected.file_entries
+    assert [entry.carried_forward for entry in parallel_rerun.file_entries] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+
+
+@pytest.mark.usefixtures("_process_pools")
+def test_extract_file_rows_parse_workers_surface_worker_errors(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv").write_text("employee_id,full_name\n1,Ada\n")
+    (source_dir / "b.csv").write_bytes(b"employee_id,full_name\n2,\xff\xfe\n")
+
+    with pytest.raises(extractors.ExtractionError, match="Unable to read CSV file .*b.csv"):
+        extractors.extract_file_rows(
+            _file_source(path=str(source_dir), watermark_field=None, parse_workers=2), None
+        )
+
+
+def test_csv_rows_from_content_matches_dict_reader_edge_cases() -> None:
+    content = "Übung,Name,Übung\n1,#ERROR x,3\n\n4\n5,#ERRORS kept,6,#ERROR extra,8\n"
+
+    rows = extractors._csv_rows_from_content(
+        content=content,
+        has_header=True,
+        delimiter=",",
+        normalize_headers=True,
+        clean_errors=True,
+    )
+    headerless = extractors._csv_rows_from_content(
+        content="a,#ERROR\n\nb,c,d\n",
+        has_header=False,
+        delimiter=",",
+        clean_errors=True,
+    )
+
+    # Duplicate headers keep the last value, like csv.DictReader.
+    assert rows == [
+        {"ubung": "3", "name": ""},
+        {"ubung": None, "name": None},
+        {"ubung": "6", "name": "#ERRORS kept", None: ["#ERROR extra", "8"]},
+    ]
+    assert headerless == [
+        {"column_1": "a", "column_2": ""},
+        {},
+        {"column_1": "b", "column_2": "c", "column_3": "d"},
+    ]
+
+
+def test_extract_file_rows_lazy_content_defers_reads_until_materialized(
+    tmp_path, monkeypatch
+) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv").write_bytes(
+        b'employee_id,full_name\r\n1,"Ada\r\nLovelace"\r\n2,#ERROR x\r\n'
+    )
+    (source_dir / "b.csv").write_bytes(b"")
+    options = {"document_mode": "file", "watermark_field": "file_mtime", "clean_errors": True}
+    eager = extractors.extract_file_rows(_file_source(path=str(source_dir), **options), None, {})
+
+    read_text = Path.read_text
+    monkeypatch.setattr(
+        Path, "read_text", lambda *args, **kwargs: pytest.fail("lazyContent must not read_text")
+    )
+    lazy = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), lazy_content=True, **options), None, {}
+    )
+    monkeypatch.setattr(Path, "read_text", read_text)
+
+    assert isinstance(lazy.rows[0]["file_content_raw"], extractors.MappedFileText)
+    assert isinstance(lazy.rows[0]["file_rows_json"], extractors.CsvRowsJson)
+    assert [{key: str(value) for key, value in row.items()} for row in lazy.rows] == [
+        {key: str(value) for key, value in row.items()} for row in eager.rows
+    ]
+    assert lazy.watermark == eager.watermark
+    assert lazy.file_entries == eager.file_entries
+
+
+def test_extract_file_rows_reads_compressed_files_like_plain_ones(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    payload = b"employee_id,full_name,updated_at\r\n1,Ada,2026-02-16T08:00:00+00:00\r\n"
+    (source_dir / "a.csv.gz").write_bytes(gzip.compress(payload))
+    (source_dir / "b.csv.bz2").write_bytes(bz2.compress(payload.replace(b"1,Ada", b"2,Bob")))
+    # No telling suffix: detected from the gzip magic bytes.
+    (source_dir / "c.csv").write_bytes(gzip.compress(payload.replace(b"1,Ada", b"3,Cam")))
+
+    result = extractors.extract_file_rows(_file_source(path=str(source_dir), glob="*"), None, {})
+    streamed = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), glob="*", stream_rows=True), None, {}
+    )
+
+    assert [(row["employee_id"], row["full_name"]) for row in result.rows] == [
+        ("1", "Ada"),
+        ("2", "Bob"),
+        ("3", "Cam"),
+    ]
+    # File metadata and checkpoints describe the compressed objects.
+    assert [row["file_size_bytes"] for row in result.rows] == [
+        (source_dir / name).stat().st_size for name in ("a.csv.gz", "b.csv.bz2", "c.csv")
+    ]
+    assert list(streamed.rows) == result.rows
+    assert streamed.watermark == result.watermark
+    assert [entry.content_hash for entry in streamed.file_entries] == [
+        entry.content_hash for entry in result.file_entries
+    ]
+
+
+def test_extract_file_rows_lazy_content_decompresses_on_read(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv.gz").write_bytes(gzip.compress(b"employee_id\r\n1\r\n"))
+
+    result = extractors.extract_file_rows(
+        _file_source(
+            path=str(source_dir),
+            glob="*.csv.gz",
+            document_mode="file",
+            watermark_field=None,
+            lazy_content=True,
+        ),
+        None,
+    )
+
+    assert str(result.rows[0]["file_content_raw"]) == "employee_id\n1\n"
+    assert str(result.rows[0]["file_rows_json"]) == '[{"employee_id":"1"}]'
+
+
+def test_extract_file_rows_wraps_truncated_compressed_files(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv.gz").write_bytes(gzip.compress(b"employee_id\n1\n" * 100)[:-12])
+
+    with pytest.raises(extractors.ExtractionError, match="Unable to read CSV file"):
+        extractors.extract_file_rows(
+            _file_source(path=str(source_dir), glob="*.gz", watermark_field=None), None
+        )
+    result = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), glob="*.gz", watermark_field=None, stream_rows=True),
+        None,
+    )
+    with pytest.raises(extractors.ExtractionError, match="Unable to read CSV file"):
+        list(result.rows)
+
+
+def test_extract_file_rows_reads_zstd_files(tmp_path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv.zst").write_bytes(
+        zstandard.ZstdCompressor().compress(b"employee_id,full_name\n1,Ada\n")
+    )
+
+    result = extractors.extract_file_rows(
+        _file_source(path=str(source_dir), glob="*.zst", watermark_field=None, stream_rows=True),
+        None,
+    )
+
+    assert [row["full_name"] for row in result.rows] == ["Ada"]
+
+
+def test_extract_file_rows_explains_missing_zstandard(tmp_path, monkeypatch) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.csv.zst").write_bytes(b"\x28\xb5\x2f\xfd")
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with pytest.raises(extractors.ExtractionError, match=r"ingest-relay\[zstd\]"):
+        extractors.extract_file_rows(
+            _file_source(path=str(source_dir), glob="*.zst", watermark_field=None), None
+        )
+
+
+def test_extract_file_rows_reads_ndjson_files_as_a_stream(tmp_path) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.ndjson").write_text(
+        '{"employee_id": 1, "full_name": "Ada", "updated_at": "2026-02-16T08:00:00+00:00"}\n'
+        "\n"
+        '{"employee_id": 2, "full_name": "Bob", "updated_at": "2026-02-16T09:00:00+00:00"}\n',
+        encoding="utf-8",
+    )
+    with gzip.open(source_dir / "b.ndjson.gz", "wt", encoding="utf-8") as handle:
+        handle.write('{"employee_id": 3, "tags": ["x"], "updated_at": "2026-02-16T07:00:00Z"}\n')
+    source = SourceConfig(
+        type="file",
+        path=str(source_dir),
+        glob="*.ndjson*",
+        format="ndjson",
+        watermarkField="updated_at",
+    )
+
+    result = extractors.extract_file_rows(source, None, {})
+    rows = list(result.rows)
+
+    assert [(row["employee_id"], row["file_name"]) for row in rows] == [
+        (1, "a.ndjson"),
+        (2, "a.ndjson"),
+        (3, "b.ndjson.gz"),
+    ]
+    assert rows[2]["tags"] == ["x"]
+    assert json.loads(result.watermark)["rw"] == "2026-02-16T09:00:00+00:00"
+    assert [(entry.row_count, entry.row_watermark) for entry in result.file_entries] == [
+        (2, "2026-02-16T09:00:00+00:00"),
+        (1, "2026-02-16T07:00:00Z"),
+    ]
+    assert all(entry.content_hash.startswith("sha256:") for entry in result.file_entries)
+
+
+@pytest.mark.parametrize(
+    ("line", "message"),
+    [("{not json}", "Invalid JSON on line 2"), ("[1, 2]", "Line 2 .* is not a JSON object")],
+)
+def test_extract_file_rows_rejects_bad_ndjson_lines(tmp_path, line, message) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.ndjson").write_text('{"id": 1}\n' + line + "\n", encoding="utf-8")
+    source = SourceConfig(type="file", path=str(source_dir), glob="*.ndjson", format="ndjson")
+
+    result = extractors.extract_file_rows(source, None)
+
+    with pytest.raises(extractors.ExtractionError, match=message):
+        list(result.rows)
+
+
+def test_extract_file_rows_reads_only_projected_parquet_columns(tmp_path, monkeypatch) -> None:
+    pyarrow = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    table = pyarrow.table(
+        {
+            "employee_id": [1, 2, 3],
+            "full_name": ["Ada", "Bob", "Cam"],
+            "updated_at": ["2026-02-16T08:00:00", "2026-02-16T10:00:00", "2026-02-16T09:00:00"],
+            "payload": ["x" * 100] * 3,
+        }
+    )
+    parquet.write_table(table, source_dir / "a.parquet", row_group_size=2)
+    requested: list[list[str]] = []
+    iter_batches = parquet.ParquetFile.iter_batches
+
+    def recording_iter_batches(self, *args, **kwargs):
+        requested.append(list(kwargs["columns"]))
+        return iter_batches(self, *args, **kwargs)
+
+    monkeypatch.setattr(parquet.ParquetFile, "iter_batches", recording_iter_batches)
+    source = SourceConfig(
+        type="file",
+        path=str(source_dir),
+        glob="*.parquet",
+        format="parquet",
+        watermarkField="updated_at",
+    )
+
+    result = extractors.extract_file_rows(source, None, {})
+    rows = list(result.rows.project({"employee_id", "full_name", "updated_at", "file_name"}))
+
+    assert requested == [["employee_id", "full_name", "updated_at"]]
+    assert rows == [
+        {
+            "employee_id": 1,
+            "full_name": "Ada",
+            "updated_at": "2026-02-16T08:00:00",
+            "file_name": "a.parquet",
+        },
+        {
+            "employee_id": 2,
+            "full_name": "Bob",
+            "updated_at": "2026-02-16T10:00:00",
+            "file_name": "a.parquet",
+        },
+        {
+            "employee_id": 3,
+            "full_name": "Cam",
+            "updated_at": "2026-02-16T09:00:00",
+            "file_name": "a.parquet",
+        },
+    ]
+    assert json.loads(result.watermark)["rw"] == "2026-02-16T10:00:00"
+    assert result.file_entries[0].row_count == 3
+
+
+def test_extract_file_rows_explains_missing_pyarrow(tmp_path, monkeypatch) -> None:
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "a.parquet").write_bytes(b"PAR1")
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    source = SourceConfig(type="file", path=str(source_dir), glob="*.parquet", format="parquet")
+
+    result = extractors.extract_file_rows(source, None)
+
+    with pytest.raises(extractors.ExtractionError, match=r"ingest-relay\[parquet\]"):
+        list(result.rows)
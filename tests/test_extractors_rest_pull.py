@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import json
+
 import httpx
+import pytest
 
 from ingest_relay.adapters import extractors
 from ingest_relay.schemas import SourceConfig
+from ingest_relay.utils.http_clients import AsyncHttpClientPool
 
 
 def test_extract_rest_rows_paginates_and_tracks_watermark(monkeypatch) -> None:
@@ -63,3 +68,367 @@ def test_extract_rest_rows_paginates_and_tracks_watermark(monkeypatch) -> None:
     assert result.watermark == "2026-02-16T09:00:00+00:00"
     assert calls[0]["params"]["watermark"] == "2026-02-16T07:00:00+00:00"
     assert calls[1]["params"]["cursor"] == "cursor-2"
+
+
+def _items_response(items: list[dict]) -> httpx.Response:
+    return httpx.Response(
+        status_code=200,
+        request=httpx.Request("GET", "https://example.local/items"),
+        json={"items": items},
+    )
+
+
+def test_extract_rest_rows_offset_pagination_fetches_in_parallel_and_keeps_order(
+    monkeypatch,
+) -> None:
+    calls: list[dict] = []
+    total_items = 23
+
+    def fake_request(client, method, url, **kwargs):
+        calls.append(kwargs["params"])
+        offset = kwargs["params"]["skip"]
+        limit = kwargs["params"]["limit"]
+        return _items_response(
+            [
+                {"id": idx, "updated_at": f"2026-02-16T{idx % 24:02d}:00:00+00:00"}
+                for idx in range(offset, min(offset + limit, total_items))
+            ]
+        )
+
+    monkeypatch.setattr(extractors, "_request_with_retry", fake_request)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        watermarkField="updated_at",
+        paginationMode="offset",
+        paginationCursorField="skip",
+        paginationLimitParam="limit",
+        paginationPageSize=5,
+        paginationConcurrency=4,
+    )
+
+    result = extractors.extract_rest_rows(source, None)
+
+    assert [row["id"] for row in result.rows] == list(range(total_items))
+    assert result.watermark == "2026-02-16T22:00:00+00:00"
+    assert {params["skip"] for params in calls} >= {0, 5, 10, 15, 20}
+    assert all(params["limit"] == 5 for params in calls)
+
+
+def test_extract_rest_rows_page_pagination_stops_on_empty_page(monkeypatch) -> None:
+    pages = {1: [{"id": 1}, {"id": 2}], 2: [{"id": 3}, {"id": 4}], 3: []}
+
+    def fake_request(client, method, url, **kwargs):
+        return _items_response(pages.get(kwargs["params"]["page"], []))
+
+    monkeypatch.setattr(extractors, "_request_with_retry", fake_request)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        paginationMode="page",
+        paginationPageSize=2,
+    )
+
+    result = extractors.extract_rest_rows(source, "2026-02-16T07:00:00+00:00")
+
+    assert [row["id"] for row in result.rows] == [1, 2, 3, 4]
+    assert result.watermark == "2026-02-16T07:00:00+00:00"
+
+
+def test_extract_rest_rows_prefetch_streams_cursor_pages(monkeypatch) -> None:
+    def fake_request(client, method, url, **kwargs):
+        cursor = int(kwargs["params"].get("cursor", 0))
+        return httpx.Response(
+            status_code=200,
+            request=httpx.Request("GET", url),
+            json={
+                "items": [{"id": cursor, "updated_at": f"2026-02-1{cursor}T00:00:00+00:00"}],
+                "paging": {"next_cursor": str(cursor + 1) if cursor < 3 else None},
+            },
+        )
+
+    monkeypatch.setattr(extractors, "_request_with_retry", fake_request)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        watermarkField="updated_at",
+        paginationCursorField="cursor",
+        paginationNextCursorJsonPath="paging.next_cursor",
+        paginationPrefetch=2,
+    )
+
+    result = extractors.extract_rest_rows(source, None)
+
+    assert isinstance(result.rows, extractors.RowStream)
+    assert [row["id"] for row in result.rows] == [0, 1, 2, 3]
+    assert result.watermark == "2026-02-13T00:00:00+00:00"
+
+
+def test_extract_rest_rows_prefetch_surfaces_page_errors(monkeypatch) -> None:
+    def fake_request(client, method, url, **kwargs):
+        return httpx.Response(
+            status_code=200,
+            request=httpx.Request("GET", url),
+            json={"items": {"id": 1}},
+        )
+
+    monkeypatch.setattr(extractors, "_request_with_retry", fake_request)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        paginationPrefetch=1,
+    )
+
+    result = extractors.extract_rest_rows(source, None)
+
+    with pytest.raises(extractors.ExtractionError, match="must be a list"):
+        list(result.rows)
+
+
+def test_source_config_requires_page_size_for_offset_pagination() -> None:
+    with pytest.raises(ValueError, match="paginationPageSize is required"):
+        SourceConfig(type="http", url="https://example.local/items", paginationMode="offset")
+    with pytest.raises(ValueError, match="paginationConcurrency requires"):
+        SourceConfig(type="http", url="https://example.local/items", paginationConcurrency=2)
+
+
+def test_extract_rest_rows_async_paginates_on_shared_client(monkeypatch) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        cursor = request.url.params.get("cursor")
+        if cursor is None:
+            return httpx.Response(
+                200,
+                json={
+                    "items": [{"id": 1, "updated_at": "2026-02-16T08:00:00+00:00"}],
+                    "paging": {"next_cursor": "cursor-2"},
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "items": [{"id": 2, "updated_at": "2026-02-16T09:00:00+00:00"}, "skip-me"],
+                "paging": {"next_cursor": None},
+            },
+        )
+
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        watermarkField="updated_at",
+        headers={"X-Tenant": "internal"},
+        paginationCursorField="cursor",
+        paginationNextCursorJsonPath="paging.next_cursor",
+    )
+
+    async def _run() -> extractors.PullResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extractors.extract_rest_rows_async(
+                source, "2026-02-16T07:00:00+00:00", client
+            )
+
+    result = asyncio.run(_run())
+
+    assert [row["id"] for row in result.rows] == [1, 2]
+    assert result.watermark == "2026-02-16T09:00:00+00:00"
+    assert seen[0].url.params["watermark"] == "2026-02-16T07:00:00+00:00"
+    assert all(request.headers["Authorization"] == "Bearer token" for request in seen)
+    assert all(request.headers["X-Tenant"] == "internal" for request in seen)
+
+
+def test_extract_rest_rows_async_offset_pages_run_concurrently(monkeypatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        return httpx.Response(
+            200, json=[{"id": idx} for idx in range(offset, min(offset + 10, 35))]
+        )
+
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        paginationMode="offset",
+        paginationPageSize=10,
+        paginationConcurrency=3,
+    )
+
+    async def _run() -> extractors.PullResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extractors.extract_rest_rows_async(source, None, client)
+
+    result = asyncio.run(_run())
+
+    assert [row["id"] for row in result.rows] == list(range(35))
+
+
+def test_extract_rest_rows_pooled_uses_process_client_pool(monkeypatch) -> None:
+    pool = AsyncHttpClientPool(http2=False)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"items": []}))
+    clients: list[httpx.AsyncClient] = []
+
+    def client_for(url: str) -> httpx.AsyncClient:
+        clients.append(httpx.AsyncClient(transport=transport))
+        return clients[-1]
+
+    monkeypatch.setattr(pool, "client_for", client_for)
+    monkeypatch.setattr(extractors, "get_async_client_pool", lambda: pool)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(type="http", secretRef="kb-api-token", url="https://example.local/items")
+    try:
+        result = extractors.extract_rest_rows_pooled(source, "2026-02-16T07:00:00+00:00")
+    finally:
+        pool.close()
+
+    assert result.rows == []
+    assert result.watermark == "2026-02-16T07:00:00+00:00"
+    assert len(clients) == 1
+
+
+def test_extract_rest_rows_stream_items_reads_cursor_after_items(monkeypatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("cursor")
+        if cursor is None:
+            rows = [{"id": idx, "updated_at": "2026-02-16T08:00:00+00:00"} for idx in range(3)]
+            body = {"items": [*rows, "not-a-row"], "paging": {"next_cursor": "cursor-2"}}
+        else:
+            body = {
+                "paging": {"next_cursor": None},
+                "items": [{"id": 3, "updated_at": "2026-02-16T09:00:00+00:00"}],
+            }
+        return httpx.Response(200, content=json.dumps(body).encode("utf-8"))
+
+    monkeypatch.setattr(
+        extractors,
+        "create_httpx_client",
+        lambda **kwargs: httpx.Client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        watermarkField="updated_at",
+        paginationCursorField="cursor",
+        paginationNextCursorJsonPath="paging.next_cursor",
+        streamItems=True,
+    )
+
+    result = extractors.extract_rest_rows(source, None)
+
+    assert [row["id"] for row in result.rows] == [0, 1, 2, 3]
+    assert result.watermark == "2026-02-16T09:00:00+00:00"
+
+
+def test_extract_rest_rows_stream_items_wraps_malformed_pages(monkeypatch) -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b'{"items": 1}'))
+    monkeypatch.setattr(
+        extractors,
+        "create_httpx_client",
+        lambda **kwargs: httpx.Client(transport=transport, **kwargs),
+    )
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(
+        type="http", secretRef="kb-api-token", url="https://example.local/items", streamItems=True
+    )
+
+    with pytest.raises(extractors.ExtractionError, match="must be a list"):
+        extractors.extract_rest_rows(source, None)
+
+
+def test_extract_rest_rows_async_stream_items_counts_raw_items_for_short_pages(
+    monkeypatch,
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        items: list = [{"id": page * 10 + idx} for idx in range(2)] if page < 3 else []
+        # Non-object entries still count towards a full page.
+        items.append("filler")
+        return httpx.Response(200, content=json.dumps({"items": items}).encode("utf-8"))
+
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        paginationMode="page",
+        paginationPageSize=3,
+        paginationConcurrency=2,
+        streamItems=True,
+    )
+
+    async def _run() -> extractors.PullResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extractors.extract_rest_rows_async(source, None, client)
+
+    result = asyncio.run(_run())
+
+    assert [row["id"] for row in result.rows] == [10, 11, 20, 21]
+
+
+def test_extract_rest_rows_page_pagination_continues_past_server_capped_pages(
+    monkeypatch,
+) -> None:
+    # The server serves at most 3 items per page although 10 were requested.
+    items = [{"id": idx} for idx in range(8)]
+
+    def fake_request(client, method, url, **kwargs):
+        start = (kwargs["params"]["page"] - 1) * 3
+        return _items_response(items[start : start + 3])
+
+    monkeypatch.setattr(extractors, "_request_with_retry", fake_request)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        paginationMode="page",
+        paginationPageSize=10,
+        paginationConcurrency=2,
+    )
+
+    result = extractors.extract_rest_rows(source, None)
+
+    assert [row["id"] for row in result.rows] == list(range(8))
+
+
+def test_extract_rest_rows_offset_pagination_rejects_server_capped_pages(monkeypatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        return httpx.Response(200, json=[{"id": idx} for idx in range(offset, min(offset + 3, 25))])
+
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "token")
+    source = SourceConfig(
+        type="http",
+        secretRef="kb-api-token",
+        url="https://example.local/items",
+        paginationMode="offset",
+        paginationPageSize=10,
+    )
+
+    async def _run() -> extractors.PullResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extractors.extract_rest_rows_async(source, None, client)
+
+    with pytest.raises(extractors.ExtractionError, match="set paginationPageSize to 3"):
+        asyncio.run(_run())
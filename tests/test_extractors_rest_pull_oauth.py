@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -340,3 +342,56 @@ def test_extract_rest_rows_oauth_raises_for_missing_access_token(monkeypatch) ->
 
     with pytest.raises(extractors.ExtractionError, match="access_token"):
         extractors.extract_rest_rows(_oauth_source(), None)
+
+
+def test_extract_rest_rows_async_oauth_refreshes_once_on_401(monkeypatch) -> None:
+    issued = {"count": 0}
+    api_headers: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "openid-connect/token" in str(request.url):
+            issued["count"] += 1
+            return httpx.Response(
+                200,
+                json={"access_token": f"oauth-token-{issued['count']}", "expires_in": 3600},
+            )
+        api_headers.append(request.headers["Authorization"])
+        if len(api_headers) == 1:
+            return httpx.Response(401, json={"error": "unauthorized"})
+        return httpx.Response(
+            200,
+            json={
+                "items": [{"updated_at": "2026-02-16T08:00:00+00:00"}],
+                "paging": {"next_cursor": None},
+            },
+        )
+
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "oauth-secret")
+
+    async def _run() -> extractors.PullResult:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extractors.extract_rest_rows_async(_oauth_source(), None, client)
+
+    result = asyncio.run(_run())
+
+    assert len(result.rows) == 1
+    assert api_headers == ["Bearer oauth-token-1", "Bearer oauth-token-2"]
+
+
+def test_extract_rest_rows_oauth_reuses_token_across_runs(monkeypatch) -> None:
+    token_calls: list[str] = []
+
+    def fake_request(client, method, url, **kwargs):
+        if "openid-connect/token" in url:
+            token_calls.append(url)
+            return _response(method, url, 200, {"access_token": "oauth-token", "expires_in": 3600})
+        assert kwargs["headers"]["Authorization"] == "Bearer oauth-token"
+        return _response(method, url, 200, {"items": []})
+
+    monkeypatch.setattr(extractors, "_request_with_retry", fake_request)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: "oauth-secret")
+
+    extractors.extract_rest_rows(_oauth_source(), None)
+    extractors.extract_rest_rows(_oauth_source(scopes=["api.write", "api.read"]), None)
+
+    assert len(token_calls) == 1
@@ -4,6 +4,7 @@ import httpx
 from tenacity import stop_after_attempt, wait_none
 
 from ingest_relay.adapters.extractors import _request_with_retry
+from ingest_relay.adapters.rate_limits import HostRateLimiter
 
 
 class FakeClient:
@@ -27,3 +28,41 @@ def test_request_with_retry_retries_on_429_then_succeeds(monkeypatch) -> None:
 
     assert response.status_code == 200
     assert client.calls == 2
+
+
+class ThrottlingClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        self.calls += 1
+        request = httpx.Request(method, url)
+        if self.calls == 1:
+            return httpx.Response(status_code=429, request=request, headers={"Retry-After": "4"})
+        return httpx.Response(status_code=200, request=request, json={"items": []})
+
+
+def test_request_with_retry_waits_for_retry_after(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(_request_with_retry.retry, "sleep", sleeps.append)
+
+    client = ThrottlingClient()
+    response = _request_with_retry(client, "GET", "https://example.local")
+
+    assert response.status_code == 200
+    assert sleeps == [4.0]
+
+
+def test_request_with_retry_reports_responses_to_rate_limiter(monkeypatch) -> None:
+    monkeypatch.setattr(_request_with_retry.retry, "wait", wait_none())
+    limiter = HostRateLimiter()
+    acquired: list[bool] = []
+    observed: list[int] = []
+    monkeypatch.setattr(limiter, "acquire", lambda: acquired.append(True))
+    monkeypatch.setattr(limiter, "observe", lambda response: observed.append(response.status_code))
+
+    client = ThrottlingClient()
+    _request_with_retry(client, "GET", "https://example.local", rate_limiter=limiter)
+
+    assert acquired == [True, True]
+    assert observed == [429, 200]
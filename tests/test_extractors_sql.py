@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 import sqlite3
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 from ingest_relay.adapters import extractors
+from ingest_relay.adapters.row_batches import ColumnBatch
+from ingest_relay.models import Base
 from ingest_relay.schemas import SourceConfig
+from ingest_relay.services.sql_resume import SqlKeysetResumeStore, keyset_source_fingerprint
 
 
 def test_extract_sql_rows_returns_rows_and_max_watermark(tmp_path, monkeypatch) -> None:
@@ -82,3 +90,316 @@ def test_extract_sql_rows_supports_oracle_source_type(tmp_path, monkeypatch) ->
     assert len(result.rows) == 1
     assert result.rows[0]["invoice_id"] == 10
     assert result.watermark == "2026-02-16T12:00:00+00:00"
+
+
+def _seed_employees(db_path, count: int) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            "CREATE TABLE employees (employee_id INTEGER, full_name TEXT, updated_at TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO employees VALUES (?, ?, ?)",
+            [
+                (idx, f"User {idx}", f"2026-02-{10 + idx % 10:02d}T00:00:00+00:00")
+                for idx in range(count)
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_extract_sql_rows_stream_results_yields_fixed_size_chunks(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 25)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    source = SourceConfig(
+        type="postgres",
+        secretRef="hr-db-credentials",
+        query="SELECT employee_id, full_name, updated_at FROM employees ORDER BY employee_id",
+        watermarkField="updated_at",
+        sql={"streamResults": True, "fetchSize": 10},
+    )
+
+    result = extractors.extract_sql_rows(source, None)
+
+    assert isinstance(result.rows, extractors.RowStream)
+    with pytest.raises(extractors.ExtractionError, match="not final"):
+        _ = result.watermark
+
+    chunk_sizes = [len(chunk) for chunk in result.rows.iter_chunks()]
+
+    assert chunk_sizes == [10, 10, 5]
+    assert result.rows.row_count == 25
+    assert result.watermark == "2026-02-19T00:00:00+00:00"
+
+
+def test_extract_sql_rows_stream_results_keeps_fallback_watermark_when_empty(
+    tmp_path, monkeypatch
+) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 3)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    source = SourceConfig(
+        type="postgres",
+        secretRef="hr-db-credentials",
+        query="SELECT employee_id, updated_at FROM employees WHERE updated_at > :watermark",
+        watermarkField="updated_at",
+        sql={"streamResults": True},
+    )
+
+    result = extractors.extract_sql_rows(source, "2026-03-01T00:00:00+00:00")
+
+    assert list(result.rows) == []
+    assert result.watermark == "2026-03-01T00:00:00+00:00"
+    with pytest.raises(extractors.ExtractionError, match="only be consumed once"):
+        list(result.rows)
+
+
+def test_extract_sql_rows_stream_results_wraps_query_errors(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 1)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    source = SourceConfig(
+        type="postgres",
+        secretRef="hr-db-credentials",
+        query="SELECT missing_column FROM employees",
+        sql={"streamResults": True},
+    )
+
+    result = extractors.extract_sql_rows(source, None)
+
+    with pytest.raises(extractors.ExtractionError, match="SQL extraction failed"):
+        list(result.rows)
+
+
+def _keyset_source(**sql_overrides) -> SourceConfig:
+    return SourceConfig(
+        type="postgres",
+        secretRef="hr-db-credentials",
+        query="SELECT employee_id, full_name, updated_at FROM employees",
+        watermarkField="updated_at",
+        sql={"keysetColumn": "employee_id", "pageSize": 10, **sql_overrides},
+    )
+
+
+def _resume_store(tmp_path, base_watermark: str | None = None) -> SqlKeysetResumeStore:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'state.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    return SqlKeysetResumeStore(
+        session_local,
+        "hr-employees",
+        base_watermark=base_watermark,
+        source_fingerprint=keyset_source_fingerprint(_keyset_source()),
+    )
+
+
+def test_extract_sql_rows_keyset_issues_bounded_pages(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 25)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    result = extractors.extract_sql_rows(_keyset_source(), None)
+    chunks = list(result.rows.iter_chunks())
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert [row["employee_id"] for chunk in chunks for row in chunk] == list(range(25))
+    assert result.watermark == "2026-02-19T00:00:00+00:00"
+
+
+def test_extract_sql_rows_keyset_resumes_after_last_committed_key(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 25)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    interrupted = extractors.extract_sql_rows(
+        _keyset_source(), None, resume_store=_resume_store(tmp_path)
+    )
+    chunks = interrupted.rows.iter_chunks()
+    next(chunks)
+    next(chunks)
+    chunks.close()
+
+    store = _resume_store(tmp_path)
+    resumed = extractors.extract_sql_rows(_keyset_source(), None, resume_store=store)
+    rows = list(resumed.rows)
+
+    assert [row["employee_id"] for row in rows] == list(range(20, 25))
+    assert store.resumed is not None
+    assert store.resumed.pages_committed == 2
+
+
+@pytest.mark.parametrize("page_size", [4, 10])
+def test_extract_sql_rows_keyset_rejects_tied_keys(tmp_path, monkeypatch, page_size) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 6)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("UPDATE employees SET employee_id = 3 WHERE employee_id = 4")
+        conn.commit()
+    finally:
+        conn.close()
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    # With pageSize 4 the tie straddles the page boundary, with 10 it sits inside one page.
+    result = extractors.extract_sql_rows(_keyset_source(pageSize=page_size), None)
+
+    with pytest.raises(extractors.ExtractionError, match="must be unique, but 3"):
+        list(result.rows)
+
+
+def test_extract_sql_rows_keyset_discards_stale_resume_point(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 25)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    interrupted = extractors.extract_sql_rows(
+        _keyset_source(), None, resume_store=_resume_store(tmp_path)
+    )
+    chunks = interrupted.rows.iter_chunks()
+    next(chunks)
+    chunks.close()
+
+    store = _resume_store(tmp_path, base_watermark="2026-02-12T00:00:00+00:00")
+    assert store.load() is None
+
+    rows = list(extractors.extract_sql_rows(_keyset_source(), None, resume_store=store).rows)
+    assert len(rows) == 25
+
+
+def test_extract_sql_rows_partitioned_reads_each_row_once(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 25)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("INSERT INTO employees VALUES (NULL, 'No Id', '2026-02-20T00:00:00+00:00')")
+        conn.commit()
+    finally:
+        conn.close()
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    source = SourceConfig(
+        type="postgres",
+        secretRef="hr-db-credentials",
+        query="SELECT employee_id, full_name, updated_at FROM employees",
+        watermarkField="updated_at",
+        sql={"partitionColumn": "employee_id", "partitionCount": 4},
+    )
+
+    result = extractors.extract_sql_rows(source, None)
+    chunks = list(result.rows.iter_chunks())
+
+    assert len(chunks) == 4
+    ids = [row["employee_id"] for chunk in chunks for row in chunk]
+    assert sorted(idx for idx in ids if idx is not None) == list(range(25))
+    assert ids.count(None) == 1
+    assert result.watermark == "2026-02-20T00:00:00+00:00"
+
+
+def test_partition_boundaries_split_date_ranges() -> None:
+    boundaries = extractors._partition_boundaries(
+        datetime(2026, 1, 1, tzinfo=UTC),
+        datetime(2026, 1, 5, tzinfo=UTC),
+        4,
+    )
+
+    assert boundaries == [
+        datetime(2026, 1, 2, tzinfo=UTC),
+        datetime(2026, 1, 3, tzinfo=UTC),
+        datetime(2026, 1, 4, tzinfo=UTC),
+    ]
+    assert extractors._partition_boundaries(1, 3, 8) == [2]
+    with pytest.raises(extractors.ExtractionError, match="numeric or date/time"):
+        extractors._partition_boundaries("a", "z", 2)
+
+
+def test_sql_config_rejects_keyset_with_partitioning() -> None:
+    with pytest.raises(ValueError, match="cannot be combined"):
+        SourceConfig(
+            type="postgres",
+            secretRef="hr-db-credentials",
+            query="SELECT 1",
+            sql={"keysetColumn": "id", "partitionColumn": "id"},
+        )
+
+
+def test_extract_sql_rows_columnar_batches_share_one_header(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 25)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+
+    source = SourceConfig(
+        type="postgres",
+        secretRef="hr-db-credentials",
+        query="SELECT employee_id, full_name, updated_at FROM employees ORDER BY employee_id",
+        watermarkField="updated_at",
+        sql={"streamResults": True, "fetchSize": 10, "columnar": True},
+    )
+
+    result = extractors.extract_sql_rows(source, None)
+    rows = list(result.rows.project(["employee_id", "full_name"]))
+
+    assert len(rows) == 25
+    assert rows[0] == {"employee_id": 0, "full_name": "User 0"}
+    assert result.watermark == "2026-02-19T00:00:00+00:00"
+
+
+def test_extract_sql_rows_columnar_keyset_pages_commit_last_key(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    _seed_employees(db_path, 12)
+    monkeypatch.setattr(
+        extractors,
+        "resolve_secret",
+        lambda _: f"sqlite+pysqlite:///{db_path}",
+    )
+    store = _resume_store(tmp_path)
+
+    result = extractors.extract_sql_rows(
+        _keyset_source(pageSize=5, columnar=True), None, resume_store=store
+    )
+    chunks = list(result.rows.iter_chunks())
+
+    assert all(isinstance(chunk, ColumnBatch) for chunk in chunks)
+    assert [len(chunk) for chunk in chunks] == [5, 5, 2]
+    assert store.load().last_key == 11
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from ingest_relay.utils.http_clients import AsyncHttpClientPool, http2_available
+
+
+def test_pool_shares_one_client_per_origin() -> None:
+    pool = AsyncHttpClientPool(http2=False)
+    try:
+        first = pool.client_for("https://kb.example.local/api/v1/articles")
+        second = pool.client_for("https://kb.example.local/api/v1/spaces?page=2")
+        other_host = pool.client_for("https://crm.example.local/api/v1/accounts")
+        other_port = pool.client_for("https://kb.example.local:8443/api/v1/articles")
+
+        assert first is second
+        assert first is not other_host
+        assert first is not other_port
+        assert len(pool) == 3
+    finally:
+        pool.close()
+
+    assert len(pool) == 0
+
+
+def test_pool_runs_coroutines_on_one_background_loop() -> None:
+    pool = AsyncHttpClientPool(http2=False)
+
+    async def _loop_identity() -> tuple[int, str]:
+        return id(asyncio.get_running_loop()), threading.current_thread().name
+
+    try:
+        first_loop, thread_name = pool.run(_loop_identity())
+        second_loop, _ = pool.run(_loop_identity())
+    finally:
+        pool.close()
+
+    assert first_loop == second_loop
+    assert thread_name == "async-http-pool"
+
+
+def test_pool_enables_http2_only_when_h2_is_installed() -> None:
+    pool = AsyncHttpClientPool(http2=True)
+    try:
+        assert pool.http2 is http2_available()
+    finally:
+        pool.close()
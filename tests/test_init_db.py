@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, inspect, text
+
+from ingest_relay.init_db import upgrade_schema
+from ingest_relay.models import Base
+
+
+def test_upgrade_schema_adds_source_fingerprint_to_existing_record_state(tmp_path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'state.db'}", future=True)
+    try:
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "CREATE TABLE record_state (id INTEGER PRIMARY KEY, connector_id VARCHAR, "
+                    "doc_id VARCHAR, checksum VARCHAR, source_updated_at DATETIME, "
+                    "last_seen_run_id VARCHAR)"
+                )
+            )
+        Base.metadata.create_all(bind=engine)
+
+        upgrade_schema(engine)
+        upgrade_schema(engine)
+
+        columns = {column["name"] for column in inspect(engine).get_columns("record_state")}
+        assert "source_fingerprint" in columns
+    finally:
+        engine.dispose()
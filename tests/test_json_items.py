@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ingest_relay.adapters.json_items import JsonItemsParser
+
+
+def _parse(body: str, chunk_size: int) -> tuple[list, JsonItemsParser]:
+    parser = JsonItemsParser()
+    encoded = body.encode("utf-8")
+    items: list = []
+    for start in range(0, len(encoded), chunk_size):
+        items.extend(parser.feed(encoded[start : start + chunk_size]))
+    items.extend(parser.close())
+    return items, parser
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_parser_emits_items_and_envelope_for_any_chunking(chunk_size, indent) -> None:
+    payload = {
+        "paging": {"next_cursor": "cursor-2"},
+        "items": [
+            {"id": idx, "title": "Überblick ]}", "tags": [1, 2.5, -3e2, None, True]}
+            for idx in range(12)
+        ],
+        "total": 12345678901234567890,
+    }
+
+    items, parser = _parse(json.dumps(payload, indent=indent), chunk_size)
+
+    assert items == payload["items"]
+    assert parser.item_count == 12
+    assert parser.envelope == {"paging": {"next_cursor": "cursor-2"}, "total": 12345678901234567890}
+
+
+def test_parser_accepts_top_level_arrays_and_pages_without_items() -> None:
+    items, parser = _parse('[1, 22, "x", {"a": "]"}]', 2)
+    assert items == [1, 22, "x", {"a": "]"}]
+    assert parser.envelope is None
+
+    items, parser = _parse('{"paging": {"next_cursor": null}}', 5)
+    assert items == []
+    assert parser.envelope == {"paging": {"next_cursor": None}}
+
+
+def test_parser_yields_items_before_the_body_is_complete() -> None:
+    parser = JsonItemsParser()
+
+    assert parser.feed(b'{"items": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b': 2}, {"id": 3') == [{"id": 2}]
+    assert parser.feed(b"}]}") == [{"id": 3}]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        ('{"items": {"id": 1}}', "must be a list"),
+        ('"text"', "Unsupported REST payload"),
+        ('{"items": [1, 2', "ended before"),
+        ("[1, 2] trailing", "trailing data"),
+        ("[1 2]", "not valid JSON"),
+    ],
+)
+def test_parser_rejects_malformed_pages(body, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        _parse(body, 3)
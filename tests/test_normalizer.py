@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import pytest
+
+from ingest_relay.adapters.extractors import MappedFileText
+from ingest_relay.adapters.lazy_text import LazyText
 from ingest_relay.schemas import MappingConfig
-from ingest_relay.services.normalizer import normalize_records
+from ingest_relay.services import normalizer
+from ingest_relay.services.normalizer import (
+    NormalizationError,
+    iter_normalized_records,
+    mapping_source_fields,
+    normalize_records,
+)
 
 
 def test_normalize_records_builds_canonical_docs() -> None:
@@ -39,4 +49,171 @@ def test_normalize_records_builds_canonical_docs() -> None:
     assert docs[0].uri == "https://hr.local/123"
     assert docs[0].acl_groups == ["eng-managers"]
     assert docs[0].metadata["department"] == "Engineering"
-    assert docs[0].checksum.startswith("sha256:")
+    assert docs[0].checksum.startswith("v2:sha256:")
+
+
+def test_mapping_source_fields_lists_template_and_mapped_columns() -> None:
+    mapping = MappingConfig(
+        idField="employee_id",
+        titleField="full_name",
+        contentTemplate="{% for tag in tags %}{{ tag }}{% endfor %} {{ role | upper }}",
+        uriTemplate="https://hr.local/{{ employee_id }}",
+        aclGroupsField="allowed_groups",
+        metadataFields=["department"],
+    )
+
+    assert mapping_source_fields(mapping, "updated_at") == {
+        "employee_id",
+        "full_name",
+        "tags",
+        "role",
+        "allowed_groups",
+        "department",
+        "updated_at",
+    }
+
+
+class _RecordingText(LazyText):
+    __slots__ = ("text", "reads")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.reads = 0
+
+    def materialize(self) -> str:
+        self.reads += 1
+        return self.text
+
+
+def test_lazy_text_subclasses_must_implement_materialize() -> None:
+    class _Incomplete(LazyText):
+        __slots__ = ()
+
+    with pytest.raises(TypeError, match="materialize"):
+        _Incomplete()
+
+
+def test_normalize_records_only_materializes_lazy_fields_the_mapping_reads() -> None:
+    mapping = MappingConfig(
+        idField="file_name",
+        titleField="file_name",
+        contentTemplate="{{ file_content_raw }}",
+        metadataFields=["file_content_raw"],
+    )
+    rows = [
+        {
+            "file_name": f"{name}.csv",
+            "file_content_raw": _RecordingText(f"{name} body"),
+            "file_rows_json": _RecordingText("[]"),
+        }
+        for name in ("a", "b")
+    ]
+
+    docs = normalize_records(
+        connector_id="files", mapping=mapping, source_watermark_field=None, rows=rows
+    )
+
+    assert [doc.content for doc in docs] == ["a body", "b body"]
+    assert docs[0].metadata["file_content_raw"] == "a body"
+    # Read once per row, not once per use; unused fields are never read.
+    assert [row["file_content_raw"].reads for row in rows] == [1, 1]
+    assert [row["file_rows_json"].reads for row in rows] == [0, 0]
+
+
+def _parallel_mapping(workers: int) -> MappingConfig:
+    return MappingConfig(
+        idField="id",
+        titleField="title",
+        contentTemplate="{{ title }} {{ body }}",
+        uriTemplate="https://docs.local/{{ id }}",
+        metadataFields=["body"],
+        normalizeWorkers=workers,
+    )
+
+
+def test_normalize_records_parallel_matches_serial_order(monkeypatch) -> None:
+    monkeypatch.setattr(normalizer, "_NORMALIZE_CHUNK_ROWS", 7)
+    rows = [
+        {"id": index, "title": f"Doc {index}", "body": f"body {index}", "updated_at": None}
+        for index in range(50)
+    ]
+
+    serial = normalize_records("docs", _parallel_mapping(1), None, iter(rows))
+    parallel = normalize_records("docs", _parallel_mapping(3), None, iter(rows))
+
+    assert [doc.doc_id for doc in parallel] == [f"docs:{index}" for index in range(50)]
+    assert [doc.model_dump(exclude={"updated_at"}) for doc in parallel] == [
+        doc.model_dump(exclude={"updated_at"}) for doc in serial
+    ]
+
+
+def test_normalize_records_parallel_reads_lazy_text_in_workers(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(normalizer, "_NORMALIZE_CHUNK_ROWS", 2)
+    rows = []
+    for index in range(5):
+        path = tmp_path / f"{index}.csv"
+        path.write_text(f"body {index}")
+        rows.append({"id": index, "title": f"Doc {index}", "body": MappedFileText(path, "utf-8")})
+
+    chunks = list(normalizer._row_chunks(rows))
+    serial = normalize_records("docs", _parallel_mapping(1), None, rows)
+    parallel = normalize_records("docs", _parallel_mapping(2), None, rows)
+
+    assert all(isinstance(row["body"], MappedFileText) for chunk in chunks for row in chunk)
+    assert [doc.content for doc in parallel] == [f"Doc {index} body {index}" for index in range(5)]
+    assert [doc.checksum for doc in parallel] == [doc.checksum for doc in serial]
+
+
+def test_normalize_records_parallel_raises_first_failing_row(monkeypatch) -> None:
+    monkeypatch.setattr(normalizer, "_NORMALIZE_CHUNK_ROWS", 5)
+    rows = [{"id": index, "title": f"Doc {index}", "body": "ok"} for index in range(30)]
+    rows[12] = {"title": "no id", "body": "ok"}
+    rows[24] = {"id": 24, "body": "no title"}
+
+    with pytest.raises(NormalizationError, match="Missing id field 'id'"):
+        normalize_records("docs", _parallel_mapping(2), None, rows)
+
+
+def test_normalize_records_parallel_keeps_small_runs_in_process(monkeypatch) -> None:
+    def fail_pool(workers):
+        raise AssertionError("single-chunk runs should not use the pool")
+
+    monkeypatch.setattr(normalizer, "get_process_pool", fail_pool)
+
+    docs = normalize_records(
+        "docs", _parallel_mapping(4), None, [{"id": 1, "title": "One", "body": "b"}]
+    )
+
+    assert [doc.content for doc in docs] == ["One b"]
+
+
+def test_iter_normalized_records_pulls_rows_as_documents_are_consumed() -> None:
+    pulled: list[int] = []
+
+    def rows():
+        for index in range(3):
+            pulled.append(index)
+            yield {"id": index, "title": f"Doc {index}", "body": "b"}
+
+    docs = iter_normalized_records("docs", _parallel_mapping(1), None, rows())
+
+    assert next(docs).doc_id == "docs:0"
+    assert pulled == [0]
+    assert [doc.doc_id for doc in docs] == ["docs:1", "docs:2"]
+
+
+def test_row_fingerprinter_tracks_mapping_but_not_worker_count() -> None:
+    row = {"id": 7, "title": "Doc", "body": "b", "unread": "x"}
+
+    serial = normalizer.RowFingerprinter("docs", _parallel_mapping(1), None)
+    parallel = normalizer.RowFingerprinter("docs", _parallel_mapping(4), None)
+    remapped = normalizer.RowFingerprinter(
+        "docs", _parallel_mapping(1).model_copy(update={"mime_type": "text/markdown"}), None
+    )
+
+    doc_id, fingerprint = serial.key(row)
+    assert doc_id == "docs:7"
+    assert parallel.key(row)[1] == fingerprint
+    assert remapped.key(row)[1] != fingerprint
+    assert serial.key({**row, "unread": "y"})[1] == fingerprint
+    assert serial.key({"title": "no id"})[0] is None
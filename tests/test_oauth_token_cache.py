@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from ingest_relay.adapters.oauth_tokens import CachedToken, OAuthTokenCache, oauth_token_cache_key
+from ingest_relay.models import OAuthTokenCacheEntry
+from ingest_relay.schemas import OAuthConfig
+from ingest_relay.services.oauth_token_store import SqlOAuthTokenStore
+
+
+def _oauth(**overrides) -> OAuthConfig:
+    payload = {
+        "tokenUrl": "https://auth.local/token",
+        "clientId": "bridge-client",
+        "scopes": ["api.read", "api.write"],
+        "audience": "knowledge-api",
+    }
+    payload.update(overrides)
+    return OAuthConfig.model_validate(payload)
+
+
+def _token(value: str, lifetime: float = 3600) -> CachedToken:
+    return CachedToken(access_token=value, token_type="Bearer", expires_at=time.time() + lifetime)
+
+
+def test_cache_key_ignores_scope_order_but_not_audience() -> None:
+    base = oauth_token_cache_key(_oauth())
+
+    assert oauth_token_cache_key(_oauth(scopes=["api.write", " api.read"])) == base
+    assert oauth_token_cache_key(_oauth(audience="other-api")) != base
+    assert oauth_token_cache_key(_oauth(clientId="other-client")) != base
+
+
+def test_cache_refreshes_ahead_of_expiry() -> None:
+    cache = OAuthTokenCache(refresh_window_seconds=60)
+    issued = iter([_token("short", lifetime=30), _token("long")])
+
+    assert cache.get("key", lambda: next(issued)).access_token == "short"
+    # Within the refresh window, so the next caller gets a new token.
+    assert cache.get("key", lambda: next(issued)).access_token == "long"
+    assert cache.get("key", lambda: _token("unused")).access_token == "long"
+
+
+def test_concurrent_callers_share_one_refresh() -> None:
+    cache = OAuthTokenCache()
+    fetches: list[int] = []
+    barrier = threading.Barrier(8)
+    results: list[str] = []
+
+    def fetch() -> CachedToken:
+        fetches.append(1)
+        time.sleep(0.05)
+        return _token("shared")
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(cache.get("key", fetch).access_token)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1
+    assert results == ["shared"] * 8
+
+
+def test_stale_token_is_only_refreshed_once() -> None:
+    cache = OAuthTokenCache()
+    rejected = cache.get("key", lambda: _token("first"))
+
+    replacement = cache.get("key", lambda: _token("second"), stale=rejected)
+    # A second caller that saw the same 401 reuses the replacement.
+    again = cache.get("key", lambda: _token("third"), stale=rejected)
+
+    assert replacement.access_token == "second"
+    assert again is replacement
+
+
+def test_async_callers_share_one_refresh() -> None:
+    cache = OAuthTokenCache()
+    fetches: list[int] = []
+
+    async def fetch() -> CachedToken:
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        return _token("shared")
+
+    async def main() -> list[CachedToken]:
+        return await asyncio.gather(*(cache.get_async("key", fetch) for _ in range(5)))
+
+    tokens = asyncio.run(main())
+
+    assert len(fetches) == 1
+    assert {token.access_token for token in tokens} == {"shared"}
+
+
+class _BrokenStore:
+    def load(self, cache_key: str) -> CachedToken | None:
+        return None
+
+    def save(self, cache_key: str, token: CachedToken) -> None:
+        raise RuntimeError("database is unavailable")
+
+
+def test_store_failures_do_not_drop_fetched_tokens(caplog) -> None:
+    cache = OAuthTokenCache(_BrokenStore())
+    fetches: list[int] = []
+
+    def fetch() -> CachedToken:
+        fetches.append(1)
+        return _token("fresh")
+
+    async def fetch_async() -> CachedToken:
+        return _token("async")
+
+    assert cache.get("key", fetch).access_token == "fresh"
+    assert cache.get("key", fetch).access_token == "fresh"
+    assert asyncio.run(cache.get_async("other", fetch_async)).access_token == "async"
+    assert len(fetches) == 1
+    assert [record.message for record in caplog.records] == ["oauth_token_persist_failed"] * 2
+
+
+def test_sql_store_shares_encrypted_tokens_between_caches(db_session_factory) -> None:
+    store = SqlOAuthTokenStore(db_session_factory, "test-key")
+    first_worker = OAuthTokenCache(store)
+    second_worker = OAuthTokenCache(store)
+
+    issued = first_worker.get("key", lambda: _token("persisted"))
+    reused = second_worker.get("key", lambda: _token("unexpected"))
+
+    assert reused.access_token == "persisted"
+    assert abs(reused.expires_at - issued.expires_at) < 1
+    with db_session_factory() as session:
+        row = session.get(OAuthTokenCacheEntry, "key")
+        assert row is not None
+        assert "persisted" not in row.encrypted_token
+
+
+def test_sql_store_ignores_expired_tokens(db_session_factory) -> None:
+    store = SqlOAuthTokenStore(db_session_factory, "test-key")
+    store.save("key", _token("expired", lifetime=-10))
+
+    token = OAuthTokenCache(store).get("key", lambda: _token("fresh"))
+
+    assert token.access_token == "fresh"
+    assert store.load("key").access_token == "fresh"
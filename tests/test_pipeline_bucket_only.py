@@ -91,16 +91,16 @@ def test_run_connector_bucket_only_skips_gemini_ingestion(monkeypatch, tmp_path)
         )
         monkeypatch.setattr(
             pipeline,
-            "normalize_records",
+            "iter_normalized_records",
             lambda *args, **kwargs: (_ for _ in ()).throw(
-                AssertionError("normalize_records must not run for csv export")
+                AssertionError("iter_normalized_records must not run for csv export")
             ),
         )
         monkeypatch.setattr(
             pipeline,
-            "compute_diffs",
+            "RecordStateDiff",
             lambda *args, **kwargs: (_ for _ in ()).throw(
-                AssertionError("compute_diffs must not run for csv export")
+                AssertionError("RecordStateDiff must not run for csv export")
             ),
         )
         monkeypatch.setattr(
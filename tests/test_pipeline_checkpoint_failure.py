@@ -7,7 +7,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import close_all_sessions, sessionmaker
 
 from ingest_relay.adapters.extractors import PullResult
-from ingest_relay.models import Base, ConnectorCheckpoint
+from ingest_relay.models import Base, ConnectorCheckpoint, RecordState
 from ingest_relay.schemas import CanonicalDocument, ConnectorConfig, RunManifest
 from ingest_relay.services import pipeline
 
@@ -121,8 +121,8 @@ def test_checkpoint_not_advanced_when_ingestion_fails(monkeypatch, tmp_path) ->
                 watermark="2026-02-16T00:00:00+00:00",
             ),
         )
-        monkeypatch.setattr(pipeline, "normalize_records", lambda *args, **kwargs: [doc])
-        monkeypatch.setattr(pipeline, "publish_artifacts", lambda **kwargs: manifest)
+        monkeypatch.setattr(pipeline, "iter_normalized_records", lambda *args, **kwargs: [doc])
+        monkeypatch.setattr(pipeline, "publish_ndjson_artifacts", lambda **kwargs: manifest)
         monkeypatch.setattr(pipeline, "GeminiIngestionClient", FailingGeminiIngestionClient)
 
         with pytest.raises(RuntimeError):
@@ -132,6 +132,8 @@ def test_checkpoint_not_advanced_when_ingestion_fails(monkeypatch, tmp_path) ->
             checkpoint = session.get(ConnectorCheckpoint, "hr-employees")
             assert checkpoint is not None
             assert checkpoint.watermark == "2026-02-01T00:00:00+00:00"
+            # Record state staged while streaming rolls back with the run.
+            assert session.query(RecordState).count() == 0
     finally:
         close_all_sessions()
         engine.dispose()
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
 
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import close_all_sessions, sessionmaker
 
-from ingest_relay.adapters.extractors import PullResult
-from ingest_relay.models import Base, ConnectorCheckpoint, RunState
-from ingest_relay.schemas import CanonicalDocument, ConnectorConfig, RunManifest
+from ingest_relay.adapters import extractors
+from ingest_relay.adapters.extractors import FileManifestEntry, PullResult
+from ingest_relay.models import Base, ConnectorCheckpoint, ConnectorFileManifest, RunState
+from ingest_relay.schemas import (
+    CanonicalDocument,
+    ConnectorConfig,
+    ObjectStoreConfig,
+    RunManifest,
+)
 from ingest_relay.services import pipeline
+from ingest_relay.services.file_manifest import FileManifestStore, file_manifest_fingerprint
 
 
 class NoopGeminiIngestionClient:
@@ -82,6 +90,10 @@ def _build_doc(doc_id: str) -> CanonicalDocument:
     )
 
 
+def _ndjson_doc_ids(path) -> list[str]:
+    return [json.loads(line)["doc_id"] for line in path.read_text().splitlines()]
+
+
 def _manifest(run_id: str, watermark: str | None) -> RunManifest:
     return RunManifest(
         run_id=run_id,
@@ -130,17 +142,12 @@ def test_run_connector_file_pull_persists_compact_checkpoint(monkeypatch, tmp_pa
         )
         monkeypatch.setattr(
             pipeline,
-            "normalize_records",
+            "iter_normalized_records",
             lambda *args, **kwargs: [_build_doc("x:1")],
         )
         monkeypatch.setattr(
             pipeline,
-            "compute_diffs",
-            lambda session, connector_id, docs, delete_policy: (docs, []),
-        )
-        monkeypatch.setattr(
-            pipeline,
-            "publish_artifacts",
+            "publish_ndjson_artifacts",
             lambda **kwargs: _manifest(kwargs["run_id"], kwargs.get("watermark")),
         )
         monkeypatch.setattr(pipeline, "GeminiIngestionClient", NoopGeminiIngestionClient)
@@ -182,7 +189,7 @@ def test_run_connector_file_pull_rejects_duplicate_doc_ids(monkeypatch, tmp_path
         duplicate_b = _build_doc("hr-file-csv:1")
         monkeypatch.setattr(
             pipeline,
-            "normalize_records",
+            "iter_normalized_records",
             lambda *args, **kwargs: [duplicate_a, duplicate_b],
         )
         monkeypatch.setattr(pipeline, "GeminiIngestionClient", NoopGeminiIngestionClient)
@@ -195,3 +202,105 @@ def test_run_connector_file_pull_rejects_duplicate_doc_ids(monkeypatch, tmp_path
     finally:
         close_all_sessions()
         engine.dispose()
+
+
+def test_run_connector_file_pull_skips_unchanged_files(monkeypatch, tmp_path) -> None:
+    db_path = tmp_path / "pipeline.db"
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+    session_local = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=engine)
+    source_dir = tmp_path / "hr"
+    source_dir.mkdir()
+    header = "employee_id,full_name,updated_at\n"
+    (source_dir / "a.csv").write_text(header + "1,Ada,2026-02-16T08:00:00+00:00\n")
+    (source_dir / "b.csv").write_text(header + "2,Bob,2026-02-16T09:00:00+00:00\n")
+
+    config = _file_connector_config()
+    config.spec.source.path = str(source_dir)
+    config.spec.source.skip_unchanged_files = True
+    published: list[tuple[list[str], list[str]]] = []
+
+    def fake_publish(**kwargs):
+        artifacts = kwargs["artifacts"]
+        published.append(
+            (
+                _ndjson_doc_ids(artifacts.upserts_path),
+                _ndjson_doc_ids(artifacts.deletes_path),
+            )
+        )
+        return _manifest(kwargs["run_id"], kwargs.get("watermark"))
+
+    parsed_files: list[str] = []
+    real_parse = extractors._csv_rows_from_content
+
+    def counting_parse(**kwargs):
+        parsed_files.append(kwargs["content"].splitlines()[1])
+        return real_parse(**kwargs)
+
+    try:
+        monkeypatch.setattr(pipeline, "SessionLocal", session_local)
+        monkeypatch.setattr(pipeline, "load_connector_config", lambda _: config)
+        monkeypatch.setattr(pipeline, "publish_ndjson_artifacts", fake_publish)
+        monkeypatch.setattr(pipeline, "GeminiIngestionClient", NoopGeminiIngestionClient)
+        monkeypatch.setattr(extractors, "_csv_rows_from_content", counting_parse)
+
+        pipeline.run_connector("connectors/hr-file-csv.yaml")
+        pipeline.run_connector("connectors/hr-file-csv.yaml")
+        (source_dir / "b.csv").write_text(header + "2,Bobby,2026-02-16T11:00:00+00:00\n")
+        (source_dir / "a.csv").unlink()
+        pipeline.run_connector("connectors/hr-file-csv.yaml")
+
+        assert published == [
+            (["hr-file-csv:1", "hr-file-csv:2"], []),
+            ([], []),
+            (["hr-file-csv:2"], ["hr-file-csv:1"]),
+        ]
+        assert len(parsed_files) == 3
+        with session_local() as session:
+            manifest_rows = session.query(ConnectorFileManifest).all()
+            assert [row.path for row in manifest_rows] == [str(source_dir / "b.csv")]
+            assert json.loads(manifest_rows[0].doc_ids_json) == ["hr-file-csv:2"]
+    finally:
+        close_all_sessions()
+        engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"format": "ndjson"},
+        {"include_patterns": ["a*.csv"]},
+        {"exclude_patterns": ["tmp/**"]},
+        {"object_store": ObjectStoreConfig(endpointUrl="https://s3.example.com")},
+    ],
+)
+def test_file_manifest_ignores_entries_after_source_changes(db_session_factory, update) -> None:
+    config = _file_connector_config()
+    source, mapping = config.spec.source, config.spec.mapping
+    entry = FileManifestEntry(
+        path="/tmp/hr/a.csv",
+        mtime="2026-02-16T10:00:00+00:00",
+        size_bytes=12,
+        content_hash="sha256:a",
+        doc_ids=["hr-file-csv:1"],
+    )
+    session = db_session_factory()
+    try:
+        FileManifestStore(session, "hr-file-csv", file_manifest_fingerprint(source, mapping)).save(
+            [entry], "run-1"
+        )
+        session.commit()
+
+        unchanged = FileManifestStore(
+            session, "hr-file-csv", file_manifest_fingerprint(source, mapping)
+        )
+        changed = FileManifestStore(
+            session,
+            "hr-file-csv",
+            file_manifest_fingerprint(source.model_copy(update=update), mapping),
+        )
+
+        assert list(unchanged.load()) == ["/tmp/hr/a.csv"]
+        assert changed.load() == {}
+    finally:
+        session.close()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import close_all_sessions, sessionmaker
+
+from ingest_relay.adapters import extractors
+from ingest_relay.models import (
+    Base,
+    ConnectorCheckpoint,
+    ConnectorResumePoint,
+    RecordState,
+)
+from ingest_relay.schemas import ConnectorConfig, SqlConfig
+from ingest_relay.services import pipeline
+from ingest_relay.services.sql_resume import SqlKeysetResumeStore
+
+
+def _streaming_connector_config(bucket: str) -> ConnectorConfig:
+    return ConnectorConfig.model_validate(
+        {
+            "apiVersion": "sync.gemini.io/v1alpha1",
+            "kind": "Connector",
+            "metadata": {"name": "hr-employees"},
+            "spec": {
+                "mode": "sql_pull",
+                "schedule": "0 */3 * * *",
+                "source": {
+                    "type": "postgres",
+                    "secretRef": "hr-db-credentials",
+                    "query": "SELECT employee_id, full_name, updated_at FROM employees",
+                    "watermarkField": "updated_at",
+                    "sql": {"streamResults": True, "fetchSize": 2},
+                },
+                "mapping": {
+                    "idField": "employee_id",
+                    "titleField": "full_name",
+                    "contentTemplate": "{{ full_name }}",
+                },
+                "output": {
+                    "bucket": bucket,
+                    "prefix": "hr-employees",
+                    "format": "ndjson",
+                },
+                "ingestion": {"enabled": False},
+                "reconciliation": {"deletePolicy": "auto_delete_missing"},
+            },
+        }
+    )
+
+
+def test_run_connector_streams_sql_rows_and_checkpoints_final_watermark(
+    monkeypatch, tmp_path
+) -> None:
+    source_db = tmp_path / "hr.db"
+    conn = sqlite3.connect(source_db)
+    try:
+        conn.execute(
+            "CREATE TABLE employees (employee_id INTEGER, full_name TEXT, updated_at TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO employees VALUES (?, ?, ?)",
+            [
+                (1, "Ada", "2026-02-14T00:00:00+00:00"),
+                (2, "Bob", "2026-02-16T00:00:00+00:00"),
+                (3, "Cam", "2026-02-15T00:00:00+00:00"),
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    state_engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'state.db'}", future=True)
+    session_local = sessionmaker(bind=state_engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=state_engine)
+
+    try:
+        monkeypatch.setattr(pipeline, "SessionLocal", session_local)
+        monkeypatch.setattr(
+            pipeline,
+            "load_connector_config",
+            lambda _: _streaming_connector_config(f"file://{tmp_path / 'bucket'}"),
+        )
+        monkeypatch.setattr(
+            extractors,
+            "resolve_secret",
+            lambda _: f"sqlite+pysqlite:///{source_db}",
+        )
+
+        result = pipeline.run_connector("connectors/hr-employees.yaml")
+
+        assert result.upserts == 3
+        with session_local() as session:
+            checkpoint = session.get(ConnectorCheckpoint, "hr-employees")
+            assert checkpoint is not None
+            assert checkpoint.watermark == "2026-02-16T00:00:00+00:00"
+            assert session.query(RecordState).count() == 3
+    finally:
+        close_all_sessions()
+        state_engine.dispose()
+
+
+def test_run_connector_keyset_resume_point_survives_failure_and_clears_on_success(
+    monkeypatch, tmp_path
+) -> None:
+    source_db = tmp_path / "hr.db"
+    conn = sqlite3.connect(source_db)
+    try:
+        conn.execute(
+            "CREATE TABLE employees (employee_id INTEGER, full_name TEXT, updated_at TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO employees VALUES (?, ?, ?)",
+            [(idx, f"User {idx}", "2026-02-16T00:00:00+00:00") for idx in range(5)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    config = _streaming_connector_config(f"file://{tmp_path / 'bucket'}")
+    config.spec.source.sql = SqlConfig(keysetColumn="employee_id", pageSize=2)
+
+    state_engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'state.db'}", future=True)
+    session_local = sessionmaker(bind=state_engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=state_engine)
+
+    class _CrashingResumeStore(SqlKeysetResumeStore):
+        def commit_page(self, page_index, last_key) -> None:
+            if page_index == 2:
+                raise RuntimeError("worker killed")
+            super().commit_page(page_index, last_key)
+
+    def _checkpoint() -> str | None:
+        with session_local() as session:
+            return session.get(ConnectorCheckpoint, "hr-employees").watermark
+
+    try:
+        monkeypatch.setattr(pipeline, "SessionLocal", session_local)
+        monkeypatch.setattr(pipeline, "load_connector_config", lambda _: config)
+        monkeypatch.setattr(
+            extractors,
+            "resolve_secret",
+            lambda _: f"sqlite+pysqlite:///{source_db}",
+        )
+        assert pipeline.run_connector("connectors/hr-employees.yaml").upserts == 5
+
+        conn = sqlite3.connect(source_db)
+        try:
+            conn.execute(
+                "UPDATE employees SET full_name = full_name || ' (moved)', "
+                "updated_at = '2026-02-17T00:00:00+00:00' WHERE employee_id IN (0, 4)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        monkeypatch.setattr(pipeline, "SqlKeysetResumeStore", _CrashingResumeStore)
+        with pytest.raises(RuntimeError, match="worker killed"):
+            pipeline.run_connector("connectors/hr-employees.yaml")
+
+        with session_local() as session:
+            point = session.get(ConnectorResumePoint, "hr-employees")
+            assert point is not None
+            assert point.pages_committed == 2
+            assert point.keyset_value == "3"
+
+        monkeypatch.setattr(pipeline, "SqlKeysetResumeStore", SqlKeysetResumeStore)
+        resumed = pipeline.run_connector("connectors/hr-employees.yaml")
+
+        # Only rows after the resume key were read; nothing is deleted for the
+        # rows before it and the checkpoint stays put so the next run covers them.
+        assert (resumed.upserts, resumed.deletes) == (1, 0)
+        assert _checkpoint() == "2026-02-16T00:00:00+00:00"
+        with session_local() as session:
+            assert session.get(ConnectorResumePoint, "hr-employees") is None
+            assert session.query(RecordState).count() == 5
+
+        caught_up = pipeline.run_connector("connectors/hr-employees.yaml")
+
+        assert (caught_up.upserts, caught_up.deletes) == (1, 0)
+        assert _checkpoint() == "2026-02-17T00:00:00+00:00"
+    finally:
+        close_all_sessions()
+        state_engine.dispose()
@@ -6,7 +6,8 @@ import io
 import json
 from datetime import UTC, datetime
 
-from ingest_relay.adapters.object_store import ObjectLocation
+from ingest_relay.adapters.object_store import ObjectLocation, ObjectStore
+from ingest_relay.adapters.row_batches import ColumnBatch
 from ingest_relay.schemas import CanonicalDocument, OutputConfig
 from ingest_relay.services import publisher
 from ingest_relay.services.publisher import _canonical_ndjson, _discovery_document_ndjson
@@ -63,7 +64,7 @@ def test_canonical_ndjson_keeps_internal_shape() -> None:
 def test_publish_artifacts_writes_latest_alias_and_state_pointer(monkeypatch) -> None:
     uploads: list[tuple[str, str, str]] = []
 
-    class FakeStore:
+    class FakeStore(ObjectStore):
         def upload_text(
             self,
             uri: str,
@@ -133,7 +134,7 @@ def test_publish_artifacts_writes_latest_alias_and_state_pointer(monkeypatch) ->
 def test_publish_artifacts_skips_latest_alias_when_disabled(monkeypatch) -> None:
     uploads: list[tuple[str, str, str]] = []
 
-    class FakeStore:
+    class FakeStore(ObjectStore):
         def upload_text(
             self,
             uri: str,
@@ -169,7 +170,7 @@ def test_publish_artifacts_skips_latest_alias_when_disabled(monkeypatch) -> None
 def test_publish_csv_artifacts_writes_all_fields_and_latest_alias(monkeypatch) -> None:
     uploads: list[tuple[str, str, str]] = []
 
-    class FakeStore:
+    class FakeStore(ObjectStore):
         def upload_text(
             self,
             uri: str,
@@ -244,7 +245,7 @@ def test_publish_csv_artifacts_writes_all_fields_and_latest_alias(monkeypatch) -
 def test_publish_csv_artifacts_skips_latest_alias_when_disabled(monkeypatch) -> None:
     uploads: list[tuple[str, str, str]] = []
 
-    class FakeStore:
+    class FakeStore(ObjectStore):
         def upload_text(
             self,
             uri: str,
@@ -274,3 +275,62 @@ def test_publish_csv_artifacts_skips_latest_alias_when_disabled(monkeypatch) ->
 
     uploaded_uris = [uri for uri, _, _ in uploads]
     assert not any("/latest/" in uri for uri in uploaded_uris)
+
+
+def test_publish_csv_artifacts_writes_column_batches(monkeypatch) -> None:
+    uploads: dict[str, str] = {}
+
+    class FakeStore(ObjectStore):
+        def upload_text(
+            self,
+            uri: str,
+            data: str,
+            content_type: str = "application/json",
+        ) -> ObjectLocation:
+            uploads[uri] = data
+            return ObjectLocation(uri=uri)
+
+    monkeypatch.setattr(publisher, "_build_store", lambda bucket: FakeStore())
+
+    output = OutputConfig.model_validate(
+        {"bucket": "gs://company-ingest-relay", "prefix": "qn", "format": "csv"}
+    )
+    batches = [
+        ColumnBatch(["notiz_id", "autor"], [[1, 2], ["Ada", None]]),
+        ColumnBatch(["notiz_id", "business_unit"], [[3], [{"code": "BU-A"}]]),
+    ]
+
+    manifest = publisher.publish_csv_artifacts(
+        connector_id="qn",
+        output=output,
+        run_id="run-123",
+        rows=batches,
+        watermark=None,
+        started_at=datetime.now(tz=UTC),
+    )
+
+    csv_payload = uploads["gs://company-ingest-relay/connectors/qn/runs/run-123/rows.csv"]
+    reader = csv.DictReader(io.StringIO(csv_payload))
+    parsed_rows = list(reader)
+    assert reader.fieldnames == ["notiz_id", "autor", "business_unit"]
+    assert [row["notiz_id"] for row in parsed_rows] == ["1", "2", "3"]
+    assert parsed_rows[1]["autor"] == ""
+    assert parsed_rows[2]["autor"] == ""
+    assert parsed_rows[2]["business_unit"] == '{"code": "BU-A"}'
+    assert manifest.upserts_count == 3
+
+
+def test_ndjson_artifacts_spool_matches_in_memory_writers() -> None:
+    docs = [_sample_doc(), _sample_doc(content="")]
+
+    with publisher.NdjsonArtifacts() as artifacts:
+        artifacts.add_upserts(doc for doc in docs)
+        artifacts.add_deletes([])
+
+        assert artifacts.upserts_path.read_text() == _canonical_ndjson(docs)
+        assert artifacts.import_upserts_path.read_text() == _discovery_document_ndjson(docs)
+        assert artifacts.deletes_path.read_text() == ""
+        assert (artifacts.upserts_count, artifacts.deletes_count) == (2, 0)
+        spool_dir = artifacts.upserts_path.parent
+
+    assert not spool_dir.exists()
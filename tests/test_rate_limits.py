@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from ingest_relay.adapters import rate_limits
+from ingest_relay.adapters.rate_limits import (
+    HostRateLimiter,
+    host_rate_limiter,
+    rate_limit_window,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, max_rate: float | None = None) -> HostRateLimiter:
+    return HostRateLimiter(
+        max_rate, clock=clock, wall_clock=lambda: 1_700_000_000.0, sleep=clock.sleep
+    )
+
+
+def _response(status_code: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(
+        status_code, headers=headers, request=httpx.Request("GET", "https://api.example.local")
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    rate_limits.reset_host_rate_limiters()
+    yield
+    rate_limits.reset_host_rate_limiters()
+
+
+def test_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert retry_after_seconds({"Retry-After": "7"}) == 7.0
+    assert retry_after_seconds({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert retry_after_seconds({"Retry-After": "soon"}) is None
+    assert retry_after_seconds({}) is None
+
+
+def test_rate_limit_window_accepts_delta_and_epoch_resets() -> None:
+    def wall_clock() -> float:
+        return 1_700_000_000.0
+
+    delta = {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "20"}
+    epoch = {"RateLimit-Remaining": "4", "RateLimit-Reset": "1700000008"}
+
+    assert rate_limit_window(delta, wall_clock) == (10, 20.0)
+    assert rate_limit_window(epoch, wall_clock) == (4, 8.0)
+    assert rate_limit_window({"X-RateLimit-Remaining": "1"}, wall_clock) is None
+
+
+def test_bucket_spaces_requests_at_configured_ceiling() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock, max_rate=2.0)
+
+    for _ in range(5):
+        limiter.acquire()
+
+    # Burst of two, then one request every half second.
+    assert clock.sleeps == pytest.approx([0.5, 0.5, 0.5])
+
+
+def test_unlimited_bucket_never_waits_without_server_hints() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    for _ in range(50):
+        limiter.acquire()
+        limiter.observe(_response(200))
+
+    assert clock.sleeps == []
+    assert limiter.rate is None
+
+
+def test_retry_after_pauses_the_host() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    limiter.observe(_response(429, {"Retry-After": "3"}))
+    limiter.acquire()
+
+    assert clock.sleeps == [3.0]
+
+
+def test_exhausted_quota_waits_until_reset() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    limiter.observe(
+        _response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000012"})
+    )
+    limiter.acquire()
+
+    assert clock.sleeps == [12.0]
+
+
+def test_remaining_quota_lowers_rate_below_ceiling() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock, max_rate=10.0)
+
+    limiter.observe(_response(200, {"X-RateLimit-Remaining": "30", "X-RateLimit-Reset": "60"}))
+
+    assert limiter.rate == pytest.approx(0.5)
+
+
+def test_429_halves_rate_and_successes_recover_to_ceiling() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock, max_rate=4.0)
+
+    limiter.observe(_response(429))
+    assert limiter.rate == pytest.approx(2.0)
+
+    for _ in range(20):
+        limiter.observe(_response(200))
+    assert limiter.rate == pytest.approx(4.0)
+
+
+def test_throttle_is_capped() -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    limiter.observe(_response(503, {"Retry-After": "86400"}))
+    limiter.acquire()
+
+    assert clock.sleeps == [rate_limits.MAX_THROTTLE_SECONDS]
+
+
+def test_async_acquire_waits_for_retry_after(monkeypatch) -> None:
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr(rate_limits.asyncio, "sleep", fake_sleep)
+    limiter.observe(_response(429, {"Retry-After": "2"}))
+
+    asyncio.run(limiter.acquire_async())
+
+    assert slept == [2.0]
+
+
+def test_connectors_on_one_host_keep_their_own_ceilings() -> None:
+    slow = host_rate_limiter("https://api.example.local/v1/items", 1.0)
+    fast = host_rate_limiter("https://api.example.local/v1/orders", 50.0)
+    unlimited = host_rate_limiter("https://api.example.local/v1/users")
+
+    assert (slow.rate, fast.rate, unlimited.rate) == (1.0, 50.0, None)
+    assert slow.reserve() == 0.0
+    assert slow.reserve() > 0.5
+    assert [fast.reserve() for _ in range(50)] == [0.0] * 50
+    assert unlimited.reserve() == 0.0
+    # A raised ceiling takes effect on the next run instead of keeping the old one.
+    assert host_rate_limiter("https://api.example.local/v1/items", 20.0).rate == 20.0
+
+
+def test_server_throttling_is_shared_by_connectors_on_one_host() -> None:
+    slow = host_rate_limiter("https://api.example.local/v1/items", 1.0)
+    fast = host_rate_limiter("https://api.example.local/v1/orders", 50.0)
+    other = host_rate_limiter("https://other.example.local/v1/items", 50.0)
+
+    slow.observe(_response(503, {"Retry-After": "30"}))
+    fast.observe(_response(200, {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "10"}))
+
+    assert fast.reserve() == pytest.approx(30.0, abs=1.0)
+    assert (slow.rate, fast.rate, other.rate) == (1.0, 2.0, 50.0)
+    assert other.reserve() == 0.0
@@ -119,8 +119,8 @@ def test_file_pull_requires_glob() -> None:
         )
 
 
-def test_file_pull_requires_csv_format() -> None:
-    with pytest.raises(ValueError, match="source.format must be csv for file_pull mode"):
+def test_file_pull_requires_source_format() -> None:
+    with pytest.raises(ValueError, match="source.format is required for file_pull mode"):
         _validate(
             "file_pull",
             {
@@ -146,6 +146,35 @@ def test_file_pull_requires_csv_block() -> None:
         )
 
 
+@pytest.mark.parametrize("source_format", ["parquet", "ndjson"])
+def test_file_pull_accepts_columnar_and_json_lines_formats_without_csv_block(
+    source_format: str,
+) -> None:
+    _validate(
+        "file_pull",
+        {
+            "type": "file",
+            "path": "./runtime/sources/hr",
+            "glob": f"*.{source_format}",
+            "format": source_format,
+        },
+    )
+
+
+def test_file_pull_s3_source_requires_secret_ref() -> None:
+    with pytest.raises(ValueError, match="source.secretRef is required for s3://"):
+        _validate(
+            "file_pull",
+            {
+                "type": "file",
+                "path": "s3://exports/hr",
+                "glob": "*.csv",
+                "format": "csv",
+                "csv": {"documentMode": "row"},
+            },
+        )
+
+
 def test_connector_config_allows_missing_gemini_when_ingestion_disabled() -> None:
     payload = {
         "apiVersion": "sync.gemini.io/v1alpha1",
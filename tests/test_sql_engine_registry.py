@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import sqlite3
+
+from ingest_relay.adapters import extractors
+from ingest_relay.adapters.sql_engines import SqlEngineRegistry
+from ingest_relay.schemas import SourceConfig
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_registry_reuses_engine_per_dsn(tmp_path) -> None:
+    registry = SqlEngineRegistry()
+    dsn_a = f"sqlite+pysqlite:///{tmp_path / 'a.db'}"
+    dsn_b = f"sqlite+pysqlite:///{tmp_path / 'b.db'}"
+
+    try:
+        engine_a = registry.get_engine(dsn_a)
+
+        assert registry.get_engine(dsn_a) is engine_a
+        assert registry.get_engine(dsn_b) is not engine_a
+        assert len(registry) == 2
+    finally:
+        registry.dispose_all()
+
+    assert len(registry) == 0
+
+
+def test_registry_applies_pool_settings(tmp_path) -> None:
+    registry = SqlEngineRegistry(pre_ping=True, recycle_seconds=120)
+
+    try:
+        engine = registry.get_engine(f"sqlite+pysqlite:///{tmp_path / 'a.db'}")
+
+        assert engine.pool._pre_ping is True
+        assert engine.pool._recycle == 120
+    finally:
+        registry.dispose_all()
+
+
+def test_registry_evicts_idle_engines(tmp_path) -> None:
+    clock = FakeClock()
+    registry = SqlEngineRegistry(idle_seconds=60, clock=clock)
+    dsn_a = f"sqlite+pysqlite:///{tmp_path / 'a.db'}"
+    dsn_b = f"sqlite+pysqlite:///{tmp_path / 'b.db'}"
+
+    try:
+        engine_a = registry.get_engine(dsn_a)
+        clock.now = 30.0
+        registry.get_engine(dsn_b)
+        clock.now = 75.0
+
+        assert registry.evict_idle() == 1
+        assert len(registry) == 1
+        assert registry.get_engine(dsn_a) is not engine_a
+    finally:
+        registry.dispose_all()
+
+
+def test_registry_keeps_engines_with_connections_in_use(tmp_path) -> None:
+    clock = FakeClock()
+    registry = SqlEngineRegistry(idle_seconds=60, clock=clock)
+    dsn_a = f"sqlite+pysqlite:///{tmp_path / 'a.db'}"
+    dsn_b = f"sqlite+pysqlite:///{tmp_path / 'b.db'}"
+
+    try:
+        engine_a = registry.get_engine(dsn_a)
+        with engine_a.connect() as conn:
+            # A long streamed read: another connector's lookup must not dispose engine A.
+            clock.now = 500.0
+            registry.get_engine(dsn_b)
+            assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+            assert registry.get_engine(dsn_a) is engine_a
+            clock.now = 1000.0
+
+        # Returning the connection counts as use, so the idle window restarts here.
+        clock.now = 1030.0
+        assert registry.evict_idle() == 1
+        assert registry.get_engine(dsn_a) is engine_a
+        clock.now = 1100.0
+        assert registry.evict_idle() == 1
+        assert len(registry) == 0
+    finally:
+        registry.dispose_all()
+
+
+def test_extract_sql_rows_reuses_registry_engine_across_runs(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "hr.db"
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TABLE employees (employee_id INTEGER)")
+        conn.execute("INSERT INTO employees VALUES (1)")
+        conn.commit()
+    finally:
+        conn.close()
+
+    registry = SqlEngineRegistry()
+    created: list[str] = []
+
+    def _get_engine(dsn: str):
+        created.append(dsn)
+        return registry.get_engine(dsn)
+
+    monkeypatch.setattr(extractors, "get_sql_engine", _get_engine)
+    monkeypatch.setattr(extractors, "resolve_secret", lambda _: f"sqlite+pysqlite:///{db_path}")
+    source = SourceConfig(
+        type="postgres",
+        secretRef="hr-db-credentials",
+        query="SELECT employee_id FROM employees",
+    )
+
+    try:
+        first = extractors.extract_sql_rows(source, None)
+        second = extractors.extract_sql_rows(source, None)
+
+        assert first.rows == second.rows == [{"employee_id": 1}]
+        assert len(created) == 2
+        assert len(registry) == 1
+    finally:
+        registry.dispose_all()
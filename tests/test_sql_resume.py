@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from ingest_relay.services.sql_resume import dumps_keyset_value, loads_keyset_value
+
+
+def test_keyset_values_round_trip_python_types() -> None:
+    values = [
+        7,
+        Decimal("12.50"),
+        datetime(2026, 2, 16, 8, 30, tzinfo=UTC),
+        date(2020, 1, 2),
+        b"\x00\x01",
+        "Ada",
+        1.5,
+        UUID("5f0c6b5e-3d1a-4c7e-9a55-1f2a3b4c5d6e"),
+        time(8, 30, 15, 250),
+        timedelta(days=-1, seconds=5, microseconds=7),
+    ]
+
+    for value in values:
+        restored = loads_keyset_value(dumps_keyset_value(value))
+        assert restored == value
+        assert type(restored) is type(value)
+
+
+def test_keyset_values_of_unknown_types_are_rejected() -> None:
+    with pytest.raises(TypeError, match="complex"):
+        dumps_keyset_value(1 + 2j)
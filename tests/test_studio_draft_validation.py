@@ -202,6 +202,17 @@ def test_validate_connector_draft_accepts_file_pull() -> None:
     assert response.errors == []
 
 
+def test_validate_connector_draft_accepts_parquet_file_pull_without_csv_block() -> None:
+    draft = _valid_file_pull_draft()
+    draft["spec"]["source"]["glob"] = "*.parquet"
+    draft["spec"]["source"]["format"] = "parquet"
+    draft["spec"]["source"].pop("csv")
+
+    response = validate_connector_draft(draft)
+    assert response.valid is True
+    assert response.errors == []
+
+
 def test_validate_connector_draft_rejects_file_pull_missing_path() -> None:
     draft = _valid_file_pull_draft()
     draft["spec"]["source"].pop("path")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from jinja2 import ChainableUndefined, StrictUndefined, UndefinedError
+
+from ingest_relay.schemas import MappingConfig
+from ingest_relay.services.normalizer import normalize_records
+from ingest_relay.services.templates import TemplateCache, get_template_cache
+
+
+def test_template_cache_reuses_compiled_template() -> None:
+    cache = TemplateCache(max_entries=4)
+
+    first = cache.get("{{ title }}")
+    second = cache.get("{{ title }}")
+
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.render(title="Doc") == "Doc"
+
+
+def test_template_cache_keys_on_undefined_policy() -> None:
+    cache = TemplateCache(max_entries=4)
+
+    strict = cache.get("{{ missing }}", undefined=StrictUndefined)
+    lenient = cache.get("{{ missing.field }}", undefined=ChainableUndefined)
+
+    assert strict is not cache.get("{{ missing }}", undefined=ChainableUndefined)
+    with pytest.raises(UndefinedError):
+        strict.render()
+    assert lenient.render() == ""
+
+
+def test_template_cache_evicts_least_recently_used() -> None:
+    cache = TemplateCache(max_entries=2)
+    first = cache.get("{{ a }}")
+    cache.get("{{ b }}")
+    cache.get("{{ a }}")
+    cache.get("{{ c }}")
+
+    assert cache.get("{{ a }}") is first
+    assert cache.misses == 3
+    cache.get("{{ b }}")
+    assert cache.misses == 4
+
+
+def test_template_cache_variables_lists_record_fields() -> None:
+    cache = TemplateCache()
+
+    assert cache.variables("{{ title }} {% for tag in tags %}{{ tag }}{% endfor %}") == {
+        "title",
+        "tags",
+    }
+
+
+def test_template_cache_loads_bytecode_written_by_another_process(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    source = "{{ title | upper }} ({{ id }})"
+    TemplateCache(bytecode_dir=tmp_path).get(source)
+    assert list(tmp_path.iterdir())
+
+    fresh = TemplateCache(bytecode_dir=tmp_path)
+    environment = fresh._environment(StrictUndefined)
+
+    def fail_compile(*args, **kwargs):
+        raise AssertionError("template should load from the bytecode cache")
+
+    monkeypatch.setattr(environment, "compile", fail_compile)
+
+    assert fresh.get(source).render(title="doc", id=7) == "DOC (7)"
+
+
+def test_normalize_records_compiles_mapping_templates_once() -> None:
+    cache = get_template_cache()
+    mapping = MappingConfig(
+        idField="id",
+        titleField="title",
+        contentTemplate="{{ title }} cached-{{ id }}",
+        uriTemplate="https://docs.local/cached/{{ id }}",
+    )
+    rows = [{"id": 1, "title": "One", "updated_at": "2026-02-16T08:30:00Z"}]
+
+    normalize_records("docs", mapping, "updated_at", rows)
+    misses = cache.misses
+    docs = normalize_records("docs", mapping, "updated_at", rows)
+
+    assert cache.misses == misses
+    assert docs[0].content == "One cached-1"
+    assert docs[0].uri == "https://docs.local/cached/1"